@@ -0,0 +1,65 @@
+"""Cold-start benchmark of the CLI based on ``python -X importtime``.
+
+Usage:
+    poetry run python -m benchmarks.bench_cli_startup --threshold-ms 150
+
+Runs the CLI several times, reports the wall time and the slowest imports of the fastest run and
+exits with status 1 when the total import time exceeds the threshold, so it can guard CI against
+startup regressions.
+"""
+import subprocess
+import sys
+import time
+
+import click
+
+
+def parse_importtime(stderr: str) -> list:
+    """Returns (module, self_us, cumulative_us) tuples from ``-X importtime`` output."""
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:") :].split("|")
+        imports.append((module.strip(), int(self_us), int(cumulative_us)))
+    return imports
+
+
+def total_import_us(imports: list) -> int:
+    """Returns the total import time, i.e. the sum of every module's own import time."""
+    return sum(self_us for _, self_us, _ in imports)
+
+
+@click.command()
+@click.option("--command", default="src/cli.py --help", help="CLI arguments to start with")
+@click.option("--runs", default=5, help="Number of cold starts; the fastest one is reported")
+@click.option("--threshold-ms", default=150.0, help="Maximum total import time before failing")
+def main(command: str, runs: int, threshold_ms: float) -> None:
+    """Measures CLI cold-start time and fails when imports regress past the threshold."""
+    best = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", *command.split()], capture_output=True, text=True, check=True
+        )
+        wall_seconds = time.perf_counter() - start
+        imports = parse_importtime(result.stderr)
+        if best is None or total_import_us(imports) < total_import_us(best[1]):
+            best = (wall_seconds, imports)
+
+    wall_seconds, imports = best
+    total_ms = total_import_us(imports) / 1000
+    click.echo(f"command:      python {command}")
+    click.echo(f"wall time:    {wall_seconds * 1000:.1f} ms")
+    click.echo(f"import time:  {total_ms:.1f} ms over {len(imports)} modules (threshold {threshold_ms:.0f} ms)")
+    click.echo("slowest imports (cumulative):")
+    for module, _, cumulative_us in sorted(imports, key=lambda item: item[2], reverse=True)[:10]:
+        click.echo(f"  {cumulative_us / 1000:8.1f} ms  {module}")
+
+    if total_ms > threshold_ms:
+        click.echo(f"FAIL: import time {total_ms:.1f} ms exceeds {threshold_ms:.0f} ms")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Benchmark histogram-based against exact gradient boosting on large synthetic files.
+
+Usage:
+    poetry run python -m benchmarks.bench_hist_gradient_boosting --rows 100000,1000000
+
+For every row count a synthetic Titanic-schema file is generated (see benchmarks.synthetic_data) and
+split 80/20. gradient_boosting is trained on the one-hot features, hist_gradient_boosting on the
+ordinal features with native categorical splits and early stopping. The table reports the
+preprocessing and training time and the accuracy on the held-out rows.
+"""
+import os
+import time
+
+import click
+
+from sklearn.model_selection import train_test_split
+
+from benchmarks.synthetic_data import ensure_csv
+from src.data_manager import DataManager
+from src.evaluation import Accuracy
+from src.models.model_factory import ModelFactory
+
+
+def run(filepath: str, model_name: str) -> dict:
+    """Preprocesses the file with the model's feature encoding, trains on 80% and scores the rest."""
+    start = time.perf_counter()
+    data_manager = DataManager(filepath, encoding=ModelFactory.feature_encoding(model_name))
+    data_manager.load_data()
+    data_manager.preprocess()
+    preprocess_seconds = time.perf_counter() - start
+    X_train, X_test, y_train, y_test = train_test_split(
+        data_manager.get_processed_data(), data_manager.get_target(), test_size=0.2, random_state=42
+    )
+
+    model = ModelFactory.create_model(model_name)
+    start = time.perf_counter()
+    model.train(X_train, y_train)
+    train_seconds = time.perf_counter() - start
+    return {
+        "features": X_train.shape[1],
+        "preprocess_seconds": preprocess_seconds,
+        "train_seconds": train_seconds,
+        "accuracy": Accuracy().evaluate(y_test, model.predict(X_test)),
+        "iterations": getattr(model.model, "n_iter_", None) or getattr(model.model, "n_estimators_", None),
+    }
+
+
+@click.command()
+@click.option("--rows", default="100000,1000000", help="Comma-separated row counts")
+@click.option("--models", default="gradient_boosting,hist_gradient_boosting", help="Comma-separated models")
+@click.option("--data-dir", default="./.cache/benchmarks", help="Where the generated files are stored")
+def main(rows: str, models: str, data_dir: str) -> None:
+    """Compares training time and accuracy of the boosting models."""
+    click.echo(
+        f"{'rows':>10}  {'model':<24}{'features':>9}{'iters':>7}{'prep (s)':>10}{'train (s)':>11}{'accuracy':>10}"
+    )
+    for row_count in (int(value) for value in rows.split(",")):
+        filepath = ensure_csv(os.path.join(data_dir, f"synthetic_{row_count}.csv"), row_count)
+        for model_name in models.split(","):
+            result = run(filepath, model_name)
+            click.echo(
+                f"{row_count:>10,}  {model_name:<24}{result['features']:>9}{result['iterations']:>7}"
+                f"{result['preprocess_seconds']:>10.2f}{result['train_seconds']:>11.2f}{result['accuracy']:>10.4f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
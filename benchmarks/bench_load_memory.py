@@ -0,0 +1,79 @@
+"""Benchmark the memory footprint of loading a large CSV with and without the declared schema.
+
+Usage:
+    poetry run python -m benchmarks.bench_load_memory --rows 5000000
+
+Generates a synthetic Titanic-schema file (see benchmarks.synthetic_data) unless --file is given, then
+loads it in a fresh process per variant and reports the peak resident set size of that process, the
+in-memory size of the DataFrame and the parse time:
+
+* legacy:   a plain ``pd.read_csv`` of every column with the inferred dtypes.
+* schema:   DataManager.load_data, parsing only the used columns into categoricals and int8/float32.
+* pyarrow:  the same schema with the pyarrow parser, when pyarrow is installed.
+"""
+import importlib.util
+import multiprocessing
+import os
+import resource
+import time
+
+from concurrent.futures import ProcessPoolExecutor
+
+import click
+import pandas as pd
+
+from benchmarks.synthetic_data import ensure_csv
+from src.data_manager import DataManager
+
+
+def _load(filepath: str, variant: str) -> dict:
+    start = time.perf_counter()
+    if variant == "legacy":
+        data = pd.read_csv(filepath)
+    else:
+        data_manager = DataManager(filepath, engine="pyarrow" if variant == "pyarrow" else None)
+        data_manager.load_data()
+        data = data_manager.data
+    seconds = time.perf_counter() - start
+    return {
+        "seconds": seconds,
+        "frame_bytes": int(data.memory_usage(deep=True).sum()),
+        # ru_maxrss is in kilobytes on Linux
+        "peak_rss_bytes": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024,
+    }
+
+
+def measure(filepath: str, variant: str) -> dict:
+    """Loads the file in a fresh process so the peak RSS only reflects this variant."""
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+        return executor.submit(_load, filepath, variant).result()
+
+
+@click.command()
+@click.option("--rows", default=5_000_000, help="Rows of the generated file")
+@click.option("--file", "filepath", default=None, help="Existing CSV to load instead of a generated one")
+@click.option("--data-dir", default="./.cache/benchmarks", help="Where the generated file is stored")
+def main(rows: int, filepath: str, data_dir: str) -> None:
+    """Compares peak RSS, DataFrame size and parse time of the loading variants."""
+    if filepath is None:
+        filepath = ensure_csv(os.path.join(data_dir, f"synthetic_{rows}.csv"), rows)
+
+    variants = ["legacy", "schema"]
+    if importlib.util.find_spec("pyarrow") is not None:
+        variants.append("pyarrow")
+
+    click.echo(f"{'variant':<10}{'peak RSS (MB)':>16}{'frame (MB)':>14}{'parse (s)':>12}")
+    results = {}
+    for variant in variants:
+        results[variant] = result = measure(filepath, variant)
+        click.echo(
+            f"{variant:<10}{result['peak_rss_bytes'] / 1e6:>16.1f}"
+            f"{result['frame_bytes'] / 1e6:>14.1f}{result['seconds']:>12.2f}"
+        )
+    for variant in variants[1:]:
+        reduction = 1 - results[variant]["peak_rss_bytes"] / results["legacy"]["peak_rss_bytes"]
+        click.echo(f"{variant}: peak RSS {reduction:.0%} lower than legacy")
+
+
+if __name__ == "__main__":
+    main()
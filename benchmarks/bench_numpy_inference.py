@@ -0,0 +1,60 @@
+"""Benchmark single-row latency of the NumPy inference path against the sklearn path.
+
+Usage:
+    poetry run python -m benchmarks.bench_numpy_inference --model logistic_regression
+"""
+import time
+
+import click
+import numpy as np
+import pandas as pd
+
+from src.data_manager import DataManager
+from src.model_artifact import ModelArtifact
+from src.models.model_factory import ModelFactory
+from src.numpy_inference import NumpyPredictor
+
+
+def _latency_us(func, inputs: list, repeats: int) -> tuple:
+    timings = np.empty(repeats)
+    for i in range(repeats):
+        item = inputs[i % len(inputs)]
+        start = time.perf_counter()
+        func(item)
+        timings[i] = time.perf_counter() - start
+    timings *= 1e6
+    return float(np.percentile(timings, 50)), float(np.percentile(timings, 99))
+
+
+@click.command()
+@click.option("--train-file", default="./data/train.csv", help="CSV used to train the model")
+@click.option("--score-file", default="./data/test.csv", help="CSV whose rows are scored one at a time")
+@click.option("--model", default="logistic_regression", help="Model to benchmark")
+@click.option("--repeats", default=2000, help="Number of single-row predictions per path")
+def main(train_file: str, score_file: str, model: str, repeats: int) -> None:
+    """Trains a model and times single-row predictions through both inference paths."""
+    data_manager = DataManager(train_file)
+    data_manager.load_data()
+    data_manager.preprocess()
+    model_instance = ModelFactory.create_model(model)
+    model_instance.train(data_manager.get_processed_data(), data_manager.get_target())
+    artifact = ModelArtifact(model, model_instance, data_manager.preprocessor)
+    predictor = NumpyPredictor.from_artifact(artifact)
+
+    frame = pd.read_csv(score_file)
+    records = frame.astype(object).where(frame.notna(), None).to_dict("records")
+    frames = [frame.iloc[[i]] for i in range(len(frame))]
+    rows = [predictor.transform_records([record]) for record in records]
+
+    sklearn_p50, sklearn_p99 = _latency_us(lambda row: artifact.predict(row.copy()), frames, min(repeats, 500))
+    numpy_p50, numpy_p99 = _latency_us(lambda record: predictor.predict_records([record]), records, repeats)
+    model_p50, model_p99 = _latency_us(predictor.predict, rows, repeats)
+
+    click.echo(f"model: {model}, single-row latency p50 / p99 in microseconds")
+    click.echo(f"sklearn (preprocess + predict): {sklearn_p50:10.1f} / {sklearn_p99:10.1f}")
+    click.echo(f"numpy (preprocess + predict):   {numpy_p50:10.1f} / {numpy_p99:10.1f}")
+    click.echo(f"numpy (predict only):           {model_p50:10.1f} / {model_p99:10.1f}")
+
+
+if __name__ == "__main__":
+    main()
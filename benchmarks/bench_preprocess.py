@@ -0,0 +1,68 @@
+"""Benchmark the feature engineering step of DataManager.preprocess against the original per-row version.
+
+Usage:
+    poetry run python -m benchmarks.bench_preprocess --rows 1000000
+"""
+import re
+import time
+
+import click
+import numpy as np
+import pandas as pd
+
+from src.data_manager import DataManager
+
+
+def legacy_feature_engineering(data: pd.DataFrame) -> pd.DataFrame:
+    """Original per-row implementation of the feature engineering step."""
+    data["Title"] = data["Name"].apply(
+        lambda x: re.findall(r"\b\w+\.", x)[0] if re.findall(r"\b\w+\.", x) else "Unknown"
+    )
+    title_mappings = {"Mlle.": "Miss.", "Ms.": "Miss.", "Mme.": "Mrs.", "Lady.": "Mrs."}
+    data["Title"] = data["Title"].replace(title_mappings)
+    data["Title"] = data["Title"].apply(lambda x: x if x in (["Mr.", "Miss.", "Mrs.", "Master."]) else "Other")
+    data.drop(columns=["Name"], inplace=True)
+    data["FamilySize"] = data["SibSp"] + data["Parch"] + 1
+    data["IsAlone"] = 1
+    data.loc[data["FamilySize"] > 1, "IsAlone"] = 0
+    mean_ages = data.groupby(["Title", "Pclass"])["Age"].transform("mean")
+    data["Age"].fillna(mean_ages, inplace=True)
+    return data
+
+
+def vectorized_feature_engineering(data: pd.DataFrame) -> pd.DataFrame:
+    """Current DataManager feature engineering step."""
+    data_manager = DataManager(filepath=None)
+    data_manager._data = data
+    data_manager._extract_titles()
+    data_manager._create_family_features()
+    data_manager._impute_age()
+    return data_manager.data
+
+
+def _time(func, data: pd.DataFrame) -> tuple:
+    start = time.perf_counter()
+    result = func(data)
+    return time.perf_counter() - start, result
+
+
+@click.command()
+@click.option("--source", default="./data/train.csv", help="CSV whose rows are tiled to the requested size")
+@click.option("--rows", default=1_000_000, help="Number of rows to benchmark on")
+def main(source: str, rows: int) -> None:
+    """Times the legacy and vectorized feature engineering on the same tiled dataset."""
+    base = pd.read_csv(source).drop(columns=["Ticket", "Cabin", "PassengerId", "Survived"], errors="ignore")
+    data = base.iloc[np.resize(np.arange(len(base)), rows)].reset_index(drop=True)
+
+    legacy_seconds, legacy = _time(legacy_feature_engineering, data.copy())
+    vectorized_seconds, vectorized = _time(vectorized_feature_engineering, data.copy())
+    pd.testing.assert_frame_equal(legacy, vectorized)
+
+    click.echo(f"rows:       {rows:,}")
+    click.echo(f"legacy:     {legacy_seconds:.3f}s")
+    click.echo(f"vectorized: {vectorized_seconds:.3f}s")
+    click.echo(f"speedup:    {legacy_seconds / vectorized_seconds:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
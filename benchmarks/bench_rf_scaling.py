@@ -0,0 +1,70 @@
+"""Benchmark how random forest training scales with the core budget.
+
+Usage:
+    poetry run python -m benchmarks.bench_rf_scaling --rows 200000 --cores 1,2,4,8
+
+A synthetic Titanic-schema file is generated (see benchmarks.synthetic_data) and preprocessed once.
+For every core count the process budget is set with src.resources.configure(), as the global
+--n-jobs option does, and random_forest is created by the ModelFactory, which passes the budget to
+the estimator's n_jobs. The table reports the fastest of --repeats training runs, the speedup over
+one core, which is always timed, and the parallel efficiency (speedup / cores). Core counts above
+the available cores are skipped.
+"""
+import os
+import time
+
+import click
+
+from benchmarks.synthetic_data import ensure_csv
+from src.data_manager import DataManager
+from src.models.model_factory import ModelFactory
+from src.resources import available_cores, configure
+
+
+def train_seconds(X: object, y: object, cores: int, repeats: int) -> float:
+    """Returns the fastest wall time of training random_forest with a budget of cores."""
+    configure(cores)
+    timings = []
+    for _ in range(repeats):
+        model = ModelFactory.create_model("random_forest")
+        start = time.perf_counter()
+        model.train(X, y)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+@click.command()
+@click.option("--rows", default=200_000, show_default=True, help="Rows of the synthetic training file")
+@click.option("--cores", default=None, help="Comma-separated core counts, by default powers of two up to all cores")
+@click.option("--repeats", default=3, show_default=True, help="Training runs per core count")
+@click.option("--data-dir", default="./.cache/benchmarks", help="Where the generated files are stored")
+def main(rows: int, cores: str, repeats: int, data_dir: str) -> None:
+    """Times random forest training from 1 to N cores."""
+    available = available_cores()
+    if cores:
+        counts = [int(value) for value in cores.split(",")]
+    else:
+        counts = [2**power for power in range(available.bit_length()) if 2**power < available] + [available]
+    skipped = [count for count in counts if count > available]
+    # One core is always timed, as the reference of the speedups
+    counts = sorted({1, *(count for count in counts if count <= available)})
+    if skipped:
+        click.echo(f"Skipping {', '.join(map(str, skipped))} cores: only {available} available")
+
+    filepath = ensure_csv(os.path.join(data_dir, f"synthetic_{rows}.csv"), rows)
+    data_manager = DataManager(filepath)
+    data_manager.load_data()
+    data_manager.preprocess()
+    X, y = data_manager.get_processed_data(), data_manager.get_target()
+
+    click.echo(f"{'cores':>6}{'train (s)':>11}{'speedup':>9}{'efficiency':>12}")
+    baseline = None
+    for count in counts:
+        seconds = train_seconds(X, y, count, repeats)
+        baseline = baseline or seconds
+        speedup = baseline / seconds
+        click.echo(f"{count:>6}{seconds:>11.2f}{speedup:>9.2f}{speedup / count:>12.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Load test for the prediction server.
+
+Start the server first, then run for example:
+    poetry run python src/cli.py serve --artifact ./artifacts/model.joblib
+    poetry run python -m benchmarks.load_test_server --concurrency 64 --duration 10
+
+Every client connection sends single-passenger requests taken from the CSV, back to back over a
+keep-alive connection. The client-side latency percentiles are printed along with the server's
+/metrics counters.
+"""
+import asyncio
+import json
+import time
+
+import click
+import numpy as np
+import pandas as pd
+
+
+async def _request(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter, method: str, path: str, body: bytes
+) -> dict:
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nHost: load-test\r\nContent-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n\r\n".encode() + body
+    )
+    await writer.drain()
+    headers = {}
+    await reader.readline()
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode().partition(":")
+        headers[name.strip().lower()] = value.strip()
+    return json.loads(await reader.readexactly(int(headers["content-length"])))
+
+
+async def _client(host: str, port: int, payloads: list, deadline: float, latencies: list) -> None:
+    reader, writer = await asyncio.open_connection(host, port)
+    position = 0
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        await _request(reader, writer, "POST", "/predict", payloads[position % len(payloads)])
+        latencies.append(time.perf_counter() - start)
+        position += 1
+    writer.close()
+
+
+async def _run(host: str, port: int, payloads: list, concurrency: int, duration: float) -> tuple:
+    latencies = []
+    deadline = time.perf_counter() + duration
+    clients = [_client(host, port, payloads[i:] + payloads[:i], deadline, latencies) for i in range(concurrency)]
+    await asyncio.gather(*clients)
+    reader, writer = await asyncio.open_connection(host, port)
+    metrics = await _request(reader, writer, "GET", "/metrics", b"")
+    writer.close()
+    return latencies, metrics
+
+
+@click.command()
+@click.option("--host", default="127.0.0.1", help="Server host")
+@click.option("--port", default=8000, help="Server port")
+@click.option("--source", default="./data/test.csv", help="CSV with the passengers to send")
+@click.option("--concurrency", default=32, help="Number of concurrent client connections")
+@click.option("--duration", default=10.0, help="Seconds to run the load test for")
+def main(host: str, port: int, source: str, concurrency: int, duration: float) -> None:
+    """Sends concurrent single-passenger requests to the prediction server and reports latency."""
+    records = pd.read_csv(source).astype(object).where(lambda frame: frame.notna(), None).to_dict("records")
+    payloads = [json.dumps(record).encode() for record in records]
+    latencies, metrics = asyncio.run(_run(host, port, payloads, concurrency, duration))
+
+    latencies_ms = np.array(latencies) * 1000
+    click.echo(f"requests:        {len(latencies):,} in {duration:.1f}s ({len(latencies) / duration:,.0f} req/s)")
+    click.echo(f"client p50/p99:  {np.percentile(latencies_ms, 50):.2f} / {np.percentile(latencies_ms, 99):.2f} ms")
+    click.echo(f"server metrics:  {json.dumps(metrics, indent=2)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+"""Benchmark suite timing every stage of the pipeline at several dataset sizes.
+
+Usage:
+    poetry run python -m benchmarks.run_benchmarks --scales 1,100,10000 --output ./benchmarks/results.json
+    poetry run python -m benchmarks.run_benchmarks --baseline ./benchmarks/results.json --tolerance 0.2
+
+A scale is a multiple of the 891 rows of data/train.csv. Scale 1 uses data/train.csv itself; larger
+scales use synthetic files with the same schema and distributions (see benchmarks.synthetic_data),
+generated once into --data-dir and reused afterwards. For every scale the suite times
+DataManager.load_data, DataManager.preprocess, the train and predict methods of every model and the
+evaluation classes, keeping the fastest of --repeats runs. Results are written as JSON together with
+the environment they were measured in. With --baseline, the run exits with status 1 when a stage is
+slower than its baseline timing by more than --tolerance.
+"""
+import json
+import os
+import platform
+import sys
+import time
+
+from datetime import datetime, timezone
+from typing import Callable, Optional
+
+import click
+import numpy as np
+import pandas as pd
+import sklearn
+
+from benchmarks.synthetic_data import ensure_csv
+from src.data_manager import DataManager
+from src.evaluation import Accuracy, F1Score, FullReport, Precision, Recall
+from src.models.model_factory import ModelFactory
+
+SOURCE_ROWS = 891
+EVALUATIONS = (Accuracy, Precision, Recall, F1Score, FullReport)
+# Stages faster than this are dominated by timer noise and are not checked for regressions
+MIN_COMPARED_SECONDS = 0.001
+
+
+def best_time(func: Callable[[], object], repeats: int, setup: Optional[Callable[[], object]] = None) -> float:
+    """Returns the fastest wall time in seconds of several calls.
+
+    Args:
+        func (Callable): The timed call. It receives the result of setup when one is given.
+        repeats (int): Number of timed calls.
+        setup (Callable, optional): Untimed call run before every timed call.
+    """
+    timings = []
+    for _ in range(repeats):
+        state = setup() if setup is not None else None
+        start = time.perf_counter()
+        func(state) if setup is not None else func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def dataset_path(scale: int, data_dir: str, source: str) -> str:
+    """Returns the CSV for a scale, generating the synthetic file on first use."""
+    if scale == 1:
+        return source
+    return ensure_csv(os.path.join(data_dir, f"synthetic_{scale}x.csv"), scale * SOURCE_ROWS, source)
+
+
+def run_scale(path: str, scale: int, model_names: list, repeats: int, max_train_rows: int) -> list:
+    """Times every stage of the pipeline on one dataset.
+
+    Args:
+        path (str): CSV with the Titanic columns, including Survived.
+        scale (int): Scale of the dataset, stored with the results.
+        model_names (list): ModelFactory names of the models to time.
+        repeats (int): Number of runs per stage; the fastest one is kept.
+        max_train_rows (int): Models are trained and scored on at most this many processed rows.
+
+    Returns:
+        list: One {"scale", "stage", "rows", "seconds"} dict per stage.
+    """
+
+    def loaded() -> DataManager:
+        data_manager = DataManager(path)
+        data_manager.load_data()
+        return data_manager
+
+    results = []
+
+    def record(stage: str, rows: int, seconds: float) -> None:
+        results.append({"scale": scale, "stage": stage, "rows": rows, "seconds": seconds})
+        click.echo(f"{scale:>7}x {stage:<40}{rows:>12,}{seconds:>12.4f}s")
+
+    record("load_data", scale * SOURCE_ROWS, best_time(lambda: DataManager(path).load_data(), repeats))
+    seconds = best_time(lambda data_manager: data_manager.preprocess(), repeats, setup=loaded)
+    record("preprocess", scale * SOURCE_ROWS, seconds)
+
+    data_manager = loaded()
+    data_manager.preprocess()
+    X, y = data_manager.get_processed_data(), data_manager.get_target()
+    rows = min(len(y), max_train_rows)
+    X, y = X[:rows], y[:rows]
+    for model_name in model_names:
+        model = ModelFactory.create_model(model_name)
+        record(f"{model_name}.train", rows, best_time(lambda: model.train(X, y), repeats))
+        record(f"{model_name}.predict", rows, best_time(lambda: model.predict(X), repeats))
+
+    y_true = data_manager.get_target()
+    y_pred = np.random.default_rng(0).integers(0, 2, len(y_true))
+    for evaluation in EVALUATIONS:
+        seconds = best_time(lambda: evaluation().evaluate(y_true, y_pred), repeats)
+        record(f"evaluation.{evaluation.__name__}", len(y_true), seconds)
+    return results
+
+
+def find_regressions(results: list, baseline: list, tolerance: float) -> list:
+    """Returns the results slower than their baseline timing by more than the tolerance.
+
+    Args:
+        results (list): Results of the current run.
+        baseline (list): Results of a previous run; stages missing from it are skipped.
+        tolerance (float): Allowed relative slowdown, e.g. 0.2 for 20%.
+
+    Returns:
+        list: (result, baseline_seconds) tuples of the regressed stages.
+    """
+    reference = {(result["scale"], result["stage"]): result["seconds"] for result in baseline}
+    regressions = []
+    for result in results:
+        previous = reference.get((result["scale"], result["stage"]))
+        if previous is None or max(result["seconds"], previous) < MIN_COMPARED_SECONDS:
+            continue
+        if result["seconds"] > previous * (1 + tolerance):
+            regressions.append((result, previous))
+    return regressions
+
+
+def environment() -> dict:
+    """Returns the machine and library versions the results were measured with."""
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "sklearn": sklearn.__version__,
+    }
+
+
+@click.command()
+@click.option("--scales", default="1,100,10000", help="Comma-separated multiples of the 891 rows of train.csv")
+@click.option("--models", default=None, help="Comma-separated models to time, all registered models by default")
+@click.option("--repeats", default=3, help="Runs per stage; the fastest one is kept")
+@click.option("--max-train-rows", default=1_000_000, help="Maximum number of rows the models are trained on")
+@click.option("--source", default="./data/train.csv", help="CSV the synthetic data is modelled on")
+@click.option("--data-dir", default="./.cache/benchmarks", help="Where the synthetic datasets are stored")
+@click.option("--output", default="./benchmarks/results.json", help="Where the results are written as JSON")
+@click.option("--baseline", default=None, help="Results JSON of a previous run to compare against")
+@click.option("--tolerance", default=0.2, help="Allowed relative slowdown against the baseline")
+def main(
+    scales: str,
+    models: Optional[str],
+    repeats: int,
+    max_train_rows: int,
+    source: str,
+    data_dir: str,
+    output: str,
+    baseline: Optional[str],
+    tolerance: float,
+) -> None:
+    """Runs the benchmark suite and optionally fails on regressions against a baseline."""
+    model_names = models.split(",") if models else ModelFactory.available_models()
+    results = []
+    for scale in (int(scale) for scale in scales.split(",")):
+        path = dataset_path(scale, data_dir, source)
+        results.extend(run_scale(path, scale, model_names, repeats, max_train_rows))
+
+    directory = os.path.dirname(output)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(output, "w") as file:
+        json.dump({"environment": environment(), "results": results}, file, indent=2)
+    click.echo(f"Results written to {output}")
+
+    if baseline is not None:
+        with open(baseline) as file:
+            regressions = find_regressions(results, json.load(file)["results"], tolerance)
+        for result, previous in regressions:
+            click.echo(
+                f"REGRESSION {result['scale']}x {result['stage']}: {result['seconds']:.4f}s vs {previous:.4f}s "
+                f"(+{result['seconds'] / previous - 1:.0%}, tolerance {tolerance:.0%})"
+            )
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
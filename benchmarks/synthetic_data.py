@@ -0,0 +1,111 @@
+"""Synthetic passenger manifests with the schema and distributions of data/train.csv.
+
+Usage:
+    poetry run python -m benchmarks.synthetic_data --rows 10000000 --output ./data/synthetic/train_10m.csv
+
+Rows are drawn with replacement from the source file, which keeps the joint distribution of the
+columns (and their relation to Survived) intact, and are then perturbed so the output is not a
+plain copy: surnames are reshuffled, known ages get a small jitter, fares a multiplicative one and
+tickets are regenerated. Output is written in chunks, so the memory use does not depend on the
+number of rows generated.
+"""
+import os
+
+from typing import Iterator
+
+import click
+import numpy as np
+import pandas as pd
+
+DEFAULT_CHUNK_SIZE = 250_000
+
+
+class SyntheticTitanicGenerator:
+    """Generates synthetic passenger records that follow the distributions of a source manifest."""
+
+    def __init__(self, source: str = "./data/train.csv", seed: int = 0) -> None:
+        """Initializes the generator.
+
+        Args:
+            source (str): CSV with the Titanic columns to sample from.
+            seed (int): Seed of the random generator.
+        """
+        self.template = pd.read_csv(source)
+        self.rng = np.random.default_rng(seed)
+        names = self.template["Name"].str.split(", ", n=1, expand=True)
+        self._surnames = names[0].unique()
+        # Title and given names of every template row, e.g. "Mr. Owen Harris"
+        self._given = names[1].fillna("").to_numpy(dtype=object)
+
+    def generate(self, rows: int, start_id: int = 1) -> pd.DataFrame:
+        """Returns a DataFrame with the given number of synthetic rows.
+
+        Args:
+            rows (int): Number of rows to generate.
+            start_id (int): PassengerId of the first row.
+        """
+        picks = self.rng.integers(0, len(self.template), rows)
+        data = self.template.iloc[picks].reset_index(drop=True)
+        data["PassengerId"] = np.arange(start_id, start_id + rows)
+
+        surnames = self._surnames[self.rng.integers(0, len(self._surnames), rows)]
+        data["Name"] = pd.Series(surnames, dtype=object) + ", " + pd.Series(self._given[picks], dtype=object)
+
+        age = data["Age"].to_numpy()
+        jittered = np.clip(age + self.rng.normal(0, 2, rows), 0.42, 80)
+        data["Age"] = np.where(np.isnan(age), np.nan, np.where(age < 1, age, np.round(jittered)))
+        data["Fare"] = np.round(data["Fare"].to_numpy() * self.rng.lognormal(0, 0.1, rows), 4)
+        data["Ticket"] = self.rng.integers(100_000, 1_000_000, rows).astype(str)
+        return data[self.template.columns]
+
+    def iter_chunks(self, rows: int, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+        """Yields the synthetic rows in chunks of at most chunk_size rows."""
+        for start in range(0, rows, chunk_size):
+            yield self.generate(min(chunk_size, rows - start), start_id=start + 1)
+
+    def write_csv(self, path: str, rows: int, chunk_size: int = DEFAULT_CHUNK_SIZE, with_target: bool = True) -> str:
+        """Streams synthetic rows to a CSV file chunk by chunk.
+
+        Args:
+            path (str): Destination CSV path. Parent directories are created when needed.
+            rows (int): Number of rows to write.
+            chunk_size (int): Number of rows generated and written at a time.
+            with_target (bool): Whether to include the Survived column.
+
+        Returns:
+            str: The path written.
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w", newline="") as file:
+            for position, chunk in enumerate(self.iter_chunks(rows, chunk_size)):
+                if not with_target:
+                    chunk = chunk.drop(columns=["Survived"])
+                chunk.to_csv(file, index=False, header=position == 0)
+        return path
+
+
+def ensure_csv(path: str, rows: int, source: str = "./data/train.csv") -> str:
+    """Returns path, first writing a synthetic CSV with the given number of rows there if it does not exist."""
+    if not os.path.exists(path):
+        click.echo(f"Generating {rows:,} rows into {path}")
+        SyntheticTitanicGenerator(source).write_csv(path + ".tmp", rows)
+        os.replace(path + ".tmp", path)
+    return path
+
+
+@click.command()
+@click.option("--rows", default=891_000, help="Number of rows to generate")
+@click.option("--output", required=True, help="Destination CSV path")
+@click.option("--source", default="./data/train.csv", help="CSV whose distributions are reproduced")
+@click.option("--seed", default=0, help="Random seed")
+@click.option("--no-target", is_flag=True, help="Leave out the Survived column, like data/test.csv")
+def main(rows: int, output: str, source: str, seed: int, no_target: bool) -> None:
+    """Writes a synthetic Titanic-schema CSV."""
+    SyntheticTitanicGenerator(source, seed).write_csv(output, rows, with_target=not no_target)
+    click.echo(f"Wrote {rows:,} rows to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+import logging
+import os
+
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Iterable, Optional, TextIO
+
+import pandas as pd
+
+from src.data_manager import iter_csv_chunks
+from src.model_artifact import ModelArtifact
+from src.resources import configure, resolve_n_jobs
+
+DEFAULT_CHUNK_SIZE = 100_000
+SUBMISSION_COLUMNS = ["PassengerId", "Survived"]
+
+# The artifact each worker process loads once in its initializer
+_worker_artifact: Optional[ModelArtifact] = None
+
+
+def score_chunk(artifact: ModelArtifact, chunk: pd.DataFrame) -> pd.DataFrame:
+    """Scores one chunk of raw passenger records with the artifact's frozen preprocessor and model.
+
+    Args:
+        artifact (ModelArtifact): The loaded model artifact.
+        chunk (pd.DataFrame): Raw passenger records including PassengerId. Survived is optional.
+
+    Returns:
+        pd.DataFrame: The PassengerId and Survived columns of the submission, in the chunk's row order.
+    """
+    passenger_ids = chunk["PassengerId"].to_numpy()
+    return pd.DataFrame({"PassengerId": passenger_ids, "Survived": artifact.predict(chunk)})
+
+
+def score_csv(
+    artifact_path: str,
+    input_path: str,
+    output_path: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    n_jobs: Optional[int] = None,
+) -> int:
+    """Scores a CSV file of any size in chunks and streams a submission file in input order.
+
+    The input is parsed chunk by chunk and the chunks are scored by a pool of worker processes, each
+    of which loads the artifact once. At most two chunks per worker are in flight; finished chunks
+    are written in submission order as soon as every earlier chunk has been written. Peak memory
+    therefore depends on chunk_size and n_jobs but not on the size of the input. The output is written
+    to a temporary file that replaces output_path once every chunk has been scored.
+
+    Args:
+        artifact_path (str): Path of the model artifact.
+        input_path (str): CSV with the raw Titanic columns, including PassengerId, or a directory or glob
+            pattern of such CSV shards, scored in path order.
+        output_path (str): Path of the submission CSV with PassengerId and Survived columns.
+        chunk_size (int): Number of rows parsed and scored at a time.
+        n_jobs (int, optional): Number of worker processes within the core budget of src.resources, None or
+            -1 for the whole budget, 1 to score in this process.
+
+    Returns:
+        int: The number of rows scored.
+    """
+    chunks = iter_csv_chunks(input_path, chunk_size)
+    tmp_path = f"{output_path}.tmp"
+    try:
+        with open(tmp_path, "w", newline="") as file:
+            file.write(",".join(SUBMISSION_COLUMNS) + "\n")
+            workers = resolve_n_jobs(n_jobs)
+            if workers == 1:
+                artifact = ModelArtifact.load(artifact_path)
+                rows = sum(_write(file, score_chunk(artifact, chunk)) for chunk in chunks)
+            else:
+                rows = _score_in_pool(artifact_path, chunks, file, workers)
+        os.replace(tmp_path, output_path)
+    except Exception as e:
+        logging.error(f"Error while scoring {input_path}: {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    logging.info(f"Scored {rows} rows of {input_path} into {output_path}.")
+    return rows
+
+
+def _score_in_pool(artifact_path: str, chunks: Iterable[pd.DataFrame], file: TextIO, workers: int) -> int:
+    rows = 0
+    pending: deque[Future] = deque()
+    n_threads = max(1, resolve_n_jobs() // workers)
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_load_worker_artifact, initargs=(artifact_path, n_threads)
+    ) as pool:
+        for chunk in chunks:
+            pending.append(pool.submit(_score_in_worker, chunk))
+            # Bound the chunks held in memory; the oldest one is written first to keep the input order
+            if len(pending) >= 2 * workers:
+                rows += _write(file, pending.popleft().result())
+        while pending:
+            rows += _write(file, pending.popleft().result())
+    return rows
+
+
+def _load_worker_artifact(artifact_path: str, n_threads: int) -> None:
+    global _worker_artifact
+    # The worker process only scores, so its share of the cores is its budget for good
+    configure(n_threads)
+    _worker_artifact = ModelArtifact.load(artifact_path)
+
+
+def _score_in_worker(chunk: pd.DataFrame) -> pd.DataFrame:
+    assert _worker_artifact is not None, "the worker initializer loads the artifact"
+    return score_chunk(_worker_artifact, chunk)
+
+
+def _write(file: TextIO, submission: pd.DataFrame) -> int:
+    submission.to_csv(file, header=False, index=False)
+    return len(submission)
@@ -0,0 +1,216 @@
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+
+from typing import Optional
+
+import joblib
+import numpy as np
+import pandas as pd
+
+DEFAULT_CACHE_DIR = os.environ.get("TITANIC_CACHE_DIR", "./.cache")
+DEFAULT_MAX_BYTES = 2 * 1024**3
+FRAME_FORMAT_VERSION = "3"
+
+_FRAMES = "frames"
+_FEATURES = "features"
+
+
+class DataCache:
+    """Content-addressed on-disk cache for parsed CSV files and transformed feature matrices.
+
+    Entries are keyed by the SHA-256 of the input file content, so a changed file never hits a stale
+    entry. There are two levels:
+
+    * frames: the parsed DataFrame, stored column by column as ``.npy`` files.
+    * features: the transformed feature matrix, the target and the passenger ids as ``.npy`` files,
+      loaded back memory-mapped, plus the fitted preprocessor. The key also includes the
+      preprocessing pipeline version.
+
+    The total size of the cache is bounded; the least recently used entries are evicted first.
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        """Initializes the DataCache.
+
+        Args:
+            cache_dir (str): Directory holding the cache entries.
+            max_bytes (int): Upper bound for the total size of the cache on disk.
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def file_digest(filepath: str, chunk_size: int = 1024 * 1024) -> str:
+        """Returns the SHA-256 hex digest of a file's content.
+
+        Args:
+            filepath (str): Path of the file to hash.
+            chunk_size (int): Number of bytes read at a time.
+        """
+        digest = hashlib.sha256()
+        with open(filepath, "rb") as file:
+            for chunk in iter(lambda: file.read(chunk_size), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @staticmethod
+    def files_digest(filepaths: list) -> str:
+        """Returns a digest of the content of several files in order; for a single file it is its file_digest().
+
+        Args:
+            filepaths (list): Paths of the files to hash.
+        """
+        if len(filepaths) == 1:
+            return DataCache.file_digest(filepaths[0])
+        digest = hashlib.sha256()
+        for filepath in filepaths:
+            digest.update(DataCache.file_digest(filepath).encode())
+        return digest.hexdigest()
+
+    def load_frame(self, key: str) -> Optional[pd.DataFrame]:
+        """Returns the cached parsed DataFrame for the key, or None on a miss."""
+        entry = self._lookup(_FRAMES, f"{key}-{FRAME_FORMAT_VERSION}")
+        if entry is None:
+            return None
+        with open(os.path.join(entry, "columns.json")) as file:
+            columns = json.load(file)
+        data = {}
+        for position, column in enumerate(columns):
+            values = np.load(os.path.join(entry, f"{position}.npy"), allow_pickle=True)
+            if column["categories"] is not None:
+                values = pd.Categorical.from_codes(values, column["categories"])
+            data[column["name"]] = values
+        logging.info(f"Parsed data loaded from cache entry {key[:12]}.")
+        return pd.DataFrame(data, columns=[column["name"] for column in columns])
+
+    def store_frame(self, key: str, frame: pd.DataFrame) -> None:
+        """Stores a parsed DataFrame under the key, one ``.npy`` file per column.
+
+        Categorical columns are stored as their integer codes, with the categories kept in columns.json.
+        """
+        with self._writer(_FRAMES, f"{key}-{FRAME_FORMAT_VERSION}") as entry:
+            columns = []
+            for position, column in enumerate(frame.columns):
+                series = frame[column]
+                categories = None
+                if isinstance(series.dtype, pd.CategoricalDtype):
+                    categories = series.cat.categories.tolist()
+                    values = series.cat.codes.to_numpy()
+                else:
+                    values = series.to_numpy()
+                columns.append({"name": column, "categories": categories})
+                np.save(os.path.join(entry, f"{position}.npy"), values, allow_pickle=values.dtype == object)
+            with open(os.path.join(entry, "columns.json"), "w") as file:
+                json.dump(columns, file)
+
+    def load_features(self, key: str, pipeline_version: str) -> Optional[dict]:
+        """Returns the cached transformed features for the key, or None on a miss.
+
+        Args:
+            key (str): Digest of the input file.
+            pipeline_version (str): Version of the preprocessing pipeline that produced the features.
+
+        Returns:
+            dict: With the memory-mapped ``features``, ``target`` and ``passenger_ids`` arrays and the
+                fitted ``preprocessor``.
+        """
+        entry = self._lookup(_FEATURES, f"{key}-{pipeline_version}")
+        if entry is None:
+            return None
+        cached = {"preprocessor": joblib.load(os.path.join(entry, "preprocessor.joblib"))}
+        for name in ("features", "target", "passenger_ids"):
+            path = os.path.join(entry, f"{name}.npy")
+            cached[name] = np.load(path, mmap_mode="r") if os.path.exists(path) else None
+        logging.info(f"Processed data loaded from cache entry {key[:12]}.")
+        return cached
+
+    def store_features(
+        self,
+        key: str,
+        pipeline_version: str,
+        features: np.ndarray,
+        target: Optional[np.ndarray],
+        passenger_ids: Optional[np.ndarray],
+        preprocessor: object,
+    ) -> None:
+        """Stores transformed features, target and passenger ids with the preprocessor that produced them."""
+        with self._writer(_FEATURES, f"{key}-{pipeline_version}") as entry:
+            np.save(os.path.join(entry, "features.npy"), np.asarray(features))
+            if target is not None:
+                np.save(os.path.join(entry, "target.npy"), np.asarray(target))
+            if passenger_ids is not None:
+                np.save(os.path.join(entry, "passenger_ids.npy"), np.asarray(passenger_ids))
+            joblib.dump(preprocessor, os.path.join(entry, "preprocessor.joblib"))
+
+    def clear(self) -> None:
+        """Removes every cache entry."""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def _lookup(self, level: str, name: str) -> Optional[str]:
+        entry = os.path.join(self.cache_dir, level, name)
+        if not os.path.isdir(entry):
+            return None
+        # The entry's mtime doubles as its last-used time for LRU eviction
+        os.utime(entry)
+        return entry
+
+    def _writer(self, level: str, name: str) -> "_EntryWriter":
+        return _EntryWriter(self, os.path.join(self.cache_dir, level), name)
+
+    def _evict(self) -> None:
+        """Deletes the least recently used entries until the cache fits in max_bytes."""
+        entries = []
+        for level in (_FRAMES, _FEATURES):
+            level_dir = os.path.join(self.cache_dir, level)
+            if not os.path.isdir(level_dir):
+                continue
+            for name in os.listdir(level_dir):
+                entry = os.path.join(level_dir, name)
+                if name.startswith(".") or not os.path.isdir(entry):
+                    continue
+                entries.append((os.path.getmtime(entry), _directory_size(entry), entry))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+            logging.info(f"Evicted cache entry {entry}.")
+
+
+class _EntryWriter:
+    """Context manager that builds a cache entry in a temporary directory and publishes it atomically."""
+
+    def __init__(self, cache: DataCache, level_dir: str, name: str) -> None:
+        self.cache = cache
+        self.level_dir = level_dir
+        self.name = name
+        self.tmp_dir = None
+
+    def __enter__(self) -> str:
+        os.makedirs(self.level_dir, exist_ok=True)
+        self.tmp_dir = tempfile.mkdtemp(prefix=".tmp-", dir=self.level_dir)
+        return self.tmp_dir
+
+    def __exit__(self, exc_type: type, exc: BaseException, traceback: object) -> bool:
+        if exc_type is not None:
+            shutil.rmtree(self.tmp_dir, ignore_errors=True)
+            logging.warning(f"Could not write cache entry {self.name}: {exc}")
+            return True
+        target = os.path.join(self.level_dir, self.name)
+        try:
+            os.rename(self.tmp_dir, target)
+        except OSError:
+            # Another process published the same entry first
+            shutil.rmtree(self.tmp_dir, ignore_errors=True)
+        self.cache._evict()
+        return False
+
+
+def _directory_size(path: str) -> int:
+    return sum(entry.stat().st_size for entry in os.scandir(path) if entry.is_file())
@@ -1,45 +1,269 @@
+import json
 import logging
 import os
 import sys
 import click
 
-from sklearn.model_selection import train_test_split
+from typing import TYPE_CHECKING
 
 # Add the src directory to the Python path
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.append(project_root)
 
-from src.data_manager import DataManager
-from src.evaluation import Accuracy, F1Score, FullReport, Precision, Recall
-from src.models.model_factory import ModelFactory
+from src.lazy import LazyAttribute
+from src.profiling import Profiler
 
-evaluation_metrics = {"accuracy": Accuracy,
-                      "precision": Precision,
-                      "recall": Recall, 
-                      "f1": F1Score,
-                      "all": FullReport}
+if TYPE_CHECKING:
+    from src.models.base_model import BaseModel
+
+# pandas, scikit-learn and the project modules built on them are only imported when a command
+# needs them, so --help and the welcome message start instantly
+asyncio = LazyAttribute("asyncio")
+pd = LazyAttribute("pandas")
+train_test_split = LazyAttribute("sklearn.model_selection", "train_test_split")
+score_csv = LazyAttribute("src.batch_scoring", "score_csv")
+DataCache = LazyAttribute("src.cache", "DataCache")
+configure_resources = LazyAttribute("src.resources", "configure")
+train_incremental = LazyAttribute("src.incremental", "train_incremental")
+cross_validate = LazyAttribute("src.cross_validation", "cross_validate")
+format_cross_validation = LazyAttribute("src.cross_validation", "format_cross_validation")
+format_importance = LazyAttribute("src.importance", "format_importance")
+permutation_importance = LazyAttribute("src.importance", "permutation_importance")
+DataManager = LazyAttribute("src.data_manager", "DataManager")
+ResultStore = LazyAttribute("src.experiments", "ResultStore")
+format_summary = LazyAttribute("src.experiments", "format_summary")
+load_sweep = LazyAttribute("src.experiments", "load_sweep")
+run_sweep = LazyAttribute("src.experiments", "run_sweep")
+BootstrapEvaluation = LazyAttribute("src.evaluation", "BootstrapEvaluation")
+FullReport = LazyAttribute("src.evaluation", "FullReport")
+ThresholdSweep = LazyAttribute("src.evaluation", "ThresholdSweep")
+format_bootstrap = LazyAttribute("src.evaluation", "format_bootstrap")
+format_threshold_sweep = LazyAttribute("src.evaluation", "format_threshold_sweep")
+ModelArtifact = LazyAttribute("src.model_artifact", "ModelArtifact")
+compare_models = LazyAttribute("src.model_comparison", "compare_models")
+preprocess_for_models = LazyAttribute("src.model_comparison", "preprocess_for_models")
+format_comparison = LazyAttribute("src.model_comparison", "format_comparison")
+ModelFactory = LazyAttribute("src.models.model_factory", "ModelFactory")
+data_state = LazyAttribute("src.retraining", "data_state")
+same_hyperparameters = LazyAttribute("src.retraining", "same_hyperparameters")
+update_artifact = LazyAttribute("src.retraining", "update_artifact")
+NumpyPredictor = LazyAttribute("src.numpy_inference", "NumpyPredictor")
+PredictionServer = LazyAttribute("src.server", "PredictionServer")
+save_config = LazyAttribute("src.tuning", "save_config")
+tune = LazyAttribute("src.tuning", "tune")
+
+evaluation_metrics = {
+    "accuracy": LazyAttribute("src.evaluation", "Accuracy"),
+    "precision": LazyAttribute("src.evaluation", "Precision"),
+    "recall": LazyAttribute("src.evaluation", "Recall"),
+    "f1": LazyAttribute("src.evaluation", "F1Score"),
+    "all": FullReport,
+}
+
+# Mirrors src.tuning.SEARCH_SPACES and RESOURCES, which cannot be imported without scipy
+TUNABLE_MODELS = ("random_forest", "gradient_boosting", "logistic_regression")
+TUNING_RESOURCES = ("n_samples", "n_estimators")
+# Mirrors src.evaluation.REPORT_METRICS, kept here so the CLI starts without importing NumPy
+REPORT_METRICS = ("accuracy", "precision", "recall", "f1")
+
+# Mirrors src.resources.N_JOBS_ENV
+N_JOBS_ENV = "TITANIC_N_JOBS"
+
+DEFAULT_ARTIFACT_PATH = "./artifacts/model.joblib"
+DEFAULT_CONFIG_PATH = "./artifacts/best_params.json"
+# Mirrors src.batch_scoring.DEFAULT_CHUNK_SIZE
+DEFAULT_CHUNK_SIZE = 100_000
+# Mirrors src.experiments.DEFAULT_RESULTS_PATH and GROUP_COLUMNS
+DEFAULT_RESULTS_PATH = "./artifacts/experiments.db"
+RESULT_GROUP_COLUMNS = ("sweep", "data", "model", "seed", "test_size")
 
 WELCOME_MESSAGE = """
 ****************************Welcome to the Titanic MLOps CLI!***************************
 
 You can train the titanic model and evaluate it using the following command:
-    poetry run python src/cli.py FILE_PATH [OPTIONS] 
+    poetry run python src/cli.py FILE_PATH [OPTIONS]
+
+FILE_PATH may also be a directory of CSV shards or a quoted glob pattern such as "data/shards/*.csv".
 
 Options:
-  --model    Choose a model: gender_baseline, random_forest, gradient_boosting, logistic_regression
+  --model    Choose a model: gender_baseline, random_forest, gradient_boosting, hist_gradient_boosting,
+             logistic_regression, sgd_logistic, or all to train and compare every model in parallel
   --metric   Choose an evaluation metric: accuracy, precision, recall, f1, or all to display a full report
 
 Example:
     poetry run python src/cli.py ./data/train.csv --model logistic_regression --metric all
-  
+
+Profiling and resources (before the command):
+  --profile PATH   Write a JSON trace with the wall time, CPU time, memory and rows of every stage
+  --n-jobs N       Cores shared by models, worker processes and BLAS/OpenMP threads (default: $TITANIC_N_JOBS or all)
+
+Other commands:
+  train      Train a model on the whole file and save it as an artifact
+  predict    Score a CSV with a saved artifact and write a submission file
+  tune       Search a model's hyperparameters with successive halving
+  importance Rank the features of a saved artifact by permutation importance
+  experiment Run a sweep of models, seeds and test sizes, storing every result in SQLite (resumable)
+  results    Summarize the stored experiment results without rerunning anything
+  serve      Serve online predictions over HTTP with dynamic micro-batching
+  export     Compile a saved artifact into a dependency-light NumPy predictor
+
+Example:
+    poetry run python src/cli.py train ./data/train.csv --model random_forest
+    poetry run python src/cli.py predict ./data/test.csv --output ./predictions.csv
+    poetry run python src/cli.py tune ./data/train.csv --model random_forest --resource n_estimators
+
 """
 
-@click.command()
+
+class DefaultCommandGroup(click.Group):
+    """Click group that runs a default command when the first argument is not a command name.
+
+    This keeps ``cli.py FILE_PATH [OPTIONS]`` working next to the named commands.
+    """
+
+    def __init__(self, *args, default_command: str, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.default_command = default_command
+
+    def parse_args(self, ctx: click.Context, args: list) -> list:
+        # The group's own options (e.g. --profile) are parsed first; whatever follows them is either a
+        # command name or the arguments of the default command
+        rest = super().parse_args(ctx, args)
+        if ctx.protected_args and ctx.protected_args[0] not in self.commands:
+            ctx.protected_args, ctx.args = [self.default_command], [*ctx.protected_args, *ctx.args]
+            return ctx.args
+        return rest
+
+
+def _make_cache(no_cache: bool) -> DataCache:
+    return None if no_cache else DataCache()
+
+
+def _config_model_name(config_path: str) -> str:
+    with open(config_path) as file:
+        return json.load(file)["model"]
+
+
+def _create_model(model: str, config_path: str) -> "BaseModel":
+    if config_path:
+        return ModelFactory.create_model_from_config(config_path)
+    return ModelFactory.create_model(model)
+
+
+def _feature_encoding(model: str) -> str:
+    # With --model all the data is preprocessed per model encoding by preprocess_for_models
+    return "onehot" if model == "all" else ModelFactory.feature_encoding(model)
+
+
+def _feature_dtype(model: str) -> str:
+    return "float32" if model == "all" else ModelFactory.feature_dtype(model)
+
+
+def _validation_mode(quarantine: str) -> str:
+    return "quarantine" if quarantine else "report"
+
+
+def _load_data(data_manager: "DataManager", quarantine: str = None) -> None:
+    click.echo("Loading data...")
+    data_manager.load_data()
+    for path, error in data_manager.load_errors:
+        click.echo(f"Skipped malformed file {path}: {error}", err=True)
+    if quarantine and data_manager.quarantined is not None:
+        data_manager.quarantined.to_csv(quarantine, index=False)
+        click.echo(f"Quarantined {len(data_manager.quarantined)} invalid rows to {quarantine}")
+
+
+def _update_saved_artifact(
+    output: str, file_path: str, model: str, config_path: str, out_of_core: bool, quarantine: str = None
+) -> bool:
+    """Updates the artifact at output with the rows appended to its training file; returns False to rebuild it.
+
+    The appended rows are validated like a full load, and with quarantine the invalid ones are written there.
+    """
+    if not os.path.exists(output):
+        return False
+    try:
+        previous = ModelArtifact.load(output, mmap_mode=None)
+    except Exception as e:
+        click.echo(f"Rebuilding the model: the artifact at {output} cannot be loaded ({e})")
+        return False
+    same_training = (
+        previous.model_name == model
+        and previous.metadata.get("training_file") == file_path
+        and previous.is_incremental == out_of_core
+        and same_hyperparameters(previous, _create_model(model, config_path))
+    )
+    if not same_training:
+        click.echo(f"Rebuilding the model: the artifact at {output} was trained differently")
+        return False
+
+    updated, summary = update_artifact(previous, file_path, validation=_validation_mode(quarantine))
+    if quarantine and summary["quarantined"] is not None:
+        summary["quarantined"].to_csv(quarantine, index=False)
+        click.echo(f"Quarantined {len(summary['quarantined'])} invalid appended rows to {quarantine}")
+    if updated is None:
+        click.echo(f"Rebuilding the model: {summary['reason']}")
+        return False
+    if summary["status"] == "unchanged":
+        click.echo(f"The artifact at {output} is up to date: no rows were appended to {file_path}")
+        return True
+    updated.save(output)
+    click.echo(f"Updated the {model} model with {summary['appended_rows']} appended rows ({summary['rows']} in total)")
+    click.echo(f"Model artifact saved to {output}")
+    return True
+
+
+def _show_welcome() -> None:
+    click.echo(WELCOME_MESSAGE)
+    click.echo("Use **poetry run python src/cli.py --help** to see all options.")
+
+
+def _save_profile(profiler: Profiler, path: str) -> None:
+    profiler.stop()
+    profiler.save(path)
+    click.echo(f"Profile trace written to {path}", err=True)
+
+
+@click.group(
+    cls=DefaultCommandGroup,
+    default_command="evaluate",
+    invoke_without_command=True,
+    context_settings={"ignore_unknown_options": True},
+)
+@click.option("--profile", "profile_path", help="Write a JSON trace of the time and memory of every pipeline stage")
+@click.option("--profile-memory", is_flag=True, help="Also trace Python allocations per stage (slower)")
+@click.option("--cprofile-dir", help="With --profile, also write a cProfile dump of every top-level stage here")
+@click.option(
+    "--n-jobs",
+    "n_jobs",
+    type=int,
+    help=(
+        f"Cores used by models, worker pools and BLAS/OpenMP threads together (default: ${N_JOBS_ENV} or all); "
+        "every command sizes its worker pool from it"
+    ),
+)
+@click.pass_context
+def main(ctx: click.Context, profile_path: str, profile_memory: bool, cprofile_dir: str, n_jobs: int) -> None:
+    """Command-line interface for training, evaluating and serving models on the titanic dataset."""
+    if ctx.invoked_subcommand is not None:
+        configure_resources(n_jobs)
+    if profile_path:
+        profiler = Profiler(trace_memory=profile_memory, cprofile_dir=cprofile_dir)
+        profiler.start()
+        ctx.call_on_close(lambda: _save_profile(profiler, profile_path))
+    if ctx.invoked_subcommand is None:
+        _show_welcome()
+
+
+@main.command()
 @click.argument("file_path", required=False)
 @click.option(
     "--model",
     default="logistic_regression",
-    help="Choose a model: gender_baseline, random_forest, gradient_boosting, logistic_regression",
+    help=(
+        "Choose a model: gender_baseline, random_forest, gradient_boosting, hist_gradient_boosting, "
+        "logistic_regression, sgd_logistic, or all"
+    ),
 )
 @click.option(
     "--metric",
@@ -47,28 +271,97 @@
     type=click.Choice(["accuracy", "precision", "recall", "f1", "all"], case_sensitive=False),
     help="Evaluation metric to use",
 )
-def main(file_path: str, model: str, metric: str) -> None:
-    """Command-line interface for training and evaluating machine learning models using the titanic dataset.
+@click.option("--no-cache", is_flag=True, help="Always parse and preprocess the file instead of using the cache")
+@click.option("--quarantine", type=click.Path(dir_okay=False), help="Drop rows violating the schema, saved to this CSV")
+@click.option("--config", "config_path", help="Model configuration written by the tune command; overrides --model")
+@click.option("--cv", type=click.IntRange(min=2), help="Run stratified K-fold cross-validation with K folds")
+@click.option(
+    "--bootstrap",
+    type=click.IntRange(min=2),
+    help="Report 95% confidence intervals of the holdout metrics from this many bootstrap resamples",
+)
+@click.option(
+    "--sweep-thresholds",
+    is_flag=True,
+    help="Report ROC-AUC, PR-AUC and the probability threshold maximizing --metric instead of scoring at 0.5",
+)
+def evaluate(
+    file_path: str,
+    model: str,
+    metric: str,
+    no_cache: bool,
+    quarantine: str,
+    config_path: str,
+    cv: int,
+    bootstrap: int,
+    sweep_thresholds: bool,
+) -> None:
+    """Trains and evaluates a model on a holdout split of the titanic dataset.
 
     This script trains a specified machine learning model on a dataset and evaluates it using a chosen metric.
 
     Args:
-        file_path (str): The path to the dataset file.
+        file_path (str): The path to the dataset file, a directory of CSV files or a glob pattern.
         model (str): The name of the model to train.
         metric (str): The metric to use for evaluation.
+        no_cache (bool): Whether to bypass the parsed data and feature cache.
+        quarantine (str): When given, rows violating the dataset schema are dropped and written to this CSV.
+        config_path (str): Path of a tuned model configuration to use instead of the model defaults.
+        cv (int): Number of cross-validation folds. When omitted a single 80/20 split is used.
+        bootstrap (int): Number of bootstrap resamples of the holdout predictions used for confidence intervals.
+        sweep_thresholds (bool): Whether to evaluate every decision threshold of the predicted probabilities.
     """
     # Display the welcome message
     if not file_path:
-        click.echo(WELCOME_MESSAGE)
-        click.echo("Use **poetry run python src/cli.py --help** to see all options.")
+        _show_welcome()
         return
 
+    if config_path:
+        model = _config_model_name(config_path)
+    if cv and model == "all":
+        raise click.UsageError("--cv runs a single model; choose one with --model.")
+    if (bootstrap or sweep_thresholds) and (cv or model == "all"):
+        option = "--bootstrap" if bootstrap else "--sweep-thresholds"
+        raise click.UsageError(f"{option} evaluates a single model on the holdout split; drop --cv and --model all.")
+    if bootstrap and sweep_thresholds:
+        raise click.UsageError("Choose either --bootstrap or --sweep-thresholds.")
+
     logging.basicConfig(level=logging.INFO)
 
     try:
-        data_manager = DataManager(file_path)
-        click.echo("Loading data...")
-        data_manager.load_data()
+        data_manager = DataManager(
+            file_path,
+            cache=_make_cache(no_cache),
+            encoding=_feature_encoding(model),
+            dtype=_feature_dtype(model),
+            validation=_validation_mode(quarantine),
+        )
+        _load_data(data_manager, quarantine)
+
+        if cv:
+            click.echo("Engineering features...")
+            # Age imputation is learned per fold, with the column transformer
+            data_manager.engineer_features(impute_age=False)
+            click.echo(f"Cross-validating the {model} model on {cv} folds...")
+            results = cross_validate(data_manager.data, data_manager.get_target(), model, n_splits=cv)
+            click.echo(f"\n{format_cross_validation(results)}")
+            return
+
+        if model == "all":
+            click.echo("Preprocessing data for every feature encoding...")
+            features, target = preprocess_for_models(data_manager.data)
+            click.echo("Splitting data...")
+            splits = {}
+            for key, processed_data in features.items():
+                X_train, X_test, y_train, y_test = train_test_split(
+                    processed_data, target, test_size=0.2, random_state=42
+                )
+                splits[key] = (X_train, X_test)
+            click.echo("Training and evaluating every model...")
+            results = compare_models(splits, y_train, y_test)
+            click.echo(f"\n{format_comparison(results)}")
+            return
+
         click.echo("Preprocessing data...")
         data_manager.preprocess()
         processed_data = data_manager.get_processed_data()
@@ -78,11 +371,26 @@ def main(file_path: str, model: str, metric: str) -> None:
         X_train, X_test, y_train, y_test = train_test_split(processed_data, target, test_size=0.2, random_state=42)
 
         click.echo(f"Training the {model} model...")
-        model_instance = ModelFactory.create_model(model)
+        model_instance = _create_model(model, config_path)
         model_instance.train(X_train, y_train)
 
+        if sweep_thresholds:
+            click.echo("Sweeping the decision thresholds...")
+            metrics = REPORT_METRICS if metric == "all" else (metric,)
+            results = ThresholdSweep(metrics).evaluate(y_test, model_instance.predict_proba(X_test))
+            click.echo(f"\n{format_threshold_sweep(results)}")
+            return
+
         click.echo("Evaluating model accuracy...")
         y_pred = model_instance.predict(X_test)
+        if bootstrap:
+            evaluator = BootstrapEvaluation(bootstrap, random_state=42)
+            results = evaluator.evaluate(y_test, y_pred)
+            metrics = REPORT_METRICS if metric == "all" else (metric,)
+            click.echo(f"\nBootstrap over {bootstrap} resamples of {len(y_test)} predictions:")
+            click.echo(format_bootstrap(results, evaluator.confidence, metrics))
+            return
+
         # accuracy_evaluator = Accuracy()
         if metric == "all":
             full_report_evaluator = FullReport()
@@ -103,5 +411,459 @@ def main(file_path: str, model: str, metric: str) -> None:
         raise
 
 
+@main.command()
+@click.argument("file_path")
+@click.option(
+    "--model",
+    default="logistic_regression",
+    help=(
+        "Choose a model: gender_baseline, random_forest, gradient_boosting, hist_gradient_boosting, "
+        "logistic_regression, sgd_logistic"
+    ),
+)
+@click.option("--output", default=DEFAULT_ARTIFACT_PATH, show_default=True, help="Where to save the model artifact")
+@click.option("--no-cache", is_flag=True, help="Always parse and preprocess the file instead of using the cache")
+@click.option("--quarantine", type=click.Path(dir_okay=False), help="Drop rows violating the schema, saved to this CSV")
+@click.option("--config", "config_path", help="Model configuration written by the tune command; overrides --model")
+@click.option(
+    "--batch-size",
+    type=click.IntRange(min=1),
+    help="Train out of core, streaming the file in batches of this many rows (sgd_logistic only)",
+)
+@click.option("--epochs", default=1, show_default=True, help="Passes over the file when training with --batch-size")
+@click.option(
+    "--full-rebuild",
+    is_flag=True,
+    help="Retrain from scratch even when the artifact at --output can be updated with the rows appended since",
+)
+def train(
+    file_path: str,
+    model: str,
+    output: str,
+    no_cache: bool,
+    quarantine: str,
+    config_path: str,
+    batch_size: int,
+    epochs: int,
+    full_rebuild: bool,
+) -> None:
+    """Trains a model on the whole dataset and saves it with its fitted preprocessor.
+
+    The artifact records the size and row count of the training file. When the artifact at output was
+    trained on the same file with the same model, a later run only updates it with the rows appended to
+    the file since then; the model is retrained from scratch when the earlier rows or the columns have
+    changed, when the new rows hold unseen categories, or with --full-rebuild.
+
+    Args:
+        file_path (str): The path to the training dataset file, a directory of CSV files or a glob pattern.
+        model (str): The name of the model to train.
+        output (str): The path of the artifact file to write.
+        no_cache (bool): Whether to bypass the parsed data and feature cache.
+        quarantine (str): When given, rows violating the dataset schema are dropped and written to this CSV.
+        config_path (str): Path of a tuned model configuration to use instead of the model defaults.
+        batch_size (int): When given, the model is trained incrementally on batches of this many rows.
+        epochs (int): Number of passes over the file when training incrementally.
+        full_rebuild (bool): Whether to retrain from scratch instead of updating the existing artifact.
+    """
+    logging.basicConfig(level=logging.INFO)
+
+    try:
+        if config_path:
+            model = _config_model_name(config_path)
+        if not full_rebuild and _update_saved_artifact(
+            output, file_path, model, config_path, bool(batch_size), quarantine
+        ):
+            return
+        if batch_size:
+            click.echo(f"Training the {model} model out of core in batches of {batch_size} rows...")
+            model_instance, preprocessor, stats = train_incremental(
+                file_path, model, batch_size=batch_size, epochs=epochs, model=_create_model(model, config_path)
+            )
+            click.echo(
+                f"Trained on {stats['rows']} rows in {stats['seconds']:.1f}s ({stats['rows_per_second']:.0f} rows/s)"
+            )
+            metadata = {"training_file": file_path, "training_stats": stats}
+            if os.path.isfile(file_path):
+                metadata["training_data"] = data_state(file_path, stats["rows"] // epochs)
+            ModelArtifact(model, model_instance, preprocessor, metadata).save(output)
+            click.echo(f"Model artifact saved to {output}")
+            return
+
+        data_manager = DataManager(
+            file_path,
+            cache=_make_cache(no_cache),
+            encoding=_feature_encoding(model),
+            dtype=_feature_dtype(model),
+            validation=_validation_mode(quarantine),
+        )
+        _load_data(data_manager, quarantine)
+        click.echo("Preprocessing data...")
+        data_manager.preprocess()
+
+        click.echo(f"Training the {model} model...")
+        model_instance = _create_model(model, config_path)
+        model_instance.train(data_manager.get_processed_data(), data_manager.get_target())
+
+        metadata = {"training_file": file_path}
+        if os.path.isfile(file_path):
+            # Every parsed row, quarantined or not, since appended rows are found by their position in the file
+            parsed_rows = len(data_manager.get_target())
+            if data_manager.quarantined is not None:
+                parsed_rows += len(data_manager.quarantined)
+            metadata["training_data"] = data_state(file_path, parsed_rows)
+        artifact = ModelArtifact(model, model_instance, data_manager.preprocessor, metadata)
+        artifact.save(output)
+        click.echo(f"Model artifact saved to {output}")
+
+    except Exception as e:
+        click.echo(f"An error occurred: {e}")
+        raise
+
+
+@main.command()
+@click.argument("file_path")
+@click.option("--artifact", default=DEFAULT_ARTIFACT_PATH, show_default=True, help="Model artifact to score with")
+@click.option("--output", default="./predictions.csv", show_default=True, help="Where to write the predictions")
+@click.option("--no-cache", is_flag=True, help="Always parse and preprocess the file instead of using the cache")
+@click.option("--quarantine", type=click.Path(dir_okay=False), help="Drop rows violating the schema, saved to this CSV")
+@click.option(
+    "--chunk-size",
+    type=click.IntRange(min=1),
+    help="Score the file in chunks of this many rows with bounded memory, for files larger than RAM",
+)
+def predict(file_path: str, artifact: str, output: str, no_cache: bool, quarantine: str, chunk_size: int) -> None:
+    """Scores a CSV file with a saved model artifact and writes a submission file.
+
+    Args:
+        file_path (str): The path to the dataset file to score, a directory of CSV files or a glob pattern.
+        artifact (str): The path of the model artifact.
+        output (str): The path of the predictions CSV, with PassengerId and Survived columns.
+        no_cache (bool): Whether to bypass the parsed data cache.
+        quarantine (str): When given, rows violating the dataset schema are dropped and written to this CSV.
+        chunk_size (int): When given, the file is streamed through a process pool in chunks of this many rows.
+    """
+    logging.basicConfig(level=logging.INFO)
+
+    try:
+        click.echo("Loading model artifact...")
+        model_artifact = ModelArtifact.load(artifact)
+        if chunk_size or model_artifact.is_incremental:
+            # Models trained out of core are also scored out of core
+            chunk_size = chunk_size or DEFAULT_CHUNK_SIZE
+            click.echo(f"Scoring in chunks of {chunk_size} rows...")
+            rows = score_csv(artifact, file_path, output, chunk_size=chunk_size)
+            click.echo(f"Predictions for {rows} passengers written to {output}")
+            return
+
+        data_manager = DataManager(
+            file_path,
+            preprocessor=model_artifact.preprocessor,
+            cache=_make_cache(no_cache),
+            validation=_validation_mode(quarantine),
+        )
+        _load_data(data_manager, quarantine)
+        click.echo("Preprocessing data...")
+        data_manager.preprocess()
+
+        click.echo(f"Scoring with the {model_artifact.model_name} model...")
+        predictions = model_artifact.model.predict(data_manager.get_processed_data())
+        submission = pd.DataFrame({"PassengerId": data_manager.get_passenger_ids(), "Survived": predictions})
+        submission.to_csv(output, index=False)
+        click.echo(f"Predictions for {len(submission)} passengers written to {output}")
+
+    except Exception as e:
+        click.echo(f"An error occurred: {e}")
+        raise
+
+
+@main.command("tune")
+@click.argument("file_path")
+@click.option("--model", default="random_forest", type=click.Choice(TUNABLE_MODELS), help="Model to tune")
+@click.option(
+    "--resource", default="n_samples", type=click.Choice(TUNING_RESOURCES), help="Budget grown between rounds"
+)
+@click.option("--n-candidates", default=32, show_default=True, help="Configurations sampled in the first round")
+@click.option(
+    "--factor",
+    default=3,
+    type=click.IntRange(min=2),
+    show_default=True,
+    help="Fraction (1/factor) of candidates kept per round",
+)
+@click.option(
+    "--cv",
+    default=3,
+    type=click.IntRange(min=2),
+    show_default=True,
+    help="Cross-validation folds used to score a candidate",
+)
+@click.option(
+    "--metric",
+    default="accuracy",
+    type=click.Choice(["accuracy", "precision", "recall", "f1"], case_sensitive=False),
+    help="Metric used to rank the candidates",
+)
+@click.option("--output", default=DEFAULT_CONFIG_PATH, show_default=True, help="Where to write the best configuration")
+@click.option("--no-cache", is_flag=True, help="Always parse and preprocess the file instead of using the cache")
+@click.option("--quarantine", type=click.Path(dir_okay=False), help="Drop rows violating the schema, saved to this CSV")
+def tune_command(
+    file_path: str,
+    model: str,
+    resource: str,
+    n_candidates: int,
+    factor: int,
+    cv: int,
+    metric: str,
+    output: str,
+    no_cache: bool,
+    quarantine: str,
+) -> None:
+    """Searches the hyperparameters of a model with parallel successive halving.
+
+    The best configuration is written as JSON and can be used with --config by evaluate and train.
+
+    Args:
+        file_path (str): The path to the training dataset file, a directory of CSV files or a glob pattern.
+        model (str): The name of the model to tune.
+        resource (str): The budget grown between rounds, n_samples or n_estimators.
+        n_candidates (int): Number of configurations sampled in the first round.
+        factor (int): Halving factor between rounds.
+        cv (int): Number of cross-validation folds used to score a candidate.
+        metric (str): The metric used to rank the candidates.
+        output (str): The path of the configuration file to write.
+        no_cache (bool): Whether to bypass the parsed data and feature cache.
+        quarantine (str): When given, rows violating the dataset schema are dropped and written to this CSV.
+    """
+    logging.basicConfig(level=logging.INFO)
+
+    try:
+        data_manager = DataManager(
+            file_path,
+            cache=_make_cache(no_cache),
+            dtype=_feature_dtype(model),
+            validation=_validation_mode(quarantine),
+        )
+        _load_data(data_manager, quarantine)
+        click.echo("Preprocessing data...")
+        data_manager.preprocess()
+
+        click.echo(f"Tuning the {model} model on {resource}...")
+        config = tune(
+            data_manager.get_processed_data(),
+            data_manager.get_target(),
+            model,
+            resource=resource,
+            n_candidates=n_candidates,
+            factor=factor,
+            cv=cv,
+            scoring=metric,
+        )
+        save_config(config, output)
+        click.echo(f"Best {metric}: {config['score']:.4f} after {config['n_rounds']} rounds ({config['seconds']:.1f}s)")
+        click.echo(f"Best parameters: {config['params']}")
+        click.echo(f"Configuration written to {output}")
+
+    except Exception as e:
+        click.echo(f"An error occurred: {e}")
+        raise
+
+
+@main.command()
+@click.argument("file_path")
+@click.option("--artifact", default=DEFAULT_ARTIFACT_PATH, show_default=True, help="Model artifact to explain")
+@click.option("--n-repeats", default=5, show_default=True, type=click.IntRange(min=1), help="Shuffles per feature")
+@click.option(
+    "--metric",
+    default="accuracy",
+    type=click.Choice(REPORT_METRICS, case_sensitive=False),
+    help="Metric whose drop measures the importance",
+)
+@click.option("--random-state", default=42, show_default=True, help="Seed of the shuffles")
+@click.option("--no-cache", is_flag=True, help="Always parse and preprocess the file instead of using the cache")
+@click.option("--quarantine", type=click.Path(dir_okay=False), help="Drop rows violating the schema, saved to this CSV")
+def importance(
+    file_path: str,
+    artifact: str,
+    n_repeats: int,
+    metric: str,
+    random_state: int,
+    no_cache: bool,
+    quarantine: str,
+) -> None:
+    """Ranks the features of a saved model by permutation importance on a labeled CSV file.
+
+    Every engineered feature (Age, Fare, Title, ...) is shuffled as a whole, including all of its
+    one-hot columns, and the drop of the metric against the unshuffled baseline is averaged over
+    the repeats. The features and repeats are spread over a process pool.
+
+    Args:
+        file_path (str): The path to a labeled dataset file, a directory of CSV files or a glob pattern.
+        artifact (str): The path of the model artifact.
+        n_repeats (int): Number of shuffles per feature.
+        metric (str): The metric whose drop measures the importance.
+        random_state (int): Seed of the shuffles.
+        no_cache (bool): Whether to bypass the parsed data and feature cache.
+        quarantine (str): When given, rows violating the dataset schema are dropped and written to this CSV.
+    """
+    logging.basicConfig(level=logging.INFO)
+
+    try:
+        click.echo("Loading model artifact...")
+        model_artifact = ModelArtifact.load(artifact)
+        if model_artifact.is_incremental:
+            data_manager = DataManager(file_path, cache=_make_cache(no_cache), validation=_validation_mode(quarantine))
+            _load_data(data_manager, quarantine)
+            click.echo("Preprocessing data...")
+            features = model_artifact.preprocessor.transform(data_manager.data)
+            target = data_manager.data["Survived"].to_numpy()
+        else:
+            data_manager = DataManager(
+                file_path,
+                preprocessor=model_artifact.preprocessor,
+                cache=_make_cache(no_cache),
+                validation=_validation_mode(quarantine),
+            )
+            _load_data(data_manager, quarantine)
+            click.echo("Preprocessing data...")
+            data_manager.preprocess()
+            features, target = data_manager.get_processed_data(), data_manager.get_target()
+
+        click.echo(f"Permuting the features of the {model_artifact.model_name} model {n_repeats} times each...")
+        results = permutation_importance(
+            model_artifact.model,
+            features,
+            target,
+            model_artifact.preprocessor.feature_names,
+            n_repeats=n_repeats,
+            metric=metric,
+            random_state=random_state,
+        )
+        click.echo(f"\n{format_importance(results)}")
+        click.echo(f"Computed in {results['seconds']:.1f}s")
+
+    except Exception as e:
+        click.echo(f"An error occurred: {e}")
+        raise
+
+
+@main.command()
+@click.argument("spec_path", type=click.Path(exists=True, dir_okay=False))
+@click.option("--db", "db_path", default=DEFAULT_RESULTS_PATH, show_default=True, help="SQLite results database")
+@click.option("--no-cache", is_flag=True, help="Always parse and preprocess the data instead of using the cache")
+def experiment(spec_path: str, db_path: str, no_cache: bool) -> None:
+    """Runs a sweep of models, seeds and test sizes, storing the metrics and timings of every run.
+
+    The sweep is a JSON file with the "data" and the "models", and optionally the "seeds", the
+    "test_sizes", per-model "params" and a "name". Each run is written to the SQLite database as
+    soon as it finishes; rerunning the command skips the completed runs and retries failed ones.
+
+    Args:
+        spec_path (str): The path of the sweep specification.
+        db_path (str): The path of the SQLite results database.
+        no_cache (bool): Whether to bypass the parsed data and feature cache.
+    """
+    logging.basicConfig(level=logging.INFO)
+
+    try:
+        spec = load_sweep(spec_path)
+        click.echo(f"Running sweep {spec['name']}...")
+        summary = run_sweep(spec, db_path, cache=_make_cache(no_cache))
+        click.echo(
+            f"{summary['completed']} runs completed, {summary['failed']} failed and {summary['skipped']} skipped "
+            f"(already completed) of {summary['runs']} in {summary['seconds']:.1f}s"
+        )
+        click.echo(f"Results stored in {db_path}")
+
+    except Exception as e:
+        click.echo(f"An error occurred: {e}")
+        raise
+
+
+@main.command()
+@click.option("--db", "db_path", default=DEFAULT_RESULTS_PATH, show_default=True, help="SQLite results database")
+@click.option(
+    "--metric",
+    default="accuracy",
+    type=click.Choice(REPORT_METRICS, case_sensitive=False),
+    help="Metric to summarize",
+)
+@click.option(
+    "--group-by",
+    multiple=True,
+    type=click.Choice(RESULT_GROUP_COLUMNS),
+    help="Column to group the runs by, repeatable (default: model and test_size)",
+)
+@click.option("--sweep", help="Only summarize the runs of this sweep")
+def results(db_path: str, metric: str, group_by: tuple, sweep: str) -> None:
+    """Summarizes the stored experiment results per group, best mean metric first.
+
+    Args:
+        db_path (str): The path of the SQLite results database.
+        metric (str): The metric to summarize.
+        group_by (tuple): The columns defining the groups.
+        sweep (str): When given, only the runs of this sweep are summarized.
+    """
+    if not os.path.exists(db_path):
+        raise click.UsageError(f"No results database at {db_path}; run the experiment command first.")
+    store = ResultStore(db_path)
+    click.echo(format_summary(store.summarize(metric, group_by or ("model", "test_size"), sweep), metric))
+    failures = store.failures(sweep)
+    if failures:
+        click.echo(f"\n{len(failures)} failed runs:")
+        for model, seed, test_size, error in failures:
+            click.echo(f"  {model} (seed {seed}, test size {test_size}): {error}")
+
+
+@main.command()
+@click.option("--artifact", default=DEFAULT_ARTIFACT_PATH, show_default=True, help="Model artifact to serve")
+@click.option("--host", default="127.0.0.1", show_default=True, help="Interface to listen on")
+@click.option("--port", default=8000, show_default=True, help="Port to listen on")
+@click.option("--max-batch-size", default=64, show_default=True, help="Maximum passengers per predict call")
+@click.option("--max-wait-ms", default=2.0, show_default=True, help="Maximum time a request waits for its batch")
+def serve(artifact: str, host: str, port: int, max_batch_size: int, max_wait_ms: float) -> None:
+    """Serves online predictions over HTTP, batching concurrent requests into one predict call.
+
+    Args:
+        artifact (str): The path of the model artifact, loaded once at startup.
+        host (str): The interface to listen on.
+        port (int): The port to listen on.
+        max_batch_size (int): Maximum number of passengers scored per predict call.
+        max_wait_ms (float): Maximum milliseconds a request waits for its batch to fill up.
+    """
+    logging.basicConfig(level=logging.INFO)
+
+    click.echo("Loading model artifact...")
+    model_artifact = ModelArtifact.load(artifact)
+    server = PredictionServer(model_artifact, host, port, max_batch_size, max_wait_ms / 1000)
+    click.echo(f"Serving the {model_artifact.model_name} model on http://{host}:{port} (POST /predict, GET /metrics)")
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        click.echo("Server stopped.")
+
+
+@main.command()
+@click.option("--artifact", default=DEFAULT_ARTIFACT_PATH, show_default=True, help="Model artifact to compile")
+@click.option("--output", default="./artifacts/model.npz", show_default=True, help="Where to write the NumPy model")
+def export(artifact: str, output: str) -> None:
+    """Compiles a saved artifact into plain NumPy arrays for fast, sklearn-free scoring.
+
+    Args:
+        artifact (str): The path of the model artifact.
+        output (str): The path of the ``.npz`` file to write.
+    """
+    logging.basicConfig(level=logging.INFO)
+
+    try:
+        model_artifact = ModelArtifact.load(artifact)
+        predictor = NumpyPredictor.from_artifact(model_artifact)
+        predictor.save(output)
+        click.echo(f"NumPy predictor for the {model_artifact.model_name} model written to {output}")
+
+    except Exception as e:
+        click.echo(f"An error occurred: {e}")
+        raise
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,176 @@
+import time
+
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from joblib import Parallel, delayed
+from sklearn.model_selection import StratifiedKFold
+
+from src.data_manager import CATEGORICAL_FEATURES, FEATURE_CATEGORIES, NUMERIC_FEATURES, FeaturePreprocessor
+from src.evaluation import REPORT_METRICS, FullReport
+from src.models.model_factory import ModelFactory
+from src.parallel import shared_arrays
+from src.resources import get_n_jobs, split_n_jobs, worker_limits
+
+
+def encode_features(features: pd.DataFrame) -> np.ndarray:
+    """Encodes engineered features as one numeric matrix that folds can slice without copying.
+
+    Numeric features are kept as they are, including missing ages; categorical features are replaced
+    by their position in FEATURE_CATEGORIES, with missing values coded as the "missing" category and
+    unknown values as -1. decode_features() turns rows of the matrix back into engineered features.
+
+    Args:
+        features (pd.DataFrame): Output of DataManager.engineer_features(impute_age=False).
+
+    Returns:
+        np.ndarray: A float64 matrix with NUMERIC_FEATURES followed by CATEGORICAL_FEATURES codes.
+    """
+    encoded = np.empty((len(features), len(NUMERIC_FEATURES) + len(CATEGORICAL_FEATURES)))
+    encoded[:, : len(NUMERIC_FEATURES)] = features[NUMERIC_FEATURES].to_numpy(dtype=np.float64)
+    for position, column in enumerate(CATEGORICAL_FEATURES, start=len(NUMERIC_FEATURES)):
+        values = features[column].astype(object).fillna("missing")
+        encoded[:, position] = pd.Categorical(values, categories=FEATURE_CATEGORIES[column]).codes
+    return encoded
+
+
+def decode_features(encoded: np.ndarray) -> pd.DataFrame:
+    """Turns rows of encode_features() output back into engineered features; unknown categories become missing."""
+    features = pd.DataFrame(encoded[:, : len(NUMERIC_FEATURES)], columns=NUMERIC_FEATURES)
+    for position, column in enumerate(CATEGORICAL_FEATURES, start=len(NUMERIC_FEATURES)):
+        # Code -1 picks the trailing NaN
+        categories = np.array([*FEATURE_CATEGORIES[column], np.nan], dtype=object)
+        features[column] = categories[encoded[:, position].astype(np.intp)]
+    return features
+
+
+def run_fold(
+    model_name: str,
+    fold: int,
+    features: np.ndarray,
+    target: np.ndarray,
+    n_rows: int,
+    start: int,
+    stop: int,
+    n_threads: Optional[int] = None,
+) -> dict:
+    """Fits the preprocessing and the model on one fold and evaluates it on the held-out rows.
+
+    ``features`` and ``target`` hold the fold-ordered rows twice in a row, so both the held-out
+    rows ``[start, stop)`` and the training rows (``[stop, n_rows + start)``, wrapping around)
+    are contiguous slices, i.e. views of the shared matrix. A FeaturePreprocessor with the model's
+    feature encoding and dtype learns the age imputation table and the DataManager column
+    transformer from the training rows only, and transforms both splits with them. The model and
+    the BLAS/OpenMP pools use at most n_threads threads, by default the whole core budget.
+
+    Returns:
+        dict: The fold number, every metric of the full report and the wall times in seconds.
+    """
+    test, y_test = decode_features(features[start:stop]), target[start:stop]
+    train, y_train = decode_features(features[stop : n_rows + start]), target[stop : n_rows + start]
+
+    begin = time.perf_counter()
+    preprocessor = FeaturePreprocessor(
+        ModelFactory.feature_encoding(model_name), ModelFactory.feature_dtype(model_name)
+    )
+    preprocessor.fit_age_means(train)
+    train["Age"], test["Age"] = preprocessor.impute_age(train), preprocessor.impute_age(test)
+    preprocessor.transformer = preprocessor.build_transformer()
+    X_train = preprocessor.to_feature_matrix(preprocessor.transformer.fit_transform(train))
+    X_test = preprocessor.to_feature_matrix(preprocessor.transformer.transform(test))
+    preprocess_seconds = time.perf_counter() - begin
+
+    with worker_limits(n_threads or get_n_jobs()):
+        model = ModelFactory.create_model(model_name)
+        begin = time.perf_counter()
+        model.train(X_train, y_train)
+        train_seconds = time.perf_counter() - begin
+
+        begin = time.perf_counter()
+        y_pred = model.predict(X_test)
+        predict_seconds = time.perf_counter() - begin
+
+    scores = dict(zip(REPORT_METRICS, FullReport().evaluate(y_test, y_pred)))
+    return {
+        "fold": fold,
+        **scores,
+        "preprocess_seconds": preprocess_seconds,
+        "train_seconds": train_seconds,
+        "predict_seconds": predict_seconds,
+    }
+
+
+def cross_validate(
+    features: pd.DataFrame,
+    target: np.ndarray,
+    model_name: str,
+    n_splits: int = 5,
+    n_jobs: Optional[int] = None,
+    random_state: int = 42,
+) -> list:
+    """Runs stratified k-fold cross-validation of a model, one fold per worker process.
+
+    The rows are encoded once and reordered so that every fold is a contiguous block. The reordered
+    matrix is stored twice in a row in shared memory, which makes each fold's training rows a single
+    contiguous slice as well; workers therefore slice views and never copy the data. The age
+    imputation and the column transformer are fitted on the training rows of each fold only, so no
+    statistics leak from the held-out rows, and the features are encoded as the model expects
+    (e.g. ordinal for hist_gradient_boosting).
+
+    Args:
+        features (pd.DataFrame): Output of DataManager.engineer_features(impute_age=False). Features
+            whose ages are already imputed work as well, but then the imputation saw every fold.
+        target (np.ndarray): Target values.
+        model_name (str): The ModelFactory name of the model.
+        n_splits (int): Number of folds.
+        n_jobs (int, optional): Number of worker processes within the core budget of src.resources,
+            None or -1 for the whole budget.
+        random_state (int): Seed of the fold shuffling.
+
+    Returns:
+        list: One result dict per fold.
+    """
+    target = np.asarray(target)
+    fold_ids = np.empty(len(target), dtype=np.intp)
+    splitter = StratifiedKFold(n_splits=n_splits, shuffle=True, random_state=random_state)
+    for fold, (_, test_index) in enumerate(splitter.split(np.zeros(len(target)), target)):
+        fold_ids[test_index] = fold
+
+    order = np.argsort(fold_ids, kind="stable")
+    boundaries = np.concatenate([[0], np.cumsum(np.bincount(fold_ids, minlength=n_splits))])
+    encoded = encode_features(features)[order]
+    n_rows = len(encoded)
+
+    workers, n_threads = split_n_jobs(n_jobs, n_splits)
+    with shared_arrays(np.concatenate([encoded, encoded]), np.concatenate([target[order], target[order]])) as shared:
+        return Parallel(n_jobs=workers)(
+            delayed(run_fold)(model_name, fold, *shared, n_rows, boundaries[fold], boundaries[fold + 1], n_threads)
+            for fold in range(n_splits)
+        )
+
+
+def summarize(results: list) -> dict:
+    """Returns the mean and standard deviation of every metric across folds."""
+    summary = {}
+    for metric in REPORT_METRICS:
+        scores = [result[metric] for result in results]
+        summary[metric] = (float(np.mean(scores)), float(np.std(scores)))
+    return summary
+
+
+def format_cross_validation(results: list) -> str:
+    """Formats the per-fold results and their summary as text."""
+    metrics = "".join(f"{metric:>11}" for metric in REPORT_METRICS)
+    lines = [f"{'fold':<6}{metrics}{'prep (s)':>10}{'train (s)':>11}{'pred (s)':>10}"]
+    for result in results:
+        scores = "".join(f"{result[metric]:>11.4f}" for metric in REPORT_METRICS)
+        lines.append(
+            f"{result['fold']:<6}{scores}{result['preprocess_seconds']:>10.3f}"
+            f"{result['train_seconds']:>11.3f}{result['predict_seconds']:>10.4f}"
+        )
+    lines.append("")
+    for metric, (mean, std) in summarize(results).items():
+        lines.append(f"{metric:<10} {mean:.4f} +/- {std:.4f}")
+    return "\n".join(lines)
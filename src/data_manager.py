@@ -1,13 +1,248 @@
+import glob
 import logging
-import re
+import os
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, Optional, Union
 
 import numpy as np
 import pandas as pd
 
+from scipy import sparse
 from sklearn.compose import ColumnTransformer
 from sklearn.impute import SimpleImputer
 from sklearn.pipeline import Pipeline
-from sklearn.preprocessing import OneHotEncoder, StandardScaler
+from sklearn.preprocessing import OneHotEncoder, OrdinalEncoder, StandardScaler
+
+from src.cache import DataCache
+from src.profiling import profiled
+from src.resources import get_n_jobs
+from src.schema import VALIDATION_MODES, SchemaValidator, ValidationReport
+
+# Bump whenever a change to the preprocessing alters its output, so cached features are not reused
+PIPELINE_VERSION = "4"
+# CSV parser used by load_data(): None for the pandas default, or "pyarrow" (multithreaded, optional dependency)
+DEFAULT_CSV_ENGINE = os.environ.get("TITANIC_CSV_ENGINE")
+
+TITLE_PATTERN = r"\b(\w+\.)"
+# Maps every title kept as a feature (including its aliases) to its bucket; anything else is "Other".
+TITLE_BUCKETS = {
+    "Mr.": "Mr.",
+    "Miss.": "Miss.",
+    "Mrs.": "Mrs.",
+    "Master.": "Master.",
+    "Mlle.": "Miss.",
+    "Ms.": "Miss.",
+    "Mme.": "Mrs.",
+    "Lady.": "Mrs.",
+}
+# Raw input columns the features are derived from; PassengerId is only used to identify predictions
+INPUT_COLUMNS = ["PassengerId", "Pclass", "Name", "Sex", "Age", "SibSp", "Parch", "Fare", "Embarked"]
+NUMERIC_FEATURES = ["Age", "Fare", "SibSp", "Parch", "FamilySize"]
+CATEGORICAL_FEATURES = ["Pclass", "Sex", "Embarked", "Title", "IsAlone"]
+# How the categorical features are encoded: one column per category, or one integer code column per
+# feature for models that split on categories natively (missing and unseen categories become NaN)
+FEATURE_ENCODINGS = ("onehot", "ordinal")
+# Categories of every categorical feature, fixed so the encoded columns and their names are the same for any data:
+# the Pclass, Sex and Embarked values allowed by src.schema.PassengerRecord (plus "missing" for Embarked), the title
+# buckets and the IsAlone flag. Other values are encoded like unseen categories.
+FEATURE_CATEGORIES = {
+    "Pclass": [1, 2, 3],
+    "Sex": ["female", "male"],
+    "Embarked": ["C", "Q", "S", "missing"],
+    "Title": sorted({*TITLE_BUCKETS.values(), "Other"}),
+    "IsAlone": [0, 1],
+}
+# The feature-matrix contract of preprocess(): a C-contiguous matrix of one of these dtypes (float32 by default),
+# dense, or CSR when sparse output is configured, whose columns are named by encoded_feature_names()
+FEATURE_DTYPES = ("float32", "float64")
+# Compact dtypes of the columns parsed from a CSV file; every other column (Ticket, Cabin) is skipped
+# at parse time. The integer columns hold small counts and codes, so int8 is enough, and PassengerId
+# is kept because predictions are written per passenger.
+# The integer columns are parsed as float64 (PARSE_DTYPES), which holds missing cells and any value as
+# written, and compact_dtypes() then narrows every column whose values all fit its compact dtype. A column
+# with a missing, fractional or out-of-range value stays float64 until validation has removed the row.
+CSV_DTYPES = {
+    "PassengerId": "int32",
+    "Survived": "int8",
+    "Pclass": "int8",
+    "Name": "object",
+    "Sex": "category",
+    "Age": "float32",
+    "SibSp": "int8",
+    "Parch": "int8",
+    "Fare": "float32",
+    "Embarked": "category",
+}
+PARSE_DTYPES = {column: "float64" if dtype.startswith("int") else dtype for column, dtype in CSV_DTYPES.items()}
+
+
+class FeaturePreprocessor:
+    """Holds the preprocessing state learned from the training data.
+
+    The state consists of the mean age per (Title, Pclass) group used for age imputation, with the
+    number of known ages behind every mean so the means can be updated with new rows, and the
+    fitted ColumnTransformer. A DataManager built with a fitted FeaturePreprocessor reuses this state
+    instead of refitting it, so unseen data is transformed exactly like the training data.
+    """
+
+    # Class-level defaults so preprocessors pickled before encodings, age counts and the feature-matrix
+    # contract existed still load (and keep producing the float64 matrices their models were trained on)
+    encoding = "onehot"
+    age_counts: Optional[pd.Series] = None
+    dtype = "float64"
+    sparse = False
+
+    def __init__(self, encoding: str = "onehot", dtype: str = "float32", sparse: bool = False) -> None:
+        """Initializes an unfitted FeaturePreprocessor.
+
+        Args:
+            encoding (str): Encoding of the categorical features, one of FEATURE_ENCODINGS.
+            dtype (str): dtype of the feature matrix, one of FEATURE_DTYPES.
+            sparse (bool): Whether the feature matrix is a CSR matrix instead of a dense array.
+
+        Raises:
+            ValueError: If the encoding or the dtype is unknown.
+        """
+        if encoding not in FEATURE_ENCODINGS:
+            raise ValueError(f"Unknown feature encoding {encoding}. Choose one of: {', '.join(FEATURE_ENCODINGS)}")
+        if dtype not in FEATURE_DTYPES:
+            raise ValueError(f"Unknown feature dtype {dtype}. Choose one of: {', '.join(FEATURE_DTYPES)}")
+        self.encoding = encoding
+        self.dtype = dtype
+        self.sparse = sparse
+        self.age_means: Optional[pd.Series] = None
+        self.age_counts: Optional[pd.Series] = None
+        self.fallback_age: Optional[float] = None
+        self.transformer: Optional[ColumnTransformer] = None
+
+    @property
+    def is_fitted(self) -> bool:
+        """Returns whether both the age imputation table and the column transformer are fitted."""
+        return self.age_means is not None and self.transformer is not None
+
+    @property
+    def feature_names(self) -> list:
+        """Returns the names of the transformed feature columns.
+
+        Raises:
+            ValueError: If the preprocessor is not fitted yet.
+        """
+        if self.transformer is None:
+            raise ValueError("Preprocessor not fitted. Please run DataManager.preprocess() first.")
+        return list(self.transformer.get_feature_names_out())
+
+    @property
+    def feature_schema(self) -> dict:
+        """Returns the input and output feature schema of the preprocessor."""
+        return {
+            "numeric_features": list(NUMERIC_FEATURES),
+            "categorical_features": list(CATEGORICAL_FEATURES),
+            "encoding": self.encoding,
+            "dtype": self.dtype,
+            "sparse": self.sparse,
+            "feature_names": self.feature_names,
+        }
+
+    def to_feature_matrix(self, X: object) -> object:
+        """Converts the output of the column transformer to the feature-matrix contract of the preprocessor.
+
+        This is the only conversion between the transformer and the models: a matrix that already
+        has the contract's dtype and layout is returned as is.
+
+        Args:
+            X: A dense array or a sparse matrix with the transformed features.
+
+        Returns:
+            A C-contiguous np.ndarray of the preprocessor's dtype, or a CSR matrix of that dtype when sparse.
+        """
+        if self.sparse:
+            return sparse.csr_matrix(X, dtype=self.dtype, copy=False)
+        if sparse.issparse(X):
+            return X.toarray(order="C").astype(self.dtype, copy=False)
+        return np.ascontiguousarray(X, dtype=self.dtype)
+
+    def fit_age_means(self, data: pd.DataFrame) -> None:
+        """Learns the mean age per (Title, Pclass) group, with the number of known ages behind every mean.
+
+        Args:
+            data (pd.DataFrame): Rows with Title, Pclass and (possibly missing) Age columns.
+        """
+        groups = data.groupby(["Title", "Pclass"], sort=False)["Age"]
+        self.age_means = groups.mean()
+        self.age_counts = groups.count()
+        self.fallback_age = float(data["Age"].mean())
+
+    def impute_age(self, data: pd.DataFrame) -> pd.Series:
+        """Returns the Age column with every missing age replaced by the mean of its (Title, Pclass) group.
+
+        Rows of groups without a known age get the mean of all known ages.
+
+        Args:
+            data (pd.DataFrame): Rows with Title, Pclass and (possibly missing) Age columns.
+        """
+        keys = pd.MultiIndex.from_arrays([data["Title"], data["Pclass"]])
+        mean_ages = pd.Series(self.age_means.reindex(keys).to_numpy(), index=data.index)
+        return data["Age"].fillna(mean_ages.fillna(self.fallback_age))
+
+    def build_transformer(self) -> ColumnTransformer:
+        """Returns an unfitted column transformer for the preprocessor's encoding and sparsity.
+
+        The numeric features are median-imputed and standardized. The categorical features are
+        encoded with FEATURE_CATEGORIES, so the columns are encoded_feature_names(self.encoding).
+        """
+        numeric_transformer = Pipeline(
+            steps=[
+                ("imputer", SimpleImputer(strategy="median")),
+                ("scaler", StandardScaler()),
+            ]
+        )
+
+        categories = [FEATURE_CATEGORIES[feature] for feature in CATEGORICAL_FEATURES]
+        if self.encoding == "ordinal":
+            encoder = (
+                "ordinal",
+                OrdinalEncoder(
+                    categories=categories,
+                    handle_unknown="use_encoded_value",
+                    unknown_value=np.nan,
+                    encoded_missing_value=np.nan,
+                ),
+            )
+        else:
+            encoder = ("onehot", OneHotEncoder(categories=categories, handle_unknown="ignore"))
+        categorical_transformer = Pipeline(
+            steps=[
+                ("imputer", SimpleImputer(strategy="constant", fill_value="missing")),
+                encoder,
+            ]
+        )
+
+        return ColumnTransformer(
+            transformers=[
+                ("num", numeric_transformer, NUMERIC_FEATURES),
+                ("cat", categorical_transformer, CATEGORICAL_FEATURES),
+            ],
+            sparse_threshold=1.0 if self.sparse else 0.0,
+        )
+
+    def update_age_means(self, data: pd.DataFrame) -> None:
+        """Folds the known ages of new rows into the age imputation table, as if it had been learned on all rows.
+
+        Args:
+            data (pd.DataFrame): New rows with Title, Pclass and (possibly missing) Age columns.
+
+        Raises:
+            ValueError: If the preprocessor is not fitted or predates the stored age counts.
+        """
+        if self.age_means is None or self.age_counts is None:
+            raise ValueError("The age imputation table has no counts and cannot be updated; refit the preprocessor.")
+        groups = data.groupby(["Title", "Pclass"], sort=False)["Age"]
+        counts = self.age_counts.add(groups.count(), fill_value=0)
+        sums = (self.age_means * self.age_counts).fillna(0).add(groups.sum(), fill_value=0)
+        self.age_means = (sums / counts.where(counts > 0)).astype(self.age_means.dtype)
+        self.age_counts = counts.astype(self.age_counts.dtype)
+        self.fallback_age = float(sums.sum() / counts.sum())
 
 
 class DataManager:
@@ -17,16 +252,55 @@ class DataManager:
     feature transformation, and keeping track of the target variable.
     """
 
-    def __init__(self, filepath: str) -> None:
+    def __init__(
+        self,
+        filepath: Optional[str],
+        preprocessor: Optional[FeaturePreprocessor] = None,
+        cache: Optional[DataCache] = None,
+        engine: Optional[str] = DEFAULT_CSV_ENGINE,
+        encoding: str = "onehot",
+        validation: Optional[str] = "report",
+        dtype: str = "float32",
+        sparse: bool = False,
+    ) -> None:
         """Initializes the DataManager with the specified file path.
 
         Args:
-            filepath (str): Path to the data file.
+            filepath (str, optional): Path to the data file, or a directory or glob pattern of CSV shards.
+                None when the data is given to load_frame() instead.
+            preprocessor (FeaturePreprocessor, optional): A fitted preprocessor to reuse. When omitted,
+                a new one is fitted on the data during preprocess().
+            cache (DataCache, optional): Cache for the parsed file and, when fitting, the processed data.
+            engine (str, optional): pandas CSV parser, e.g. "pyarrow". Defaults to the TITANIC_CSV_ENGINE
+                environment variable, or the pandas default parser when it is not set.
+            encoding (str): Encoding of the categorical features when a new preprocessor is fitted:
+                "onehot", or "ordinal" for models with native categorical support. A given preprocessor
+                keeps its own encoding.
+            validation (str, optional): What load_data() does with rows violating the dataset schema
+                (src.schema.PassengerRecord): "report" logs them, "quarantine" also moves them out of the
+                data into the quarantined property, "raise" fails the load. None skips the validation.
+            dtype (str): dtype of the processed feature matrix when a new preprocessor is fitted, "float32"
+                or "float64" for models that compute in double precision (see BaseModel.feature_dtype).
+            sparse (bool): Whether a newly fitted preprocessor outputs a CSR matrix instead of a dense array.
+
+        Raises:
+            ValueError: If the validation mode, the encoding or the dtype is unknown.
         """
+        if validation is not None and validation not in VALIDATION_MODES:
+            raise ValueError(f"Unknown validation mode {validation}. Choose one of: {', '.join(VALIDATION_MODES)}")
         self.filepath = filepath
+        self.cache = cache
+        self.engine = engine
+        self.load_errors = []
+        self.validation = validation
+        self._validation_report = None
+        self._quarantined = None
+        self._cache_key = None
+        self._preprocessor = preprocessor if preprocessor is not None else FeaturePreprocessor(encoding, dtype, sparse)
         self._data = None
         self._processed_data = None
         self._target = None
+        self._passenger_ids = None
 
     @property
     def data(self) -> pd.DataFrame:
@@ -52,22 +326,100 @@ def processed_data(self) -> np.ndarray:
         else:
             raise ValueError("Data not processed. Please run preprocess() method first.")
 
+    @property
+    def validation_report(self) -> Optional[ValidationReport]:
+        """Returns the schema validation report of the loaded data, None when it was not validated."""
+        return self._validation_report
+
+    @property
+    def quarantined(self) -> Optional[pd.DataFrame]:
+        """Returns the rows removed from the data by the "quarantine" validation, None when none were."""
+        return self._quarantined
+
+    @property
+    def preprocessor(self) -> FeaturePreprocessor:
+        """Returns the preprocessor, which is fitted once preprocess() has run."""
+        return self._preprocessor
+
+    @profiled(rows=lambda self: len(self._data))
     def load_data(self) -> None:
         """Loads data from the specified file path.
 
         The method tries to load the dataset into a pandas DataFrame. It logs
         and raises an exception if an error occurs during file loading.
 
+        Only the columns of CSV_DTYPES are parsed, and every column whose values fit is stored in
+        its compact dtype (see compact_dtypes()).
+
+        When the file path is a directory or a glob pattern, every matching CSV shard is parsed
+        concurrently and the shards are concatenated in path order. Shards that cannot be parsed or
+        whose columns differ from the others are skipped and listed in load_errors; the result is
+        then not cached, so the problem is reported again on the next load.
+
+        The loaded rows are then validated against the dataset schema with vectorized column checks,
+        as configured by the validation mode. The integer columns are validated on their values as
+        written, and narrowed to their compact dtypes once quarantined rows are removed. Values that
+        are not numbers at all (e.g. text in an integer column) already fail the parsing.
+
         Raises:
             Exception: If an error occurs during data loading.
         """
         try:
-            self._data = pd.read_csv(self.filepath)
-            logging.info("Data loaded successfully.")
+            if self.filepath is None:
+                raise ValueError("The DataManager has no file path; give it the data with load_frame().")
+            paths = resolve_paths(self.filepath)
+            self._data = None
+            if self.cache is not None:
+                self._cache_key = self.cache.files_digest(paths)
+                self._data = self.cache.load_frame(self._cache_key)
+            if self._data is None:
+                if len(paths) == 1:
+                    self._data = read_csv(paths[0], self.engine)
+                else:
+                    self._data, self.load_errors = read_csv_files(paths, self.engine)
+                logging.info("Data loaded successfully.")
+                if self.cache is not None and not self.load_errors:
+                    self.cache.store_frame(self._cache_key, self._data)
+            self.validate()
         except Exception as e:
             logging.error(f"Error loading data: {e}")
             raise
 
+    def validate(self) -> None:
+        """Validates the data against the dataset schema as configured by the validation mode.
+
+        load_data() runs it on every load; data given to load_frame() is only validated on request.
+
+        Raises:
+            ValueError: If the validation mode is "raise" and a row violates the schema.
+        """
+        self._validation_report, self._quarantined = None, None
+        if self.validation is None:
+            return
+        report = SchemaValidator().validate(self._data)
+        self._validation_report = report
+        if report.is_valid:
+            return
+        if self.validation == "raise":
+            raise ValueError(report.format())
+        logging.warning(report.format())
+        if self.validation == "quarantine" and report.invalid_rows:
+            self._quarantined = self._data[report.invalid]
+            # The integer columns of the remaining rows now fit their compact dtypes
+            self._data = compact_dtypes(self._data[~report.invalid].reset_index(drop=True))
+            # The cached features belong to every row of the file, not to the rows kept here
+            self._cache_key = None
+            logging.warning(f"Quarantined {report.invalid_rows} invalid rows.")
+
+    def load_frame(self, data: pd.DataFrame) -> None:
+        """Uses an in-memory DataFrame with the raw Titanic columns as the data source.
+
+        Args:
+            data (pd.DataFrame): Raw passenger records. The frame is modified in place by preprocess().
+        """
+        self._data = data
+
+    @profiled(rows=lambda self: self._processed_data.shape[0])
     def preprocess(self) -> None:
         """Performs data preprocessing steps.
 
@@ -75,6 +427,12 @@ def preprocess(self) -> None:
         features, imputing age, and transforming features. The processed data is stored
         internally and can be accessed using the processed_data property.
 
+        The target is taken from the Survived column when it is present, so data without
+        labels can be preprocessed with an already fitted preprocessor.
+
+        When a cache is configured and the preprocessor is fitted here, the processed data is
+        read from (or written to) the cache; on a hit the loaded data is left untouched.
+
         Raises:
             ValueError: If data has not been loaded prior to preprocessing.
             Exception: If an error occurs during preprocessing.
@@ -82,72 +440,126 @@ def preprocess(self) -> None:
         if self._data is None:
             raise ValueError("Data not loaded. Please run load_data() method first.")
 
+        # Only dense features are cached
+        use_cache = self._cache_key is not None and not self._preprocessor.is_fitted and not self._preprocessor.sparse
+        if use_cache and self._load_cached_features():
+            return
+
         try:
-            self._drop_unnecessary_columns()
-            self._extract_titles()
-            self._create_family_features()
-            self._impute_age()
-            self._target = self._data["Survived"]
-            self._data.drop(columns=["Survived"], inplace=True)
+            self._engineer_features()
             self._processed_data = self._transform_features(self._data)
             logging.info("Data preprocessing completed successfully.")
         except Exception as e:
             logging.error(f"Error in preprocessing: {e}")
             raise
 
+        if use_cache:
+            target = None if self._target is None else self._target.to_numpy()
+            self.cache.store_features(
+                self._cache_key,
+                self._pipeline_version,
+                self._processed_data,
+                target,
+                self._passenger_ids,
+                self._preprocessor,
+            )
+
+    @profiled(rows=lambda self: len(self._data))
+    def engineer_features(self, impute_age: bool = True) -> None:
+        """Runs the feature engineering steps of preprocess() without the final feature transformation.
+
+        Afterwards the data property holds the engineered features, which is useful when the
+        column transformation has to be fitted separately, e.g. once per cross-validation fold.
+
+        Args:
+            impute_age (bool): Whether missing ages are imputed. Without it, only the stateless steps run
+                and nothing is learned from the rows, so the imputation can be fitted per fold as well.
+
+        Raises:
+            ValueError: If data has not been loaded prior to feature engineering.
+        """
+        if self._data is None:
+            raise ValueError("Data not loaded. Please run load_data() method first.")
+
+        try:
+            self._engineer_features(impute_age)
+        except Exception as e:
+            logging.error(f"Error in feature engineering: {e}")
+            raise
+
+    def _engineer_features(self, impute_age: bool = True) -> None:
+        self._drop_unnecessary_columns()
+        self._extract_titles()
+        self._create_family_features()
+        if impute_age:
+            self._impute_age()
+        if "Survived" in self._data.columns:
+            self._target = self._data["Survived"]
+            self._data.drop(columns=["Survived"], inplace=True)
+
+    @property
+    def _pipeline_version(self) -> str:
+        # Features of each encoding and dtype are cached separately
+        options = [self._preprocessor.encoding, self._preprocessor.dtype]
+        suffix = "".join(f"-{option}" for option, default in zip(options, ("onehot", "float32")) if option != default)
+        return PIPELINE_VERSION + suffix
+
+    def _load_cached_features(self) -> bool:
+        cached = self.cache.load_features(self._cache_key, self._pipeline_version)
+        if cached is None:
+            return False
+        self._processed_data = cached["features"]
+        self._target = cached["target"]
+        self._passenger_ids = cached["passenger_ids"]
+        self._preprocessor = cached["preprocessor"]
+        return True
+
+    @profiled(rows=lambda self: len(self._data))
     def _drop_unnecessary_columns(self) -> None:
-        self._data.drop(columns=["Ticket", "Cabin", "PassengerId"], inplace=True)
+        if "PassengerId" in self._data.columns:
+            self._passenger_ids = self._data["PassengerId"].to_numpy()
+        self._data.drop(columns=["Ticket", "Cabin", "PassengerId"], inplace=True, errors="ignore")
 
+    @profiled(rows=lambda self: len(self._data))
     def _extract_titles(self) -> None:
-        self._data["Title"] = self._data["Name"].apply(
-            lambda x: re.findall(r"\b\w+\.", x)[0] if re.findall(r"\b\w+\.", x) else "Unknown"
-        )
-        title_mappings = {"Mlle.": "Miss.", "Ms.": "Miss.", "Mme.": "Mrs.", "Lady.": "Mrs."}
-        self._data["Title"] = self._data["Title"].replace(title_mappings)
-        self._data["Title"] = self._data["Title"].apply(
-            lambda x: x if x in (["Mr.", "Miss.", "Mrs.", "Master."]) else "Other"
-        )
+        """Extract the honorific from Name and bucket it into the known titles."""
+        self._data["Title"] = extract_titles(self._data["Name"])
         self._data.drop(columns=["Name"], inplace=True)
 
+    @profiled(rows=lambda self: len(self._data))
     def _impute_age(self) -> None:
-        """Impute Age based on mean age by Title and Pclass."""
-        mean_ages = self._data.groupby(["Title", "Pclass"])["Age"].transform("mean")
-        self._data["Age"].fillna(mean_ages, inplace=True)
+        """Impute Age based on mean age by Title and Pclass.
+
+        The group means are learned on the first (training) call and looked up afterwards.
+        """
+        if self._preprocessor.age_means is None:
+            self._preprocessor.fit_age_means(self._data)
+        self._data["Age"] = self._preprocessor.impute_age(self._data)
 
+    @profiled(rows=lambda self: len(self._data))
     def _create_family_features(self) -> None:
-        self._data["FamilySize"] = self._data["SibSp"] + self._data["Parch"] + 1
-        self._data["IsAlone"] = 1
-        self._data.loc[self._data["FamilySize"] > 1, "IsAlone"] = 0
+        family_size = self._data["SibSp"] + self._data["Parch"] + 1
+        self._data["FamilySize"] = family_size
+        self._data["IsAlone"] = np.where(family_size > 1, 0, 1)
 
+    @profiled(rows=lambda self, data: len(data))
     def _transform_features(self, data: pd.DataFrame) -> np.ndarray:
-        """Transforms the features using a predefined pipeline.
+        """Transforms the features using the pipeline of FeaturePreprocessor.build_transformer().
+
+        The pipeline is fitted on the first call and reused for every later call.
 
         Args:
             data (pd.DataFrame): The data to be transformed.
 
         Returns:
-            np.ndarray: The transformed feature data.
+            np.ndarray: The transformed feature data, converted by FeaturePreprocessor.to_feature_matrix().
         """
-        numeric_features = ["Age", "Fare", "SibSp", "Parch", "FamilySize"]
-        categorical_features = ["Pclass", "Sex", "Embarked", "Title", "IsAlone"]
-
-        numeric_transformer = Pipeline(steps=[("scaler", StandardScaler())])
+        if self._preprocessor.transformer is not None:
+            return self._preprocessor.to_feature_matrix(self._preprocessor.transformer.transform(data))
 
-        categorical_transformer = Pipeline(
-            steps=[
-                ("imputer", SimpleImputer(strategy="constant", fill_value="missing")),
-                ("onehot", OneHotEncoder(handle_unknown="ignore")),
-            ]
-        )
-
-        preprocessor = ColumnTransformer(
-            transformers=[
-                ("num", numeric_transformer, numeric_features),
-                ("cat", categorical_transformer, categorical_features),
-            ]
-        )
-
-        return preprocessor.fit_transform(data)
+        preprocessor = self._preprocessor.build_transformer()
+        self._preprocessor.transformer = preprocessor
+        return self._preprocessor.to_feature_matrix(preprocessor.fit_transform(data))
 
     def get_target(self) -> np.ndarray:
         """Returns the target variable data.
@@ -170,3 +582,222 @@ def get_processed_data(self) -> np.ndarray:
             return self._processed_data
         else:
             raise ValueError("Data has not been processed. Call preprocess() method first.")
+
+    def get_passenger_ids(self) -> np.ndarray:
+        """Returns the PassengerId of every preprocessed row.
+
+        Raises:
+            ValueError: If the data had no PassengerId column or has not been processed yet.
+        """
+        if self._passenger_ids is not None:
+            return self._passenger_ids
+        else:
+            raise ValueError("Passenger ids not set. Please run preprocess() on data with a PassengerId column.")
+
+
+def encoded_feature_names(encoding: str = "onehot") -> list:
+    """Returns the names of the columns of the feature matrix, as FeaturePreprocessor.feature_names.
+
+    The numeric features come first as num__<feature>, followed by one cat__<feature>_<category>
+    column per FEATURE_CATEGORIES entry (one-hot) or one cat__<feature> column per feature (ordinal).
+
+    Args:
+        encoding (str): Encoding of the categorical features, one of FEATURE_ENCODINGS.
+
+    Raises:
+        ValueError: If the encoding is unknown.
+    """
+    if encoding not in FEATURE_ENCODINGS:
+        raise ValueError(f"Unknown feature encoding {encoding}. Choose one of: {', '.join(FEATURE_ENCODINGS)}")
+    names = [f"num__{feature}" for feature in NUMERIC_FEATURES]
+    for feature in CATEGORICAL_FEATURES:
+        if encoding == "ordinal":
+            names.append(f"cat__{feature}")
+        else:
+            names.extend(f"cat__{feature}_{category}" for category in FEATURE_CATEGORIES[feature])
+    return names
+
+
+def extract_titles(names: pd.Series) -> np.ndarray:
+    """Extracts the honorific of every name and buckets it into the known titles.
+
+    The regex runs once per row through ``str.extract``; bucketing is done on the
+    (few) distinct titles and broadcast back to the rows by their factorized codes.
+
+    Args:
+        names (pd.Series): Passenger names such as "Braund, Mr. Owen Harris".
+
+    Returns:
+        np.ndarray: An object array with a TITLE_BUCKETS value, or "Other", per name.
+    """
+    titles = names.str.extract(TITLE_PATTERN, expand=False)
+    codes, uniques = pd.factorize(titles)
+    buckets = np.array([TITLE_BUCKETS.get(title, "Other") for title in uniques] + ["Other"], dtype=object)
+    # factorize marks missing titles with -1, which picks the trailing "Other" entry
+    return buckets[codes]
+
+
+def read_csv(
+    filepath: str, engine: Optional[str] = None, chunksize: Optional[int] = None
+) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+    """Parses the CSV_DTYPES columns of a Titanic CSV file into their compact dtypes, where the values fit.
+
+    Args:
+        filepath (str): Path to the CSV file. Columns missing from it (e.g. Survived) are skipped.
+        engine (str, optional): pandas CSV parser, e.g. "pyarrow". The pyarrow parser cannot read in chunks.
+        chunksize (int, optional): When given, the file is parsed lazily in chunks of this many rows.
+
+    Returns:
+        pd.DataFrame: The parsed columns, in file order, or an iterator of DataFrames when chunksize is given.
+    """
+    header = pd.read_csv(filepath, nrows=0).columns
+    usecols = [column for column in header if column in CSV_DTYPES]
+    parsed = pd.read_csv(
+        filepath,
+        usecols=usecols,
+        dtype={column: PARSE_DTYPES[column] for column in usecols},
+        engine=engine,
+        chunksize=chunksize,
+    )
+    if chunksize is None:
+        return compact_dtypes(parsed)
+    return (compact_dtypes(chunk) for chunk in parsed)
+
+
+def read_csv_tail(filepath: str, offset: int, engine: Optional[str] = None) -> pd.DataFrame:
+    """Parses the rows of a CSV file that start at a byte offset, e.g. the rows appended since a previous read.
+
+    Args:
+        filepath (str): Path to the CSV file; its header names the columns of the tail.
+        offset (int): Byte offset of the first row to parse, which must be the start of a line.
+        engine (str, optional): pandas CSV parser, e.g. "pyarrow".
+
+    Returns:
+        pd.DataFrame: The parsed CSV_DTYPES columns of the rows after the offset, like read_csv().
+    """
+    header = pd.read_csv(filepath, nrows=0).columns
+    usecols = [column for column in header if column in CSV_DTYPES]
+    with open(filepath, "rb") as file:
+        file.seek(offset)
+        parsed = pd.read_csv(
+            file,
+            header=None,
+            names=list(header),
+            usecols=usecols,
+            dtype={column: PARSE_DTYPES[column] for column in usecols},
+            engine=engine,
+        )
+    return compact_dtypes(parsed)
+
+
+def compact_dtypes(frame: pd.DataFrame) -> pd.DataFrame:
+    """Narrows the integer columns of parsed CSV data to their CSV_DTYPES when no value would change.
+
+    A column is only converted when all its values are present, whole and within the range of its
+    compact dtype; otherwise it keeps its (float64) parse dtype, so a value never wraps around.
+
+    Args:
+        frame (pd.DataFrame): Columns parsed with PARSE_DTYPES. Converted columns are replaced in place.
+
+    Returns:
+        pd.DataFrame: The frame.
+    """
+    for column in frame.columns:
+        if PARSE_DTYPES.get(column) != "float64" or CSV_DTYPES[column] == frame[column].dtype:
+            continue
+        dtype = np.dtype(CSV_DTYPES[column])
+        values = frame[column].to_numpy()
+        limits = np.iinfo(dtype)
+        with np.errstate(invalid="ignore"):
+            fits = (values >= limits.min) & (values <= limits.max) & (values % 1 == 0)
+        if fits.all():
+            frame[column] = values.astype(dtype)
+    return frame
+
+
+def resolve_paths(filepath: str) -> list:
+    """Expands a data path into the CSV files it refers to.
+
+    Args:
+        filepath (str): A file, a directory (every ``*.csv`` file in it) or a glob pattern.
+
+    Returns:
+        list: The file paths, sorted so that shards are always read in the same order.
+
+    Raises:
+        FileNotFoundError: If a directory or pattern matches no file.
+    """
+    if os.path.isdir(filepath):
+        paths = sorted(glob.glob(os.path.join(filepath, "*.csv")))
+    elif glob.has_magic(filepath):
+        paths = sorted(path for path in glob.glob(filepath) if os.path.isfile(path))
+    else:
+        return [filepath]
+    if not paths:
+        raise FileNotFoundError(f"No CSV files match {filepath}")
+    return paths
+
+
+def read_csv_files(paths: list, engine: Optional[str] = None, max_workers: Optional[int] = None) -> tuple:
+    """Parses several CSV shards concurrently and concatenates them in order.
+
+    The shards are parsed in a thread pool (the pandas parsers release the GIL while tokenizing),
+    so the parsed frames are shared with this thread instead of being pickled back from worker
+    processes. Shards that fail to parse or whose columns differ from the first parsed shard are
+    skipped and reported.
+
+    Args:
+        paths (list): The CSV files, in the order of the resulting rows.
+        engine (str, optional): pandas CSV parser, e.g. "pyarrow".
+        max_workers (int, optional): Number of parsing threads, by default one per core of the src.resources
+            budget (at most 32).
+
+    Returns:
+        tuple: The concatenated DataFrame and a list of (path, error message) of the skipped shards.
+
+    Raises:
+        ValueError: If no shard could be parsed.
+    """
+    max_workers = max_workers or min(32, len(paths), get_n_jobs())
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [pool.submit(read_csv, path, engine) for path in paths]
+
+    frames, errors = [], []
+    for path, future in zip(paths, futures):
+        try:
+            frame = future.result()
+        except Exception as e:
+            errors.append((path, f"{type(e).__name__}: {e}"))
+            continue
+        if frames and list(frame.columns) != list(frames[0].columns):
+            errors.append((path, f"columns {list(frame.columns)} differ from {list(frames[0].columns)}"))
+            continue
+        frames.append(frame)
+
+    for path, error in errors:
+        logging.warning(f"Skipped malformed shard {path}: {error}")
+    if not frames:
+        raise ValueError(f"None of the {len(paths)} CSV files could be parsed.")
+    return _concat_frames(frames), errors
+
+
+def iter_csv_chunks(filepath: str, chunksize: int) -> Iterator[pd.DataFrame]:
+    """Parses a file, directory or glob pattern of CSV shards lazily in chunks of at most chunksize rows."""
+    for path in resolve_paths(filepath):
+        yield from read_csv(path, chunksize=chunksize)
+
+
+def _concat_frames(frames: list) -> pd.DataFrame:
+    """Concatenates frames with the same columns, keeping categorical columns categorical."""
+    if len(frames) == 1:
+        return frames[0]
+    for column in frames[0].columns:
+        if not isinstance(frames[0][column].dtype, pd.CategoricalDtype):
+            continue
+        # pd.concat falls back to object for categoricals unless every frame has the same categories
+        categories = frames[0][column].cat.categories
+        for frame in frames[1:]:
+            categories = categories.union(frame[column].cat.categories)
+        for frame in frames:
+            frame[column] = frame[column].cat.set_categories(categories)
+    return pd.concat(frames, ignore_index=True, copy=False)
@@ -1,16 +1,99 @@
 import logging
 
 from abc import ABC, abstractmethod
+from typing import Optional
 
 import numpy as np
 
+from src.profiling import profiled
+
+# Order of the metrics returned by FullReport
+REPORT_METRICS = ("accuracy", "precision", "recall", "f1")
+
+
+class ConfusionMatrix:
+    """This class represents the counts of a binary confusion matrix.
+
+    Every metric in this module is derived from these four counts, so the predictions only
+    have to be scanned once no matter how many metrics are reported.
+    """
+
+    def __init__(self, tn: int = 0, fp: int = 0, fn: int = 0, tp: int = 0) -> None:
+        self.tn = int(tn)
+        self.fp = int(fp)
+        self.fn = int(fn)
+        self.tp = int(tp)
+
+    @classmethod
+    def from_predictions(cls, y_true: np.ndarray, y_pred: np.ndarray) -> "ConfusionMatrix":
+        """Builds the confusion matrix of binary (0/1) labels in a single bincount pass.
+
+        Raises:
+            ValueError: If the inputs differ in length or contain labels other than 0 and 1.
+        """
+        y_true = np.asarray(y_true)
+        y_pred = np.asarray(y_pred)
+        if y_true.shape != y_pred.shape:
+            raise ValueError(f"y_true and y_pred have different shapes: {y_true.shape} and {y_pred.shape}")
+        for labels in (y_true, y_pred):
+            # Other labels could add up to a valid code: true 0 and predicted 2 would count as a false negative
+            if not ((labels == 0) | (labels == 1)).all():
+                raise ValueError("Only binary 0/1 labels are supported.")
+        codes = y_true.astype(np.intp) * 2
+        codes += y_pred.astype(np.intp, copy=False)
+        return cls(*np.bincount(codes.ravel(), minlength=4))
+
+    def __add__(self, other: "ConfusionMatrix") -> "ConfusionMatrix":
+        return ConfusionMatrix(self.tn + other.tn, self.fp + other.fp, self.fn + other.fn, self.tp + other.tp)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ConfusionMatrix):
+            return NotImplemented
+        return self.as_array().tolist() == other.as_array().tolist()
+
+    def __repr__(self) -> str:
+        return f"ConfusionMatrix(tn={self.tn}, fp={self.fp}, fn={self.fn}, tp={self.tp})"
+
+    @property
+    def total(self) -> int:
+        return self.tn + self.fp + self.fn + self.tp
+
+    def as_array(self) -> np.ndarray:
+        """Returns the counts as a 2x2 array, rows being the true and columns the predicted labels."""
+        return np.array([[self.tn, self.fp], [self.fn, self.tp]])
+
+    def accuracy(self) -> float:
+        return (self.tp + self.tn) / self.total
+
+    def precision(self) -> float:
+        predicted_positives = self.tp + self.fp
+        return self.tp / predicted_positives if predicted_positives != 0 else 0.0
+
+    def recall(self) -> float:
+        actual_positives = self.tp + self.fn
+        return self.tp / actual_positives if actual_positives != 0 else 0.0
+
+    def f1(self) -> float:
+        precision = self.precision()
+        recall = self.recall()
+        return 2 * (precision * recall) / (precision + recall) if (precision + recall) != 0 else 0.0
+
 
 class Evaluation(ABC):
     """This class represents an evaluation object."""
 
-    @abstractmethod
+    @profiled(rows=lambda self, y_true, y_pred: len(y_true))
     def evaluate(self, y_true: np.ndarray, y_pred: np.ndarray) -> float:
         """This method evaluates the performance of a model."""
+        try:
+            return self.score(ConfusionMatrix.from_predictions(y_true, y_pred))
+        except Exception as e:
+            logging.error(f"Error while evaluating {type(self).__name__}: {e}")
+            raise
+
+    @abstractmethod
+    def score(self, confusion_matrix: ConfusionMatrix) -> float:
+        """This method derives the metric from a confusion matrix."""
         pass
 
 
@@ -21,79 +104,290 @@ class Accuracy(Evaluation):
         y_pred: Estimated target values.
     """
 
-    def evaluate(self, y_true: np.ndarray, y_pred: np.ndarray) -> float:
-        """This method evaluates the performance of a model."""
-
-        try:
-            correct_predictions = np.sum(y_true == y_pred)
-            total_predictions = len(y_true)
-            score = correct_predictions / total_predictions
-            return score
-        except Exception as e:
-            logging.error("Error while evaluating accuracy of the model: {}".format(e))
-            raise e
+    def score(self, confusion_matrix: ConfusionMatrix) -> float:
+        return confusion_matrix.accuracy()
 
 
 class Precision(Evaluation):
     """This class represents a Precision object."""
 
-    def evaluate(self, y_true: np.ndarray, y_pred: np.ndarray) -> float:
-        try:
-            true_positives = np.sum((y_true == 1) & (y_pred == 1))
-            predicted_positives = np.sum(y_pred == 1)
-            score = true_positives / predicted_positives if predicted_positives != 0 else 0
-            return score
-        except Exception as e:
-            logging.error(f"Error while evaluating Precision Score: {e}")
-            raise
+    def score(self, confusion_matrix: ConfusionMatrix) -> float:
+        return confusion_matrix.precision()
 
 
 class Recall(Evaluation):
     """This class represents a Recall object."""
 
-    def evaluate(self, y_true: np.ndarray, y_pred: np.ndarray) -> float:
-        try:
-            true_positives = np.sum((y_true == 1) & (y_pred == 1))
-            actual_positives = np.sum(y_true == 1)
-            score = true_positives / actual_positives if actual_positives != 0 else 0
-            return score
-        except Exception as e:
-            logging.error(f"Error while evaluating Recall Score: {e}")
-            raise
+    def score(self, confusion_matrix: ConfusionMatrix) -> float:
+        return confusion_matrix.recall()
 
 
 class F1Score(Evaluation):
     """This class represents an F1 Score object."""
 
-    def evaluate(self, y_true: np.ndarray, y_pred: np.ndarray) -> float:
-        try:
-            precision_evaluator = Precision()
-            recall_evaluator = Recall()
-            precision = precision_evaluator.evaluate(y_true, y_pred)
-            recall = recall_evaluator.evaluate(y_true, y_pred)
-            score = 2 * (precision * recall) / (precision + recall) if (precision + recall) != 0 else 0
-            return score
-        except Exception as e:
-            logging.error(f"Error while evaluating F1 Score: {e}")
-            raise
+    def score(self, confusion_matrix: ConfusionMatrix) -> float:
+        return confusion_matrix.f1()
 
 
 class FullReport(Evaluation):
     """This class represents a Full Report object."""
 
     def evaluate(self, y_true: np.ndarray, y_pred: np.ndarray) -> tuple:
+        return super().evaluate(y_true, y_pred)
+
+    def score(self, confusion_matrix: ConfusionMatrix) -> tuple:
+        return (
+            confusion_matrix.accuracy(),
+            confusion_matrix.precision(),
+            confusion_matrix.recall(),
+            confusion_matrix.f1(),
+        )
+
+
+class StreamingEvaluation:
+    """This class accumulates a confusion matrix over batches of predictions.
+
+    Only the four confusion matrix counts are kept, so metrics over arbitrarily long
+    prediction streams are computed in constant memory.
+
+    Args:
+        evaluation: The metric reported by result(). Defaults to a FullReport.
+    """
+
+    def __init__(self, evaluation: Optional[Evaluation] = None) -> None:
+        self.evaluation = evaluation if evaluation is not None else FullReport()
+        self.confusion_matrix = ConfusionMatrix()
+
+    def update(self, y_true_batch: np.ndarray, y_pred_batch: np.ndarray) -> None:
+        """Adds a batch of labels and predictions to the accumulated counts."""
+        self.confusion_matrix = self.confusion_matrix + ConfusionMatrix.from_predictions(y_true_batch, y_pred_batch)
+
+    def result(self) -> float:
+        """Returns the metric over every batch seen so far.
+
+        Raises:
+            ValueError: If no predictions have been accumulated yet.
+        """
+        if self.confusion_matrix.total == 0:
+            raise ValueError("No predictions accumulated. Please call update() first.")
+        return self.evaluation.score(self.confusion_matrix)
+
+
+class BootstrapEvaluation:
+    """This class estimates bootstrap confidence intervals of every metric of the FullReport.
+
+    Every metric only depends on the four confusion matrix counts, and resampling n predictions with
+    replacement draws those counts from a multinomial distribution with n trials and the observed cell
+    frequencies. All resamples are therefore drawn as one (n_resamples, 4) array of counts and the metrics
+    are computed on it with array operations, without materializing any resampled predictions. The cost
+    does not depend on the number of predictions after the single confusion matrix pass, and the counts
+    are drawn in chunks of chunk_size resamples to bound the memory.
+
+    Args:
+        n_resamples: Number of bootstrap resamples.
+        confidence: Coverage of the percentile confidence intervals, e.g. 0.95.
+        chunk_size: Number of resamples drawn at a time.
+        random_state: Seed of the resampling, for reproducible intervals.
+    """
+
+    def __init__(
+        self,
+        n_resamples: int = 1000,
+        confidence: float = 0.95,
+        chunk_size: int = 100_000,
+        random_state: Optional[int] = None,
+    ) -> None:
+        if n_resamples < 1:
+            raise ValueError("n_resamples must be at least 1.")
+        if not 0 < confidence < 1:
+            raise ValueError("confidence must be between 0 and 1.")
+        self.n_resamples = n_resamples
+        self.confidence = confidence
+        self.chunk_size = chunk_size
+        self.random_state = random_state
+
+    @profiled(rows=lambda self, y_true, y_pred: len(y_true))
+    def evaluate(self, y_true: np.ndarray, y_pred: np.ndarray) -> dict:
+        """Returns the point estimate, standard error and confidence interval of every metric.
+
+        Returns:
+            dict: For every metric of REPORT_METRICS, a dict with the estimate, std, lower and upper values.
+        """
         try:
-            accuracy_evaluator = Accuracy()
-            precision_evaluator = Precision()
-            recall_evaluator = Recall()
-            f1_evaluator = F1Score()
+            confusion_matrix = ConfusionMatrix.from_predictions(y_true, y_pred)
+            if confusion_matrix.total == 0:
+                raise ValueError("Cannot bootstrap an empty set of predictions.")
+            estimates = metrics_from_counts(confusion_matrix.as_array().reshape(1, 4))
+            resampled = self.resample(confusion_matrix)
+        except Exception as e:
+            logging.error(f"Error while bootstrapping the evaluation: {e}")
+            raise
+
+        alpha = (1 - self.confidence) / 2
+        results = {}
+        for metric in REPORT_METRICS:
+            lower, upper = np.quantile(resampled[metric], [alpha, 1 - alpha])
+            results[metric] = {
+                "estimate": float(estimates[metric][0]),
+                "std": float(resampled[metric].std(ddof=1)) if self.n_resamples > 1 else 0.0,
+                "lower": float(lower),
+                "upper": float(upper),
+            }
+        return results
+
+    def resample(self, confusion_matrix: ConfusionMatrix) -> dict:
+        """Returns the value of every metric on each bootstrap resample.
+
+        Returns:
+            dict: For every metric of REPORT_METRICS, an array of n_resamples values.
+        """
+        rng = np.random.default_rng(self.random_state)
+        counts = confusion_matrix.as_array().ravel()
+        frequencies = counts / counts.sum()
+        resampled = {metric: np.empty(self.n_resamples) for metric in REPORT_METRICS}
+        for start in range(0, self.n_resamples, self.chunk_size):
+            stop = min(start + self.chunk_size, self.n_resamples)
+            chunk = metrics_from_counts(rng.multinomial(counts.sum(), frequencies, size=stop - start))
+            for metric in REPORT_METRICS:
+                resampled[metric][start:stop] = chunk[metric]
+        return resampled
+
+
+def metrics_from_counts(counts: np.ndarray) -> dict:
+    """Computes every metric of REPORT_METRICS for many confusion matrices at once.
+
+    Args:
+        counts: An (n, 4) array of tn, fp, fn and tp counts.
+
+    Returns:
+        dict: For every metric, an array of n values. Undefined precision, recall and F1 are 0 like in ConfusionMatrix.
+    """
+    tn, fp, fn, tp = np.asarray(counts, dtype=np.float64).T
+    predicted_positives = tp + fp
+    actual_positives = tp + fn
+    precision = np.divide(tp, predicted_positives, out=np.zeros_like(tp), where=predicted_positives != 0)
+    recall = np.divide(tp, actual_positives, out=np.zeros_like(tp), where=actual_positives != 0)
+    both = precision + recall
+    return {
+        "accuracy": (tp + tn) / (tn + fp + fn + tp),
+        "precision": precision,
+        "recall": recall,
+        "f1": np.divide(2 * precision * recall, both, out=np.zeros_like(tp), where=both != 0),
+    }
 
-            accuracy = accuracy_evaluator.evaluate(y_true, y_pred)
-            precision = precision_evaluator.evaluate(y_true, y_pred)
-            recall = recall_evaluator.evaluate(y_true, y_pred)
-            f1_evaluator = f1_evaluator.evaluate(y_true, y_pred)
 
-            return (accuracy, precision, recall, f1_evaluator)
+def format_bootstrap(results: dict, confidence: float, metrics: tuple = REPORT_METRICS) -> str:
+    """Formats the results of BootstrapEvaluation.evaluate as a text table."""
+    interval = f"{confidence:.0%} interval"
+    header = f"{'metric':<12}{'estimate':>10}{'std':>10}{interval:>22}"
+    lines = [header, "-" * len(header)]
+    for metric in metrics:
+        result = results[metric]
+        bounds = f"[{result['lower']:.4f}, {result['upper']:.4f}]"
+        lines.append(f"{metric:<12}{result['estimate']:>10.4f}{result['std']:>10.4f}{bounds:>22}")
+    return "\n".join(lines)
+
+
+class ThresholdSweep:
+    """This class evaluates every candidate decision threshold of probability scores at once.
+
+    The scores are sorted once; cumulative sums of the sorted labels then give the confusion matrix
+    counts at every distinct score used as threshold (a sample is predicted positive when its score
+    is at least the threshold). ROC-AUC, PR-AUC (average precision) and every metric at every
+    threshold follow from these counts with array operations, in O(n log n) overall.
+
+    Args:
+        metrics: The metrics whose optimal operating point is reported.
+    """
+
+    def __init__(self, metrics: tuple = REPORT_METRICS) -> None:
+        unknown = set(metrics) - set(REPORT_METRICS)
+        if unknown:
+            raise ValueError(f"Unknown metrics: {sorted(unknown)}. Choose from {list(REPORT_METRICS)}.")
+        self.metrics = tuple(metrics)
+
+    @profiled(rows=lambda self, y_true, scores: len(y_true))
+    def evaluate(self, y_true: np.ndarray, scores: np.ndarray) -> dict:
+        """Returns the ROC-AUC, the PR-AUC and the operating point maximizing every metric.
+
+        Args:
+            y_true: Binary (0/1) ground truth labels.
+            scores: Probability (or any monotonic score) of the positive class.
+
+        Returns:
+            dict: The roc_auc, pr_auc and, under operating_points, for every metric the threshold
+                maximizing it with the value of every metric of REPORT_METRICS at that threshold.
+
+        Raises:
+            ValueError: If the inputs differ in length or the labels hold a single class.
+        """
+        try:
+            thresholds, counts = threshold_counts(y_true, scores)
         except Exception as e:
-            logging.error(f"Error while evaluating F1 Score: {e}")
+            logging.error(f"Error while sweeping the thresholds: {e}")
             raise
+
+        tn, fp, fn, tp = counts.T
+        positives, negatives = tp[-1], tn[-1] + fp[-1]
+        if positives == 0 or negatives == 0:
+            raise ValueError("The threshold sweep needs both positive and negative labels.")
+        # Prepend the point of the infinite threshold, where nothing is predicted positive
+        fpr = np.concatenate(([0.0], fp / negatives))
+        tpr = np.concatenate(([0.0], tp / positives))
+        roc_auc = float(np.sum(np.diff(fpr) * (tpr[1:] + tpr[:-1]) / 2))
+        # Average precision: the precision at every threshold weighted by the recall it adds
+        pr_auc = float(np.sum(np.diff(tpr) * tp / (tp + fp)))
+
+        values = metrics_from_counts(counts)
+        operating_points = {}
+        for metric in self.metrics:
+            # argmax picks the highest threshold among ties
+            best = int(np.argmax(values[metric]))
+            operating_points[metric] = {"threshold": float(thresholds[best])}
+            operating_points[metric].update({name: float(values[name][best]) for name in REPORT_METRICS})
+        return {"roc_auc": roc_auc, "pr_auc": pr_auc, "operating_points": operating_points}
+
+
+def threshold_counts(y_true: np.ndarray, scores: np.ndarray) -> tuple:
+    """Computes the confusion matrix counts at every distinct score used as decision threshold.
+
+    Args:
+        y_true: Binary (0/1) ground truth labels.
+        scores: Score of the positive class of every sample.
+
+    Returns:
+        tuple: The thresholds in decreasing order and an array of their (tn, fp, fn, tp) counts, shape (n, 4).
+
+    Raises:
+        ValueError: If the inputs differ in length or contain labels other than 0 and 1.
+    """
+    y_true = np.asarray(y_true).ravel()
+    scores = np.asarray(scores, dtype=np.float64).ravel()
+    if y_true.shape != scores.shape:
+        raise ValueError(f"y_true and scores have different shapes: {y_true.shape} and {scores.shape}")
+    if y_true.size == 0:
+        raise ValueError("Cannot sweep the thresholds of empty scores.")
+    if not np.isin(y_true, (0, 1)).all():
+        raise ValueError("Only binary 0/1 labels are supported.")
+
+    order = np.argsort(scores, kind="mergesort")[::-1]
+    sorted_scores = scores[order]
+    # The last position of every run of equal scores: all of them switch to positive together
+    ends = np.concatenate((np.flatnonzero(np.diff(sorted_scores)), [len(sorted_scores) - 1]))
+    tp = np.cumsum(y_true[order], dtype=np.int64)[ends]
+    fp = ends + 1 - tp
+    positives, negatives = tp[-1], len(y_true) - tp[-1]
+    counts = np.column_stack((negatives - fp, fp, positives - tp, tp))
+    return sorted_scores[ends], counts
+
+
+def format_threshold_sweep(results: dict) -> str:
+    """Formats the results of ThresholdSweep.evaluate as a text report."""
+    lines = [f"ROC-AUC: {results['roc_auc']:.4f}", f"PR-AUC:  {results['pr_auc']:.4f}", ""]
+    metrics = "".join(f"{metric:>11}" for metric in REPORT_METRICS)
+    header = f"{'best for':<12}{'threshold':>11}{metrics}"
+    lines.extend([header, "-" * len(header)])
+    for metric, point in results["operating_points"].items():
+        scores = "".join(f"{point[name]:>11.4f}" for name in REPORT_METRICS)
+        lines.append(f"{metric:<12}{point['threshold']:>11.4f}{scores}")
+    return "\n".join(lines)
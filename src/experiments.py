@@ -0,0 +1,371 @@
+import hashlib
+import itertools
+import json
+import logging
+import os
+import sqlite3
+import time
+
+from contextlib import closing
+from datetime import datetime, timezone
+from typing import Optional
+
+import numpy as np
+
+from joblib import Parallel, delayed
+from sklearn.model_selection import train_test_split
+
+from src.cache import DataCache
+from src.data_manager import DataManager, resolve_paths
+from src.evaluation import REPORT_METRICS, FullReport
+from src.models.model_factory import ModelFactory
+from src.parallel import shared_arrays
+from src.profiling import profiled
+from src.resources import split_n_jobs, worker_limits
+
+DEFAULT_RESULTS_PATH = "./artifacts/experiments.db"
+# Keys of a sweep specification; every combination of data, model, seed and test size is one run
+SWEEP_KEYS = ("name", "data", "models", "seeds", "test_sizes", "params")
+# Columns the query command can group the results by
+GROUP_COLUMNS = ("sweep", "data", "model", "seed", "test_size")
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS runs (
+    run_key TEXT PRIMARY KEY,
+    sweep TEXT NOT NULL,
+    data TEXT NOT NULL,
+    data_digest TEXT NOT NULL,
+    model TEXT NOT NULL,
+    seed INTEGER NOT NULL,
+    test_size REAL NOT NULL,
+    params TEXT NOT NULL,
+    status TEXT NOT NULL,
+    error TEXT,
+    {", ".join(f'"{metric}" REAL' for metric in REPORT_METRICS)},
+    preprocess_seconds REAL,
+    train_seconds REAL,
+    predict_seconds REAL,
+    finished_at TEXT NOT NULL
+)
+"""
+
+
+class ResultStore:
+    """SQLite database holding one row per experiment run, keyed by the run's configuration.
+
+    Every operation opens its own short-lived connection, so worker processes write their results
+    concurrently (SQLite serializes the writes, and the write-ahead log lets readers continue
+    meanwhile) and a run is stored as soon as it finishes.
+    """
+
+    def __init__(self, path: str = DEFAULT_RESULTS_PATH, timeout: float = 60.0) -> None:
+        """Initializes the ResultStore, creating the database and its table if needed.
+
+        Args:
+            path (str): Path of the SQLite database file.
+            timeout (float): Seconds a write waits for another process to release the database.
+        """
+        self.path = path
+        self.timeout = timeout
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with closing(self._connect()) as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(_SCHEMA)
+
+    def completed_keys(self) -> set:
+        """Returns the keys of the runs that completed successfully."""
+        with closing(self._connect()) as connection:
+            return {key for (key,) in connection.execute("SELECT run_key FROM runs WHERE status = 'completed'")}
+
+    def record(self, run: dict, result: dict) -> None:
+        """Stores the outcome of a run, replacing an earlier failed attempt.
+
+        Args:
+            run (dict): The run, as returned by expand_sweep().
+            result (dict): The status ("completed" or "failed"), the error message of a failed run, and the
+                REPORT_METRICS and timings of a completed one.
+        """
+        row = {
+            "run_key": run["key"],
+            "sweep": run["sweep"],
+            "data": run["data"],
+            "data_digest": run["data_digest"],
+            "model": run["model"],
+            "seed": run["seed"],
+            "test_size": run["test_size"],
+            "params": json.dumps(run["params"], sort_keys=True),
+            "finished_at": datetime.now(timezone.utc).isoformat(),
+            **result,
+        }
+        columns = ", ".join(f'"{column}"' for column in row)
+        placeholders = ", ".join("?" for _ in row)
+        with closing(self._connect()) as connection, connection:
+            connection.execute(f"INSERT OR REPLACE INTO runs ({columns}) VALUES ({placeholders})", list(row.values()))
+
+    def summarize(self, metric: str = "accuracy", group_by: tuple = ("model", "test_size"), sweep: str = None) -> list:
+        """Aggregates the completed runs per group, best mean metric first.
+
+        Args:
+            metric (str): One of REPORT_METRICS.
+            group_by (tuple): Columns of GROUP_COLUMNS defining the groups.
+            sweep (str, optional): Only summarize the runs of this sweep.
+
+        Returns:
+            list: One dict per group with its GROUP_COLUMNS values, the number of runs, the mean, std, min
+                and max of the metric and the mean train and predict seconds.
+
+        Raises:
+            ValueError: If the metric or a group column is unknown.
+        """
+        if metric not in REPORT_METRICS:
+            raise ValueError(f"Unknown metric {metric}. Choose one of: {', '.join(REPORT_METRICS)}")
+        unknown = [column for column in group_by if column not in GROUP_COLUMNS]
+        if unknown:
+            raise ValueError(f"Cannot group by {', '.join(unknown)}. Choose from: {', '.join(GROUP_COLUMNS)}")
+
+        groups = ", ".join(group_by)
+        query = f"""
+            SELECT {groups}, COUNT(*), AVG("{metric}"), AVG("{metric}" * "{metric}"), MIN("{metric}"),
+                MAX("{metric}"), AVG(train_seconds), AVG(predict_seconds)
+            FROM runs WHERE status = 'completed' {"AND sweep = ?" if sweep else ""}
+            GROUP BY {groups} ORDER BY AVG("{metric}") DESC
+        """
+        with closing(self._connect()) as connection:
+            rows = connection.execute(query, [sweep] if sweep else []).fetchall()
+
+        summary = []
+        for row in rows:
+            runs, mean, mean_square, minimum, maximum, train_seconds, predict_seconds = row[len(group_by) :]
+            summary.append(
+                {
+                    **dict(zip(group_by, row)),
+                    "runs": runs,
+                    "mean": mean,
+                    "std": max(mean_square - mean**2, 0.0) ** 0.5,
+                    "min": minimum,
+                    "max": maximum,
+                    "train_seconds": train_seconds,
+                    "predict_seconds": predict_seconds,
+                }
+            )
+        return summary
+
+    def failures(self, sweep: str = None) -> list:
+        """Returns the model, seed, test size and error of every failed run, optionally of one sweep only."""
+        query = "SELECT model, seed, test_size, error FROM runs WHERE status = 'failed'"
+        with closing(self._connect()) as connection:
+            if sweep:
+                return connection.execute(f"{query} AND sweep = ?", [sweep]).fetchall()
+            return connection.execute(query).fetchall()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=self.timeout)
+
+
+def load_sweep(path: str) -> dict:
+    """Reads a sweep specification from a JSON file.
+
+    The file holds the data ("data": a path, or a list of paths, each a file, directory or glob),
+    the "models" to train, and optionally the "seeds" (default [42]), the "test_sizes" (default
+    [0.2]), per-model hyperparameters ("params": model -> dict) and a "name" (default: the file
+    name without extension).
+
+    Raises:
+        ValueError: If the specification has unknown keys, no data or no models, or an unknown model.
+    """
+    with open(path) as file:
+        spec = json.load(file)
+    unknown = sorted(set(spec) - set(SWEEP_KEYS))
+    if unknown:
+        raise ValueError(f"Unknown sweep keys: {', '.join(unknown)}. Expected: {', '.join(SWEEP_KEYS)}")
+    if not spec.get("data") or not spec.get("models"):
+        raise ValueError("A sweep needs at least one data path and one model.")
+    available = ModelFactory.available_models()
+    for model in spec["models"]:
+        if model not in available:
+            raise ValueError(f"Unknown model type: {model}")
+
+    data = spec["data"]
+    return {
+        "name": spec.get("name") or os.path.splitext(os.path.basename(path))[0],
+        "data": [data] if isinstance(data, str) else list(data),
+        "models": list(spec["models"]),
+        "seeds": [int(seed) for seed in spec.get("seeds", [42])],
+        "test_sizes": [float(test_size) for test_size in spec.get("test_sizes", [0.2])],
+        "params": spec.get("params", {}),
+    }
+
+
+def expand_sweep(spec: dict, data_digests: dict) -> list:
+    """Expands a sweep into its runs, one per combination of data, model, seed and test size.
+
+    Args:
+        spec (dict): A sweep specification returned by load_sweep().
+        data_digests (dict): Data path -> digest of its content, e.g. DataCache.files_digest().
+
+    Returns:
+        list: One dict per run. Its key hashes the data content and the run's configuration (not the
+            sweep name), so the same run in another sweep, or after an interruption, has the same key.
+    """
+    runs = []
+    for data, model, seed, test_size in itertools.product(
+        spec["data"], spec["models"], spec["seeds"], spec["test_sizes"]
+    ):
+        params = spec["params"].get(model, {})
+        configuration = [data_digests[data], model, seed, test_size, params]
+        key = hashlib.sha256(json.dumps(configuration, sort_keys=True).encode()).hexdigest()
+        runs.append(
+            {
+                "key": key,
+                "sweep": spec["name"],
+                "data": data,
+                "data_digest": data_digests[data],
+                "model": model,
+                "seed": seed,
+                "test_size": test_size,
+                "params": params,
+            }
+        )
+    return runs
+
+
+def run_experiment(
+    run: dict, X: np.ndarray, y: np.ndarray, store_path: str, preprocess_seconds: float, n_threads: int
+) -> str:
+    """Splits the shared features, trains and evaluates one run and stores its outcome.
+
+    The seed is the random_state of the split and, when it has one, of the estimator. A failing run
+    is stored as failed with its error instead of stopping the other runs of the sweep.
+
+    Args:
+        run (dict): The run, as returned by expand_sweep().
+        X (np.ndarray): The preprocessed features of the run's data, shared between the runs.
+        y (np.ndarray): The target.
+        store_path (str): Path of the ResultStore database.
+        preprocess_seconds (float): Time taken to preprocess the shared features.
+        n_threads (int): Threads the model and the BLAS/OpenMP pools may use.
+
+    Returns:
+        str: The status of the run, "completed" or "failed".
+    """
+    store = ResultStore(store_path)
+    try:
+        X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=run["test_size"], random_state=run["seed"])
+        with worker_limits(n_threads):
+            model = ModelFactory.create_model(run["model"], **run["params"])
+            estimator = getattr(model, "model", None)
+            if hasattr(estimator, "get_params") and "random_state" in estimator.get_params(deep=False):
+                estimator.set_params(random_state=run["params"].get("random_state", run["seed"]))
+            start = time.perf_counter()
+            model.train(X_train, y_train)
+            train_seconds = time.perf_counter() - start
+
+            start = time.perf_counter()
+            y_pred = model.predict(X_test)
+            predict_seconds = time.perf_counter() - start
+
+        scores = dict(zip(REPORT_METRICS, (float(score) for score in FullReport().evaluate(y_test, y_pred))))
+        result = {
+            "status": "completed",
+            **scores,
+            "preprocess_seconds": preprocess_seconds,
+            "train_seconds": train_seconds,
+            "predict_seconds": predict_seconds,
+        }
+    except Exception as e:
+        logging.error(f"Run {run['model']} (seed {run['seed']}, test size {run['test_size']}) failed: {e}")
+        result = {"status": "failed", "error": f"{type(e).__name__}: {e}"}
+    store.record(run, result)
+    return result["status"]
+
+
+@profiled(name="run_sweep")
+def run_sweep(
+    spec: dict,
+    store_path: str = DEFAULT_RESULTS_PATH,
+    n_jobs: Optional[int] = None,
+    cache: Optional[DataCache] = None,
+) -> dict:
+    """Runs every run of a sweep that has not completed yet, in parallel, storing each result as it finishes.
+
+    Runs already completed in the store are skipped, so an interrupted sweep resumes where it
+    stopped; failed runs are retried. The pending runs are grouped by data and by the feature
+    encoding and dtype of their model, each group's data is loaded and preprocessed once, and the
+    features are shared with the worker processes through memory maps. When a group's data cannot be
+    loaded or preprocessed, its runs are stored as failed and the other groups go on. The core budget
+    is split between the workers and the threads of each run's model.
+
+    Args:
+        spec (dict): A sweep specification returned by load_sweep().
+        store_path (str): Path of the ResultStore database.
+        n_jobs (int, optional): Number of worker processes within the core budget of src.resources,
+            None or -1 for the whole budget.
+        cache (DataCache, optional): Cache for the parsed data and the preprocessed features.
+
+    Returns:
+        dict: The number of runs in the sweep, skipped because completed earlier, completed and failed,
+            and the seconds taken.
+    """
+    start = time.perf_counter()
+    store = ResultStore(store_path)
+    digests = {data: DataCache.files_digest(resolve_paths(data)) for data in spec["data"]}
+    runs = expand_sweep(spec, digests)
+    completed = store.completed_keys()
+    pending = [run for run in runs if run["key"] not in completed]
+    summary = {"runs": len(runs), "skipped": len(runs) - len(pending), "completed": 0, "failed": 0}
+    logging.info(f"Sweep {spec['name']}: {len(pending)} of {len(runs)} runs to do.")
+
+    groups = {}
+    for run in pending:
+        features = (ModelFactory.feature_encoding(run["model"]), ModelFactory.feature_dtype(run["model"]))
+        groups.setdefault((run["data"], *features), []).append(run)
+
+    arrays, timings, prepared = [], [], []
+    for (data, encoding, dtype), group_runs in groups.items():
+        begin = time.perf_counter()
+        try:
+            data_manager = DataManager(data, cache=cache, encoding=encoding, dtype=dtype)
+            data_manager.load_data()
+            data_manager.preprocess()
+        except Exception as e:
+            # The group's runs fail like a failing run, and are retried when the sweep is resumed
+            logging.error(f"Preparing {data} with {encoding} {dtype} features failed: {e}")
+            for run in group_runs:
+                store.record(run, {"status": "failed", "error": f"{type(e).__name__}: {e}"})
+            summary["failed"] += len(group_runs)
+            continue
+        arrays.extend([data_manager.get_processed_data(), np.asarray(data_manager.get_target())])
+        timings.append(time.perf_counter() - begin)
+        prepared.append(group_runs)
+
+    workers, n_threads = split_n_jobs(n_jobs, sum(len(group_runs) for group_runs in prepared))
+    with shared_arrays(*arrays) as shared:
+        statuses = Parallel(n_jobs=workers)(
+            delayed(run_experiment)(run, shared[2 * group], shared[2 * group + 1], store_path, seconds, n_threads)
+            for group, (group_runs, seconds) in enumerate(zip(prepared, timings))
+            for run in group_runs
+        )
+    for status in statuses:
+        summary[status] += 1
+    summary["seconds"] = time.perf_counter() - start
+    return summary
+
+
+def format_summary(summary: list, metric: str) -> str:
+    """Formats the groups returned by ResultStore.summarize() as a text table."""
+    if not summary:
+        return "No completed runs."
+    # The group columns come first in every dict, followed by "runs"
+    group_by = list(summary[0])[: list(summary[0]).index("runs")]
+    widths = {column: max(len(column), *(len(str(group[column])) for group in summary)) + 2 for column in group_by}
+    header = "".join(f"{column:<{widths[column]}}" for column in group_by)
+    header += f"{'runs':>6}{f'mean {metric}':>16}{'std':>9}{'min':>9}{'max':>9}{'train (s)':>12}{'predict (s)':>13}"
+    lines = [header, "-" * len(header)]
+    for group in summary:
+        line = "".join(f"{str(group[column]):<{widths[column]}}" for column in group_by)
+        line += f"{group['runs']:>6}{group['mean']:>16.4f}{group['std']:>9.4f}{group['min']:>9.4f}{group['max']:>9.4f}"
+        line += f"{group['train_seconds']:>12.3f}{group['predict_seconds']:>13.4f}"
+        lines.append(line)
+    return "\n".join(lines)
@@ -0,0 +1,166 @@
+import time
+
+from typing import Optional
+
+import numpy as np
+
+from joblib import Parallel, delayed
+
+from src.data_manager import CATEGORICAL_FEATURES, NUMERIC_FEATURES
+from src.evaluation import metrics_from_counts
+from src.models.base_model import BaseModel
+from src.parallel import shared_arrays
+from src.profiling import profiled
+from src.resources import set_estimator_n_jobs, split_n_jobs, worker_limits
+
+
+def feature_groups(feature_names: list) -> dict:
+    """Maps every engineered feature to the block of transformed columns it was encoded into.
+
+    Transformed columns are named like num__Age or cat__Title_Mr. (one-hot) and cat__Title (ordinal);
+    the columns of one feature are always adjacent.
+
+    Args:
+        feature_names (list): Names of the transformed feature columns, e.g. FeaturePreprocessor.feature_names.
+
+    Returns:
+        dict: Feature name -> slice of its columns, in NUMERIC_FEATURES + CATEGORICAL_FEATURES order.
+
+    Raises:
+        ValueError: If a column belongs to no feature or the columns of a feature are not adjacent.
+    """
+    columns = {}
+    for position, name in enumerate(feature_names):
+        encoded = name.split("__", 1)[-1]
+        feature = next(
+            (feature for feature in (*NUMERIC_FEATURES, *CATEGORICAL_FEATURES) if encoded.split("_")[0] == feature),
+            None,
+        )
+        if feature is None:
+            raise ValueError(f"Column {name} does not belong to any feature.")
+        columns.setdefault(feature, []).append(position)
+
+    groups = {}
+    for feature in (*NUMERIC_FEATURES, *CATEGORICAL_FEATURES):
+        if feature not in columns:
+            continue
+        start, stop = columns[feature][0], columns[feature][-1] + 1
+        if stop - start != len(columns[feature]):
+            raise ValueError(f"The columns of feature {feature} are not adjacent.")
+        groups[feature] = slice(start, stop)
+    return groups
+
+
+def score_predictions(y_true: np.ndarray, y_pred: np.ndarray, metric: str) -> float:
+    """Scores binary predictions with one metric of REPORT_METRICS."""
+    counts = np.bincount(2 * np.asarray(y_true, dtype=np.intp) + np.asarray(y_pred, dtype=np.intp), minlength=4)
+    return float(metrics_from_counts(counts[np.newaxis])[metric][0])
+
+
+@profiled(name="permutation_importance", rows=lambda model, X, *args, **kwargs: len(X))
+def permutation_importance(
+    model: BaseModel,
+    X: np.ndarray,
+    y: np.ndarray,
+    feature_names: list,
+    n_repeats: int = 5,
+    metric: str = "accuracy",
+    n_jobs: Optional[int] = None,
+    random_state: int = 42,
+) -> dict:
+    """Computes the permutation importance of every engineered feature of a trained model.
+
+    The importance of a feature is the drop of the metric when the rows of all its transformed
+    columns (e.g. every one-hot column of Title) are shuffled together, averaged over n_repeats
+    shuffles. The baseline score is computed once. The (feature, repeat) tasks are split into one
+    batch per worker process; the matrix is shared with the workers through memory maps, and each
+    worker copies it once into a buffer in which it permutes one feature's columns at a time with
+    np.take(out=...) and restores them afterwards, so no matrix is copied per permutation. Every task
+    has its own seed, so the result does not depend on n_jobs.
+
+    Args:
+        model (BaseModel): A trained model.
+        X (np.ndarray): The transformed features it was trained on, or held-out rows.
+        y (np.ndarray): The target of the rows.
+        feature_names (list): Names of the columns of X.
+        n_repeats (int): Shuffles per feature.
+        metric (str): One of REPORT_METRICS.
+        n_jobs (int, optional): Number of worker processes within the core budget of src.resources,
+            None or -1 for the whole budget.
+        random_state (int): Seed of the shuffles.
+
+    Returns:
+        dict: The metric, its baseline score, n_repeats, the seconds taken and, per feature, the mean
+            and std of the score drops and the drop of every repeat.
+    """
+    start = time.perf_counter()
+    X = X.toarray() if hasattr(X, "toarray") else np.asarray(X)
+    y = np.asarray(y)
+    groups = feature_groups(feature_names)
+    baseline = score_predictions(y, model.predict(X), metric)
+
+    tasks = [(feature, repeat) for feature in groups for repeat in range(n_repeats)]
+    seeds = np.random.SeedSequence(random_state).generate_state(len(tasks))
+    workers, n_threads = split_n_jobs(n_jobs, len(tasks))
+    batches = np.array_split(np.arange(len(tasks)), workers)
+    with shared_arrays(X, y) as (shared_X, shared_y):
+        batch_scores = Parallel(n_jobs=workers)(
+            delayed(_score_permutations)(
+                model,
+                shared_X,
+                shared_y,
+                [(groups[tasks[task][0]], seeds[task]) for task in batch],
+                metric,
+                n_threads,
+            )
+            for batch in batches
+        )
+
+    drops = {feature: np.empty(n_repeats) for feature in groups}
+    for batch, scores in zip(batches, batch_scores):
+        for task, score in zip(batch, scores):
+            feature, repeat = tasks[task]
+            drops[feature][repeat] = baseline - score
+    return {
+        "metric": metric,
+        "baseline": baseline,
+        "n_repeats": n_repeats,
+        "seconds": time.perf_counter() - start,
+        "importances": {
+            feature: {"mean": float(values.mean()), "std": float(values.std()), "drops": values.tolist()}
+            for feature, values in drops.items()
+        },
+    }
+
+
+def _score_permutations(
+    model: BaseModel, X: np.ndarray, y: np.ndarray, tasks: list, metric: str, n_threads: int
+) -> list:
+    """Scores the model with the columns of each task shuffled, reusing one buffer for every task."""
+    buffer = np.array(X)
+    identity = np.arange(len(X))
+    index = np.empty_like(identity)
+    scores = []
+    with worker_limits(n_threads):
+        set_estimator_n_jobs(model, n_threads)
+        for columns, seed in tasks:
+            # Restart from the identity so a task's permutation depends on its seed only, not on its batch
+            index[:] = identity
+            np.random.default_rng(seed).shuffle(index)
+            # mode="clip" skips the bounds check that would make np.take write through a temporary copy
+            np.take(X[:, columns], index, axis=0, out=buffer[:, columns], mode="clip")
+            scores.append(score_predictions(y, model.predict(buffer), metric))
+            buffer[:, columns] = X[:, columns]
+    return scores
+
+
+def format_importance(results: dict) -> str:
+    """Formats permutation importances as a text table, most important feature first."""
+    lines = [
+        f"Baseline {results['metric']}: {results['baseline']:.4f} ({results['n_repeats']} repeats per feature)",
+        f"{'feature':<12}{'mean drop':>11}{'std':>9}",
+    ]
+    ranked = sorted(results["importances"].items(), key=lambda item: item[1]["mean"], reverse=True)
+    for feature, importance in ranked:
+        lines.append(f"{feature:<12}{importance['mean']:>11.4f}{importance['std']:>9.4f}")
+    return "\n".join(lines)
@@ -0,0 +1,252 @@
+import logging
+import time
+
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from src.data_manager import CATEGORICAL_FEATURES, NUMERIC_FEATURES, extract_titles, iter_csv_chunks
+from src.models.base_model import BaseModel
+from src.models.model_factory import ModelFactory
+
+DEFAULT_BATCH_SIZE = 50_000
+# One-hot slots per categorical feature; the last slot collects every category seen after the others filled up
+DEFAULT_CAPACITY = 16
+MISSING_CATEGORY = "missing"
+OVERFLOW_CATEGORY = "overflow"
+
+
+class RunningMoments:
+    """Running count, mean and variance of every column of a stream of batches, ignoring NaN.
+
+    Batches are merged with the parallel update of Chan et al., so the result equals the statistics
+    of all rows seen so far without keeping any of them.
+    """
+
+    def __init__(self, n_columns: int) -> None:
+        self.count = np.zeros(n_columns)
+        self.mean = np.zeros(n_columns)
+        self.m2 = np.zeros(n_columns)
+
+    def update(self, X: np.ndarray) -> None:
+        """Adds the rows of a batch to the statistics."""
+        batch_count = (~np.isnan(X)).sum(axis=0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            batch_mean = np.where(batch_count > 0, np.nansum(X, axis=0) / batch_count, 0.0)
+        batch_m2 = np.nansum((X - batch_mean) ** 2, axis=0)
+
+        total = self.count + batch_count
+        weight = np.divide(batch_count, total, out=np.zeros_like(self.mean), where=total > 0)
+        delta = batch_mean - self.mean
+        self.mean = self.mean + delta * weight
+        self.m2 = self.m2 + batch_m2 + delta**2 * self.count * weight
+        self.count = total
+
+    @property
+    def variance(self) -> np.ndarray:
+        return np.divide(self.m2, self.count, out=np.zeros_like(self.m2), where=self.count > 0)
+
+    @property
+    def scale(self) -> np.ndarray:
+        """Returns the standard deviation of every column, 1 where it is zero like StandardScaler."""
+        scale = np.sqrt(self.variance)
+        scale[scale == 0] = 1.0
+        return scale
+
+
+class IncrementalPreprocessor:
+    """Streaming counterpart of the DataManager preprocessing for out-of-core training.
+
+    The same features are derived from every batch (titles, family size, age imputed by the mean of
+    the passenger's Title and Pclass group), but every statistic is learned incrementally: the age
+    group means from running sums, the scaling from running moments and the missing numeric values
+    are filled with the running mean instead of the median, which cannot be computed in one pass. The
+    one-hot vocabulary of each categorical feature is discovered as batches arrive and has a fixed
+    number of slots, so every batch transforms to the same columns and the state stays bounded.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        """Initializes an unfitted IncrementalPreprocessor.
+
+        Args:
+            capacity (int): One-hot columns per categorical feature, including the overflow column.
+        """
+        if capacity < 2:
+            raise ValueError("capacity must be at least 2.")
+        self.capacity = capacity
+        self.rows_seen = 0
+        self.age_sums = {}
+        self.age_total = [0.0, 0]
+        self.moments = RunningMoments(len(NUMERIC_FEATURES))
+        self.vocabularies = [{} for _ in CATEGORICAL_FEATURES]
+
+    @property
+    def is_fitted(self) -> bool:
+        """Returns whether at least one batch has been learned from."""
+        return self.rows_seen > 0
+
+    @property
+    def n_features(self) -> int:
+        return len(NUMERIC_FEATURES) + self.capacity * len(CATEGORICAL_FEATURES)
+
+    @property
+    def feature_names(self) -> list:
+        """Returns the names of the transformed feature columns; unused slots are named by their index."""
+        names = [f"num__{feature}" for feature in NUMERIC_FEATURES]
+        for feature, vocabulary in zip(CATEGORICAL_FEATURES, self.vocabularies):
+            slots = {slot: category for category, slot in vocabulary.items()}
+            slots[self.capacity - 1] = OVERFLOW_CATEGORY
+            names.extend(f"cat__{feature}_{slots.get(slot, f'slot{slot}')}" for slot in range(self.capacity))
+        return names
+
+    @property
+    def feature_schema(self) -> dict:
+        """Returns the input and output feature schema of the preprocessor."""
+        return {
+            "numeric_features": list(NUMERIC_FEATURES),
+            "categorical_features": list(CATEGORICAL_FEATURES),
+            "feature_names": self.feature_names,
+        }
+
+    def partial_fit_transform(self, batch: pd.DataFrame) -> np.ndarray:
+        """Updates the statistics with a batch of raw passenger records and transforms it.
+
+        Args:
+            batch (pd.DataFrame): Raw passenger records with the Titanic CSV columns.
+
+        Returns:
+            np.ndarray: A float64 matrix with n_features columns.
+        """
+        return self._transform(batch, update=True)
+
+    def transform(self, batch: pd.DataFrame) -> np.ndarray:
+        """Transforms raw passenger records with the statistics learned so far.
+
+        Categories never seen while fitting go to the overflow column.
+
+        Raises:
+            ValueError: If no batch has been learned from yet.
+        """
+        if not self.is_fitted:
+            raise ValueError("Preprocessor not fitted. Please call partial_fit_transform() first.")
+        return self._transform(batch, update=False)
+
+    def _transform(self, batch: pd.DataFrame, update: bool) -> np.ndarray:
+        titles = extract_titles(batch["Name"])
+        pclass = batch["Pclass"].to_numpy()
+        sibsp = batch["SibSp"].to_numpy(dtype=np.float64)
+        parch = batch["Parch"].to_numpy(dtype=np.float64)
+        family_size = sibsp + parch + 1
+        age = batch["Age"].to_numpy(dtype=np.float64, copy=True)
+        if update:
+            self._update_age_sums(titles, pclass, age)
+        self._impute_age(titles, pclass, age)
+
+        numeric = np.column_stack([age, batch["Fare"].to_numpy(dtype=np.float64), sibsp, parch, family_size])
+        if update:
+            self.moments.update(numeric)
+            self.rows_seen += len(batch)
+        missing = np.isnan(numeric)
+        if missing.any():
+            numeric[missing] = np.broadcast_to(self.moments.mean, numeric.shape)[missing]
+
+        X = np.zeros((len(batch), self.n_features))
+        X[:, : len(NUMERIC_FEATURES)] = (numeric - self.moments.mean) / self.moments.scale
+        is_alone = np.where(family_size > 1, 0, 1)
+        rows = np.arange(len(batch))
+        values = (pclass, batch["Sex"], batch["Embarked"], titles, is_alone)
+        for position, (vocabulary, column) in enumerate(zip(self.vocabularies, values)):
+            codes, uniques = pd.factorize(column)
+            slots = [self._slot(vocabulary, _category_key(value), update) for value in uniques]
+            # factorize marks missing values with -1, which picks the trailing "missing" slot
+            slots.append(self._slot(vocabulary, MISSING_CATEGORY, update) if (codes < 0).any() else 0)
+            slots = np.array(slots)
+            X[rows, len(NUMERIC_FEATURES) + position * self.capacity + slots[codes]] = 1.0
+        return X
+
+    def _slot(self, vocabulary: dict, category: object, update: bool) -> int:
+        slot = vocabulary.get(category)
+        if slot is None and update and len(vocabulary) < self.capacity - 1:
+            slot = vocabulary[category] = len(vocabulary)
+        return self.capacity - 1 if slot is None else slot
+
+    def _update_age_sums(self, titles: np.ndarray, pclass: np.ndarray, age: np.ndarray) -> None:
+        known = ~np.isnan(age)
+        groups = pd.DataFrame({"title": titles[known], "pclass": pclass[known], "age": age[known]})
+        group_sums = groups.groupby(["title", "pclass"])["age"].agg(["sum", "count"])
+        for (title, group_pclass), (total, count) in group_sums.iterrows():
+            sums = self.age_sums.setdefault((title, int(group_pclass)), [0.0, 0])
+            sums[0] += total
+            sums[1] += int(count)
+        self.age_total[0] += float(age[known].sum())
+        self.age_total[1] += int(known.sum())
+
+    def _impute_age(self, titles: np.ndarray, pclass: np.ndarray, age: np.ndarray) -> None:
+        missing = np.isnan(age)
+        if not missing.any():
+            return
+        fallback = self.age_total[0] / self.age_total[1] if self.age_total[1] else np.nan
+        if not self.age_sums:
+            age[missing] = fallback
+            return
+        means = pd.Series(
+            [total / count for total, count in self.age_sums.values()],
+            index=pd.MultiIndex.from_tuples(list(self.age_sums)),
+        )
+        keys = pd.MultiIndex.from_arrays([titles[missing], pclass[missing].astype(np.int64)])
+        age[missing] = means.reindex(keys).fillna(fallback).to_numpy()
+
+
+def train_incremental(
+    filepath: str,
+    model_name: str = "sgd_logistic",
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    epochs: int = 1,
+    capacity: int = DEFAULT_CAPACITY,
+    model: Optional[BaseModel] = None,
+) -> tuple:
+    """Trains a model out of core, streaming a CSV file batch by batch.
+
+    Only one batch is in memory at a time. The preprocessing statistics are learned during the first
+    epoch; later epochs transform the batches with the final statistics.
+
+    Args:
+        filepath (str): CSV with the raw Titanic columns, including Survived, or a directory or glob
+            pattern of such CSV shards.
+        model_name (str): The ModelFactory name of a model with a partial_train() method.
+        batch_size (int): Number of rows parsed and learned from at a time.
+        epochs (int): Number of passes over the file.
+        capacity (int): One-hot columns per categorical feature.
+        model (BaseModel, optional): An already created model, e.g. with tuned parameters.
+
+    Returns:
+        tuple: The trained model, the fitted IncrementalPreprocessor and a stats dict with the
+            rows, epochs, seconds and rows_per_second of the training.
+
+    Raises:
+        ValueError: If the model cannot be trained incrementally or the file has no Survived column.
+    """
+    model = model if model is not None else ModelFactory.create_model(model_name)
+    if not hasattr(model, "partial_train"):
+        raise ValueError(f"Model {model_name} cannot be trained incrementally.")
+
+    preprocessor = IncrementalPreprocessor(capacity)
+    rows = 0
+    start = time.perf_counter()
+    for epoch in range(epochs):
+        for batch in iter_csv_chunks(filepath, batch_size):
+            if "Survived" not in batch.columns:
+                raise ValueError(f"{filepath} has no Survived column to train on.")
+            X = preprocessor.partial_fit_transform(batch) if epoch == 0 else preprocessor.transform(batch)
+            model.partial_train(X, batch["Survived"].to_numpy())
+            rows += len(batch)
+    seconds = time.perf_counter() - start
+
+    stats = {"rows": rows, "epochs": epochs, "seconds": seconds, "rows_per_second": rows / seconds if seconds else 0.0}
+    logging.info(f"Trained {model_name} on {rows} rows in {seconds:.1f}s ({stats['rows_per_second']:.0f} rows/s).")
+    return model, preprocessor, stats
+
+
+def _category_key(value: object) -> object:
+    return value.item() if isinstance(value, np.generic) else value
@@ -0,0 +1,43 @@
+import importlib
+
+from typing import Any, Optional
+
+
+class LazyAttribute:
+    """Stands in for a module, or an attribute of a module, that is imported on first use.
+
+    Calling the stand-in or reading any of its attributes imports the target and forwards to it,
+    so module-level names can be declared without paying for heavy imports such as pandas or
+    scikit-learn until a code path actually needs them.
+    """
+
+    def __init__(self, module: str, name: Optional[str] = None) -> None:
+        """Initializes the LazyAttribute.
+
+        Args:
+            module (str): Absolute name of the module to import.
+            name (str, optional): Attribute of the module to stand in for. When omitted the
+                module itself is the target.
+        """
+        self._module = module
+        self._name = name
+        self._target = None
+
+    def resolve(self) -> Any:
+        """Imports and returns the target."""
+        if self._target is None:
+            module = importlib.import_module(self._module)
+            self._target = module if self._name is None else getattr(module, self._name)
+        return self._target
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self.resolve()(*args, **kwargs)
+
+    def __getattr__(self, attribute: str) -> Any:
+        if attribute.startswith("_"):
+            raise AttributeError(attribute)
+        return getattr(self.resolve(), attribute)
+
+    def __repr__(self) -> str:
+        target = self._module if self._name is None else f"{self._module}.{self._name}"
+        return f"<lazy {target}>"
@@ -0,0 +1,145 @@
+import logging
+import os
+
+from datetime import datetime, timezone
+from typing import Optional, Union
+
+import joblib
+import numpy as np
+import pandas as pd
+import sklearn
+
+from src.data_manager import DataManager, FeaturePreprocessor
+from src.incremental import IncrementalPreprocessor
+from src.models.base_model import BaseModel
+from src.resources import get_n_jobs, set_estimator_n_jobs
+
+ARTIFACT_VERSION = 1
+
+
+class ModelArtifact:
+    """A trained model bundled with the fitted preprocessor and the feature schema it expects.
+
+    The artifact is stored as a single uncompressed joblib file so that it can be loaded back with
+    memory-mapping: the numpy arrays inside the preprocessor and the estimator are mapped from disk
+    instead of being copied into memory, which keeps loading fast for serving.
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        model: BaseModel,
+        preprocessor: Union[FeaturePreprocessor, IncrementalPreprocessor],
+        metadata: Optional[dict] = None,
+    ) -> None:
+        """Initializes the ModelArtifact.
+
+        Args:
+            model_name (str): The ModelFactory name of the model.
+            model (BaseModel): The trained model.
+            preprocessor (FeaturePreprocessor or IncrementalPreprocessor): The preprocessor fitted on the
+                training data; an IncrementalPreprocessor for models trained out of core.
+            metadata (dict, optional): Extra information stored with the artifact, e.g. the training file.
+        """
+        if not preprocessor.is_fitted:
+            raise ValueError("The preprocessor must be fitted before it can be stored in an artifact.")
+        self.model_name = model_name
+        self.model = model
+        self.preprocessor = preprocessor
+        self.metadata = metadata or {}
+        self.version = ARTIFACT_VERSION
+
+    @property
+    def is_incremental(self) -> bool:
+        """Returns whether the model was trained out of core with an IncrementalPreprocessor."""
+        return isinstance(self.preprocessor, IncrementalPreprocessor)
+
+    @property
+    def feature_schema(self) -> dict:
+        """Returns the feature schema the model was trained on."""
+        return self.preprocessor.feature_schema
+
+    def save(self, path: str) -> None:
+        """Saves the artifact to a single versioned joblib file.
+
+        Args:
+            path (str): Destination file path. Parent directories are created when needed.
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        payload = {
+            "version": self.version,
+            "sklearn_version": sklearn.__version__,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "model_name": self.model_name,
+            "model": self.model,
+            "preprocessor": self.preprocessor,
+            "feature_schema": self.feature_schema,
+            "metadata": self.metadata,
+        }
+        joblib.dump(payload, path)
+        logging.info(f"Model artifact saved to {path}.")
+
+    @classmethod
+    def load(cls, path: str, mmap_mode: Optional[str] = "r") -> "ModelArtifact":
+        """Loads an artifact saved with save().
+
+        Args:
+            path (str): Path of the artifact file.
+            mmap_mode (str, optional): joblib memory-mapping mode for the stored arrays. Use None to
+                load everything into memory.
+
+        The n_jobs of the model's estimator is set to the core budget of this process, not the one it was
+        trained with.
+
+        Returns:
+            ModelArtifact: The loaded artifact.
+
+        Raises:
+            ValueError: If the file was written with an incompatible artifact version.
+        """
+        payload = joblib.load(path, mmap_mode=mmap_mode)
+        if payload.get("version") != ARTIFACT_VERSION:
+            raise ValueError(
+                f"Unsupported artifact version {payload.get('version')} in {path}, expected {ARTIFACT_VERSION}."
+            )
+        if payload["sklearn_version"] != sklearn.__version__:
+            logging.warning(
+                f"Artifact was created with scikit-learn {payload['sklearn_version']}, "
+                f"running with {sklearn.__version__}."
+            )
+        artifact = cls(payload["model_name"], payload["model"], payload["preprocessor"], payload["metadata"])
+        set_estimator_n_jobs(artifact.model, get_n_jobs())
+        logging.info(f"Model artifact loaded from {path}.")
+        return artifact
+
+    def predict(self, data: pd.DataFrame) -> np.ndarray:
+        """Preprocesses raw passenger records with the stored preprocessor and predicts survival.
+
+        Args:
+            data (pd.DataFrame): Raw passenger records with the Titanic CSV columns. Survived is optional.
+
+        Returns:
+            np.ndarray: The predicted values.
+        """
+        return self.model.predict(self._transform(data))
+
+    def predict_proba(self, data: pd.DataFrame) -> np.ndarray:
+        """Preprocesses raw passenger records with the stored preprocessor and predicts the probability of survival.
+
+        Args:
+            data (pd.DataFrame): Raw passenger records with the Titanic CSV columns. Survived is optional.
+
+        Returns:
+            np.ndarray: The probability of survival of every passenger.
+        """
+        return self.model.predict_proba(self._transform(data))
+
+    def _transform(self, data: pd.DataFrame) -> np.ndarray:
+        if self.is_incremental:
+            return self.preprocessor.transform(data)
+        data_manager = DataManager(filepath=None, preprocessor=self.preprocessor)
+        data_manager.load_frame(data)
+        data_manager.preprocess()
+        return data_manager.get_processed_data()
@@ -0,0 +1,129 @@
+import time
+
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from joblib import Parallel, delayed
+
+from src.data_manager import DataManager
+from src.evaluation import REPORT_METRICS, FullReport
+from src.models.model_factory import ModelFactory
+from src.parallel import shared_arrays
+from src.resources import get_n_jobs, split_n_jobs, worker_limits
+
+
+def train_and_evaluate(
+    model_name: str,
+    X_train: np.ndarray,
+    y_train: np.ndarray,
+    X_test: np.ndarray,
+    y_test: np.ndarray,
+    n_threads: Optional[int] = None,
+) -> dict:
+    """Trains one model, scores it on the test split and times both steps.
+
+    Args:
+        model_name (str): The ModelFactory name of the model.
+        X_train (np.ndarray): Training feature data.
+        y_train (np.ndarray): Training target data.
+        X_test (np.ndarray): Test feature data.
+        y_test (np.ndarray): Test target data.
+        n_threads (int, optional): Threads the model and the BLAS/OpenMP pools may use, by default the
+            whole core budget.
+
+    Returns:
+        dict: The model name, every metric of the full report and the train/predict wall times in seconds.
+    """
+    with worker_limits(n_threads or get_n_jobs()):
+        model = ModelFactory.create_model(model_name)
+        start = time.perf_counter()
+        model.train(X_train, y_train)
+        train_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        y_pred = model.predict(X_test)
+        predict_seconds = time.perf_counter() - start
+
+    scores = dict(zip(REPORT_METRICS, FullReport().evaluate(y_test, y_pred)))
+    return {"model": model_name, **scores, "train_seconds": train_seconds, "predict_seconds": predict_seconds}
+
+
+def feature_key(model_name: str) -> tuple:
+    """Returns the (encoding, dtype) of the feature matrix a model declares, see BaseModel.feature_encoding."""
+    return ModelFactory.feature_encoding(model_name), ModelFactory.feature_dtype(model_name)
+
+
+def preprocess_for_models(data: pd.DataFrame, model_names: Optional[list] = None) -> tuple:
+    """Preprocesses raw passenger records once for every feature matrix the models declare.
+
+    Args:
+        data (pd.DataFrame): Raw passenger records with the Survived target; the frame is not modified.
+        model_names (list, optional): Models to preprocess for. Defaults to every model in the ModelFactory.
+
+    Returns:
+        tuple: A dict mapping every feature_key() of the models to its processed features, and the target.
+    """
+    model_names = model_names or ModelFactory.available_models()
+    features = {}
+    for encoding, dtype in dict.fromkeys(feature_key(model_name) for model_name in model_names):
+        data_manager = DataManager(None, encoding=encoding, dtype=dtype)
+        data_manager.load_frame(data.copy())
+        data_manager.preprocess()
+        features[encoding, dtype] = data_manager.get_processed_data()
+    return features, data_manager.get_target().to_numpy()
+
+
+def compare_models(
+    features: dict,
+    y_train: np.ndarray,
+    y_test: np.ndarray,
+    model_names: Optional[list] = None,
+    n_jobs: Optional[int] = None,
+) -> list:
+    """Trains and evaluates several models in parallel on the same split.
+
+    Every model gets the feature matrix of its declared encoding and dtype, e.g. ordinal float64
+    features for hist_gradient_boosting and one-hot float32 features for the random forest. The
+    splits are placed in shared memory once and every worker process reads them from there.
+
+    Args:
+        features (dict): Maps the feature_key() of every compared model to its (X_train, X_test) split.
+        y_train (np.ndarray): Training target data.
+        y_test (np.ndarray): Test target data.
+        model_names (list, optional): Models to compare. Defaults to every model in the ModelFactory.
+        n_jobs (int, optional): Number of worker processes within the core budget of src.resources,
+            None or -1 for the whole budget.
+
+    Returns:
+        list: One result dict per model, in the order of model_names.
+
+    Raises:
+        ValueError: If the features of a model's encoding and dtype are missing.
+    """
+    model_names = model_names or ModelFactory.available_models()
+    for model_name in model_names:
+        if feature_key(model_name) not in features:
+            raise ValueError(f"No {' '.join(feature_key(model_name))} features for the {model_name} model.")
+    keys = list(features)
+    workers, n_threads = split_n_jobs(n_jobs, len(model_names))
+    with shared_arrays(*(array for key in keys for array in features[key]), y_train, y_test) as shared:
+        *matrices, y_train, y_test = shared
+        splits = dict(zip(keys, zip(matrices[::2], matrices[1::2])))
+        tasks = [(model_name, *splits[feature_key(model_name)]) for model_name in model_names]
+        return Parallel(n_jobs=workers)(
+            delayed(train_and_evaluate)(model_name, X_train, y_train, X_test, y_test, n_threads)
+            for model_name, X_train, X_test in tasks
+        )
+
+
+def format_comparison(results: list) -> str:
+    """Formats the results of compare_models as a text table, best accuracy first."""
+    metrics = "".join(f"{metric:>11}" for metric in REPORT_METRICS)
+    header = f"{'model':<22}{metrics}{'train (s)':>12}{'predict (s)':>13}"
+    lines = [header, "-" * len(header)]
+    for result in sorted(results, key=lambda result: result["accuracy"], reverse=True):
+        scores = "".join(f"{result[metric]:>11.4f}" for metric in REPORT_METRICS)
+        lines.append(f"{result['model']:<22}{scores}{result['train_seconds']:>12.3f}{result['predict_seconds']:>13.4f}")
+    return "\n".join(lines)
@@ -2,14 +2,32 @@
 
 import numpy as np
 
+from src.profiling import profiled
+
 
 class BaseModel(ABC):
     """Abstract base class for machine learning models.
 
     This class defines the basic structure and interface for machine learning models,
     with abstract methods for training and prediction.
+
+    The train, predict and predict_proba methods of every subclass are recorded as stages by the running
+    profiler (see src.profiling), named after the subclass.
     """
 
+    # Categorical encoding of the features the model expects from DataManager: "onehot" or "ordinal"
+    feature_encoding = "onehot"
+    # dtype of the feature matrix the model expects from DataManager: "float32", or "float64" for estimators
+    # that compute in double precision and would otherwise copy a float32 matrix on every fit and predict
+    feature_dtype = "float32"
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        for method in ("train", "predict", "predict_proba"):
+            function = cls.__dict__.get(method)
+            if function is not None and not getattr(function, "__profiled__", False):
+                setattr(cls, method, profiled(rows=lambda self, X, *args, **kwargs: X.shape[0])(function))
+
     @abstractmethod
     def train(self, X_train: np.ndarray, y_train: np.ndarray) -> None:
         """Trains the model on the provided dataset.
@@ -36,3 +54,18 @@ def predict(self, X: np.ndarray) -> np.ndarray:
             This method needs to be implemented by subclasses.
         """
         pass
+
+    @abstractmethod
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        """Predicts the probability of the positive class (survival) on the given input data.
+
+        Args:
+            X (np.ndarray): Feature data for prediction, where rows are samples and columns are features.
+
+        Returns:
+            np.ndarray: The probability of survival of every sample, as a 1D array of floats in [0, 1].
+
+        Note:
+            This method needs to be implemented by subclasses.
+        """
+        pass
@@ -1,7 +1,12 @@
 import numpy as np
 
+from src.data_manager import encoded_feature_names
+
 from .base_model import BaseModel
 
+# Column of the one-hot encoded feature matrix flagging female passengers
+FEMALE_COLUMN = encoded_feature_names().index("cat__Sex_female")
+
 
 class GenderBaselineModel(BaseModel):
     """Gender baseline model for predicting survival.
@@ -28,12 +33,31 @@ def predict(self, X: np.ndarray) -> np.ndarray:
         """Predicts survival based on gender.
 
         The prediction is made based on the gender of the passenger: predicts `1` (survived) if female,
-        and `0` (not survived) if male. Assumes that gender is represented in the 9th column (index 8) of the input array.
+        and `0` (not survived) if male, read from the FEMALE_COLUMN of the one-hot encoded features.
 
         Args:
-            X (np.ndarray): Feature data for prediction.
+            X (np.ndarray): Feature data for prediction, dense or sparse.
 
         Returns:
             np.ndarray: Predicted survival, with `1` for female and `0` for male.
         """
-        return (X[:, 8].astype("int")).astype(int)
+        return _female(X).astype(int)
+
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        """Returns degenerate survival probabilities: 1.0 for female and 0.0 for male passengers.
+
+        Since the baseline has no notion of confidence, every threshold between 0 and 1 gives the same predictions.
+
+        Args:
+            X (np.ndarray): Feature data for prediction, dense or sparse.
+
+        Returns:
+            np.ndarray: The probability of survival of every sample.
+        """
+        return _female(X).astype(np.float64)
+
+
+def _female(X: np.ndarray) -> np.ndarray:
+    """Returns the FEMALE_COLUMN of a dense or sparse feature matrix as a 1-D view or array."""
+    column = X[:, FEMALE_COLUMN]
+    return column.toarray().ravel() if hasattr(column, "toarray") else column
@@ -12,9 +12,13 @@ class GradientBoostingModel(BaseModel):
     train and predict functionalities.
     """
 
-    def __init__(self) -> None:
-        """Initializes the GradientBoostingModel with a GradientBoostingClassifier."""
-        self.model = GradientBoostingClassifier(random_state=42)
+    def __init__(self, **params) -> None:
+        """Initializes the GradientBoostingModel with a GradientBoostingClassifier.
+
+        Args:
+            **params: Hyperparameters passed to the GradientBoostingClassifier, overriding the defaults.
+        """
+        self.model = GradientBoostingClassifier(**{"random_state": 42, **params})
 
     def train(self, X_train: np.ndarray, y_train: np.ndarray) -> None:
         """Trains the GradientBoosting model on the provided dataset.
@@ -35,3 +39,14 @@ def predict(self, X: np.ndarray) -> np.ndarray:
             np.ndarray: The predicted values.
         """
         return self.model.predict(X)
+
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        """Predicts the probability of survival using the trained GradientBoosting model.
+
+        Args:
+            X (np.ndarray): Feature data for prediction.
+
+        Returns:
+            np.ndarray: The probability of survival of every sample.
+        """
+        return self.model.predict_proba(X)[:, 1]
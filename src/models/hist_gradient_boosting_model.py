@@ -0,0 +1,81 @@
+import numpy as np
+
+from sklearn.ensemble import HistGradientBoostingClassifier
+
+from src.data_manager import CATEGORICAL_FEATURES, NUMERIC_FEATURES
+
+from .base_model import BaseModel
+
+# Columns of the ordinal-encoded feature matrix holding categorical codes
+CATEGORICAL_COLUMNS = list(range(len(NUMERIC_FEATURES), len(NUMERIC_FEATURES) + len(CATEGORICAL_FEATURES)))
+
+
+class HistGradientBoostingModel(BaseModel):
+    """Histogram-based Gradient Boosting model wrapper class.
+
+    This class is a wrapper for the HistGradientBoostingClassifier from sklearn. Features are binned
+    into histograms and the trees are grown with multiple threads, so training scales to millions of
+    rows. The model takes ordinal-encoded features (DataManager with encoding="ordinal") and splits
+    on the categorical codes natively instead of on one-hot columns. Training stops early once the
+    score on a held-out validation fraction stops improving.
+    """
+
+    feature_encoding = "ordinal"
+    # The binning and the early-stopping scorer convert their input to float64
+    feature_dtype = "float64"
+
+    def __init__(self, **params) -> None:
+        """Initializes the HistGradientBoostingModel with a HistGradientBoostingClassifier.
+
+        Args:
+            **params: Hyperparameters passed to the HistGradientBoostingClassifier, overriding the defaults.
+        """
+        defaults = {
+            "max_iter": 500,
+            "early_stopping": True,
+            "validation_fraction": 0.1,
+            "n_iter_no_change": 20,
+            "random_state": 42,
+        }
+        self.model = HistGradientBoostingClassifier(**{**defaults, **params})
+
+    def train(self, X_train: np.ndarray, y_train: np.ndarray) -> None:
+        """Trains the HistGradientBoosting model on the provided dataset.
+
+        Args:
+            X_train (np.ndarray): Training feature data, ordinal-encoded for native categorical splits.
+            y_train (np.ndarray): Training target data.
+
+        Raises:
+            ValueError: If the features are not ordinal-encoded.
+        """
+        if X_train.shape[1] != len(NUMERIC_FEATURES) + len(CATEGORICAL_FEATURES):
+            raise ValueError(
+                f"{type(self).__name__} takes ordinal-encoded features with "
+                f"{len(NUMERIC_FEATURES) + len(CATEGORICAL_FEATURES)} columns, got {X_train.shape[1]}; "
+                'preprocess them with DataManager(encoding="ordinal").'
+            )
+        self.model.set_params(categorical_features=CATEGORICAL_COLUMNS)
+        self.model.fit(X_train, y_train)
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """Makes predictions using the trained HistGradientBoosting model.
+
+        Args:
+            X (np.ndarray): Feature data for prediction.
+
+        Returns:
+            np.ndarray: The predicted values.
+        """
+        return self.model.predict(X)
+
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        """Predicts the probability of survival using the trained HistGradientBoosting model.
+
+        Args:
+            X (np.ndarray): Feature data for prediction.
+
+        Returns:
+            np.ndarray: The probability of survival of every sample.
+        """
+        return self.model.predict_proba(X)[:, 1]
@@ -12,9 +12,16 @@ class LogisticRegressionModel(BaseModel):
     train and predict functionalities.
     """
 
-    def __init__(self) -> None:
-        """Initializes LogisticRegressionModel with a LogisticRegression."""
-        self.model = LogisticRegression(random_state=42)
+    # The lbfgs solver works in float64 only, so it takes float64 features instead of copying float32 ones
+    feature_dtype = "float64"
+
+    def __init__(self, **params) -> None:
+        """Initializes LogisticRegressionModel with a LogisticRegression.
+
+        Args:
+            **params: Hyperparameters passed to the LogisticRegression, overriding the defaults.
+        """
+        self.model = LogisticRegression(**{"random_state": 42, **params})
 
     def train(self, X_train: np.ndarray, y_train: np.ndarray) -> None:
         """Trains the LogisticRegression model on the provided dataset.
@@ -35,3 +42,14 @@ def predict(self, X: np.ndarray) -> np.ndarray:
             np.ndarray: The predicted values.
         """
         return self.model.predict(X)
+
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        """Predicts the probability of survival using the trained LogisticRegression model.
+
+        Args:
+            X (np.ndarray): Feature data for prediction.
+
+        Returns:
+            np.ndarray: The probability of survival of every sample.
+        """
+        return self.model.predict_proba(X)[:, 1]
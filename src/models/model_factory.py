@@ -1,25 +1,88 @@
+import importlib
+import json
+
+from src.resources import get_n_jobs, set_estimator_n_jobs
+
 from .base_model import BaseModel
-from .gender_baseline_model import GenderBaselineModel
-from .gradient_boosting_model import GradientBoostingModel
-from .logistic_regression_model import LogisticRegressionModel
-from .random_forest_model import RandomForestModel
 
 
 class ModelFactory:
     """Factory class for creating instances of different model types.
 
     This class provides a static method to instantiate model objects based on a given model name.
+    Models are registered by module and class name and only imported when first created, so using
+    one model never pays for importing the others.
     """
 
+    # Model name -> (module relative to this package, class name)
+    _registry = {
+        "gender_baseline": (".gender_baseline_model", "GenderBaselineModel"),
+        "random_forest": (".random_forest_model", "RandomForestModel"),
+        "gradient_boosting": (".gradient_boosting_model", "GradientBoostingModel"),
+        "hist_gradient_boosting": (".hist_gradient_boosting_model", "HistGradientBoostingModel"),
+        "logistic_regression": (".logistic_regression_model", "LogisticRegressionModel"),
+        "sgd_logistic": (".sgd_logistic_model", "SGDLogisticModel"),
+    }
+
+    @staticmethod
+    def available_models() -> list:
+        """Returns the names of every model the factory can create."""
+        return list(ModelFactory._registry)
+
+    @staticmethod
+    def register_model(model_name: str, module: str, class_name: str) -> None:
+        """Registers a model class to be imported from a module when it is first created.
+
+        Args:
+            model_name (str): The name the model is created by.
+            module (str): Module defining the class, absolute or relative to this package.
+            class_name (str): Name of a BaseModel subclass in that module.
+        """
+        ModelFactory._registry[model_name] = (module, class_name)
+
+    @staticmethod
+    def get_model_class(model_name: str) -> type:
+        """Imports and returns the class registered for a model name.
+
+        Raises:
+            ValueError: If an unknown model type is specified.
+        """
+        if model_name not in ModelFactory._registry:
+            raise ValueError(f"Unknown model type: {model_name}")
+        module, class_name = ModelFactory._registry[model_name]
+        return getattr(importlib.import_module(module, __package__), class_name)
+
+    @staticmethod
+    def feature_encoding(model_name: str) -> str:
+        """Returns the categorical feature encoding ("onehot" or "ordinal") a model expects.
+
+        Raises:
+            ValueError: If an unknown model type is specified.
+        """
+        return ModelFactory.get_model_class(model_name).feature_encoding
+
+    @staticmethod
+    def feature_dtype(model_name: str) -> str:
+        """Returns the dtype of the feature matrix ("float32" or "float64") a model expects.
+
+        Raises:
+            ValueError: If an unknown model type is specified.
+        """
+        return ModelFactory.get_model_class(model_name).feature_dtype
+
     @staticmethod
-    def create_model(model_name: str) -> BaseModel:
+    def create_model(model_name: str, **params) -> BaseModel:
         """Creates and returns an instance of the specified model.
 
         Based on the provided model name, this method returns an instance of the corresponding model class.
-        Supported models include 'gender_baseline', 'random_forest', 'gradient_boosting', and 'logistic_regression'.
+        Supported models include 'gender_baseline', 'random_forest', 'gradient_boosting',
+        'hist_gradient_boosting', 'logistic_regression' and 'sgd_logistic'.
+
+        Estimators with an n_jobs parameter get the core budget of src.resources unless params set it.
 
         Args:
             model_name (str): The name of the model to create.
+            **params: Hyperparameters passed to the model, e.g. the best configuration found by tuning.
 
         Returns:
             An instance of the specified model class.
@@ -27,13 +90,21 @@ def create_model(model_name: str) -> BaseModel:
         Raises:
             ValueError: If an unknown model type is specified.
         """
-        if model_name == "gender_baseline":
-            return GenderBaselineModel()
-        elif model_name == "random_forest":
-            return RandomForestModel()
-        elif model_name == "gradient_boosting":
-            return GradientBoostingModel()
-        elif model_name == "logistic_regression":
-            return LogisticRegressionModel()
-        else:
-            raise ValueError(f"Unknown model type: {model_name}")
+        model = ModelFactory.get_model_class(model_name)(**params)
+        if "n_jobs" not in params:
+            set_estimator_n_jobs(model, get_n_jobs())
+        return model
+
+    @staticmethod
+    def create_model_from_config(config_path: str) -> BaseModel:
+        """Creates a model from a JSON configuration file such as the one written by the tune command.
+
+        Args:
+            config_path (str): Path to a JSON file with a "model" name and a "params" mapping.
+
+        Returns:
+            An instance of the configured model class.
+        """
+        with open(config_path) as file:
+            config = json.load(file)
+        return ModelFactory.create_model(config["model"], **config.get("params", {}))
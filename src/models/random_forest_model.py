@@ -12,9 +12,13 @@ class RandomForestModel(BaseModel):
     train and predict functionalities.
     """
 
-    def __init__(self) -> None:
-        """Initializes the RandomForestModel with a RandomForestClassifier."""
-        self.model = RandomForestClassifier(random_state=42)
+    def __init__(self, **params) -> None:
+        """Initializes the RandomForestModel with a RandomForestClassifier.
+
+        Args:
+            **params: Hyperparameters passed to the RandomForestClassifier, overriding the defaults.
+        """
+        self.model = RandomForestClassifier(**{"random_state": 42, **params})
 
     def train(self, X_train: np.ndarray, y_train: np.ndarray) -> None:
         """Trains the RandomForest model on the provided dataset.
@@ -35,3 +39,14 @@ def predict(self, X: np.ndarray) -> np.ndarray:
             np.ndarray: The predicted values.
         """
         return self.model.predict(X)
+
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        """Predicts the probability of survival using the trained RandomForest model.
+
+        Args:
+            X (np.ndarray): Feature data for prediction.
+
+        Returns:
+            np.ndarray: The probability of survival of every sample.
+        """
+        return self.model.predict_proba(X)[:, 1]
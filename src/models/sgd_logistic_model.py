@@ -0,0 +1,63 @@
+import numpy as np
+
+from sklearn.linear_model import SGDClassifier
+
+from .base_model import BaseModel
+
+CLASSES = np.array([0, 1])
+
+
+class SGDLogisticModel(BaseModel):
+    """Logistic regression trained by stochastic gradient descent.
+
+    Besides the usual in-memory train(), the model can learn from a stream of batches with
+    partial_train(), so it can be trained on files that do not fit in memory (see src.incremental).
+    """
+
+    def __init__(self, **params) -> None:
+        """Initializes SGDLogisticModel with an SGDClassifier using the logistic loss.
+
+        Args:
+            **params: Hyperparameters passed to the SGDClassifier, overriding the defaults.
+        """
+        self.model = SGDClassifier(**{"loss": "log_loss", "alpha": 1e-3, "random_state": 42, **params})
+
+    def train(self, X_train: np.ndarray, y_train: np.ndarray) -> None:
+        """Trains the model on the whole provided dataset.
+
+        Args:
+            X_train (np.ndarray): Training feature data.
+            y_train (np.ndarray): Training target data.
+        """
+        self.model.fit(X_train, y_train)
+
+    def partial_train(self, X_batch: np.ndarray, y_batch: np.ndarray) -> None:
+        """Updates the model with one batch of training data.
+
+        Args:
+            X_batch (np.ndarray): Feature data of the batch; every batch must have the same columns.
+            y_batch (np.ndarray): Target data of the batch.
+        """
+        self.model.partial_fit(X_batch, y_batch, classes=CLASSES)
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """Makes predictions using the trained model.
+
+        Args:
+            X (np.ndarray): Feature data for prediction.
+
+        Returns:
+            np.ndarray: The predicted values.
+        """
+        return self.model.predict(X)
+
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        """Predicts the probability of survival using the trained SGDLogistic model.
+
+        Args:
+            X (np.ndarray): Feature data for prediction.
+
+        Returns:
+            np.ndarray: The probability of survival of every sample.
+        """
+        return self.model.predict_proba(X)[:, 1]
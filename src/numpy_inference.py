@@ -0,0 +1,248 @@
+import json
+import math
+import re
+
+from typing import Any
+
+import numpy as np
+
+from src.data_manager import NUMERIC_FEATURES, TITLE_BUCKETS, TITLE_PATTERN, FeaturePreprocessor
+from src.model_artifact import ModelArtifact
+from src.models.gender_baseline_model import FEMALE_COLUMN
+
+MISSING_CATEGORY = "missing"
+
+
+class NumpyPredictor:
+    """A trained model artifact compiled into plain NumPy arrays.
+
+    The fitted preprocessing becomes an age lookup table, the numeric medians, the scaler means and
+    scales and one dict per categorical feature mapping a category to its one-hot column. The model
+    becomes its coefficients (logistic regression), flattened node arrays (random forest and gradient
+    boosting trees) or a feature column (gender baseline). Scoring then needs neither pandas nor
+    sklearn, which removes their validation and dispatch overhead from single-row predictions while
+    giving the same results as ModelArtifact.predict.
+    """
+
+    def __init__(self, model_name: str, arrays: dict, metadata: dict) -> None:
+        """Initializes the NumpyPredictor. Use from_artifact() or load() to build one.
+
+        Args:
+            model_name (str): The ModelFactory name of the compiled model.
+            arrays (dict): The compiled numeric parameters.
+            metadata (dict): JSON-serializable parameters: categories, age lookup and model scalars.
+        """
+        self.model_name = model_name
+        self.arrays: dict[str, np.ndarray] = arrays
+        self.metadata = metadata
+        # Keyed by float classes too: 3.0 hashes like 3
+        self._age_means: dict[tuple[str, float], float] = {
+            (title, int(pclass)): age for title, pclass, age in metadata["age_means"]
+        }
+        self._category_columns = [
+            {_category_key(category): column for column, category in enumerate(categories, start=offset)}
+            for categories, offset in zip(metadata["categories"], metadata["category_offsets"])
+        ]
+        self._n_numeric = len(NUMERIC_FEATURES)
+
+    @classmethod
+    def from_artifact(cls, artifact: ModelArtifact) -> "NumpyPredictor":
+        """Compiles a model artifact.
+
+        Raises:
+            ValueError: If the artifact holds a model type that cannot be compiled.
+        """
+        preprocessor = artifact.preprocessor
+        if not isinstance(preprocessor, FeaturePreprocessor):
+            raise ValueError("Models trained out of core cannot be compiled to NumPy.")
+        if preprocessor.encoding != "onehot":
+            raise ValueError(f"Model type {artifact.model_name} cannot be compiled to NumPy.")
+        transformer, age_means = preprocessor.transformer, preprocessor.age_means
+        if transformer is None or age_means is None:
+            raise ValueError("The artifact's preprocessor is not fitted.")
+        numeric = transformer.named_transformers_["num"]
+        categorical = transformer.named_transformers_["cat"]
+        encoder = categorical.named_steps["onehot"]
+        categories = [[_to_builtin(value) for value in values] for values in encoder.categories_]
+
+        offsets = np.cumsum([len(NUMERIC_FEATURES)] + [len(values) for values in categories])
+        metadata = {
+            # Groups without any known age are left out so they fall back like in DataManager
+            "age_means": [[title, int(pclass), float(age)] for (title, pclass), age in age_means.items() if age == age],
+            "fallback_age": preprocessor.fallback_age,
+            "categories": categories,
+            "category_offsets": [int(offset) for offset in offsets[:-1]],
+            "n_features": int(offsets[-1]),
+            "dtype": preprocessor.dtype,
+        }
+        arrays = {
+            "numeric_medians": numeric.named_steps["imputer"].statistics_.astype(np.float64),
+            "scaler_mean": numeric.named_steps["scaler"].mean_.astype(np.float64),
+            "scaler_scale": numeric.named_steps["scaler"].scale_.astype(np.float64),
+        }
+        arrays.update(_compile_model(artifact.model_name, artifact.model, metadata))
+        return cls(artifact.model_name, arrays, metadata)
+
+    def save(self, path: str) -> None:
+        """Saves the compiled arrays and metadata to a single ``.npz`` file."""
+        metadata = json.dumps({"model_name": self.model_name, **self.metadata})
+        np.savez(path, __metadata__=np.array(metadata), **self.arrays)
+
+    @classmethod
+    def load(cls, path: str) -> "NumpyPredictor":
+        """Loads a predictor saved with save()."""
+        with np.load(path) as stored:
+            arrays = {name: stored[name] for name in stored.files if name != "__metadata__"}
+            metadata = json.loads(stored["__metadata__"].item())
+        return cls(metadata.pop("model_name"), arrays, metadata)
+
+    def transform_records(self, records: list) -> np.ndarray:
+        """Turns raw passenger records into the processed feature matrix.
+
+        Args:
+            records (list): Dicts with the raw Titanic columns; missing keys and None count as missing.
+
+        Returns:
+            np.ndarray: A matrix of the preprocessor's dtype equal to the output of the fitted DataManager
+                preprocessing.
+        """
+        X = np.zeros((len(records), self.metadata["n_features"]))
+        numeric = X[:, : self._n_numeric]
+        for row, record in enumerate(records):
+            title = _extract_title(record.get("Name"))
+            pclass = _number(record.get("Pclass"))
+            sibsp, parch = _number(record.get("SibSp")), _number(record.get("Parch"))
+            family_size = sibsp + parch + 1
+            age = _number(record.get("Age"))
+            if math.isnan(age):
+                age = self._age_means.get((title, pclass), self.metadata["fallback_age"])
+            numeric[row] = (age, _number(record.get("Fare")), sibsp, parch, family_size)
+
+            is_alone = 0 if family_size > 1 else 1
+            values = (pclass, record.get("Sex"), record.get("Embarked"), title, is_alone)
+            for lookup, value in zip(self._category_columns, values):
+                column = lookup.get(_category_key(value))
+                if column is not None:
+                    X[row, column] = 1.0
+
+        numeric_missing = np.isnan(numeric)
+        if numeric_missing.any():
+            numeric[numeric_missing] = np.broadcast_to(self.arrays["numeric_medians"], numeric.shape)[numeric_missing]
+        numeric -= self.arrays["scaler_mean"]
+        numeric /= self.arrays["scaler_scale"]
+        # Rounded like the DataManager output, so the models see the same values; files compiled before
+        # the preprocessor had a dtype are float64
+        return X.astype(self.metadata.get("dtype", "float64"), copy=False)
+
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        """Returns the probability of survival for every row of a processed feature matrix."""
+        if self.model_name == "logistic_regression":
+            return _sigmoid(X @ self.arrays["coef"] + self.arrays["intercept"])
+        if self.model_name == "random_forest":
+            probabilities: np.ndarray = self._traverse(X).mean(axis=1)
+            return probabilities
+        if self.model_name == "gradient_boosting":
+            raw = self.metadata["init_raw"] + self.metadata["learning_rate"] * self._traverse(X).sum(axis=1)
+            return _sigmoid(raw)
+        return X[:, self.metadata["column"]].astype(np.float64)
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """Returns the survival prediction for every row of a processed feature matrix."""
+        if self.model_name == "logistic_regression":
+            scores: np.ndarray = X @ self.arrays["coef"] + self.arrays["intercept"]
+            return (scores > 0).astype(np.int64)
+        if self.model_name == "gradient_boosting":
+            raw: np.ndarray = self.metadata["init_raw"] + self.metadata["learning_rate"] * self._traverse(X).sum(axis=1)
+            return (raw > 0).astype(np.int64)
+        return (self.predict_proba(X) > 0.5).astype(np.int64)
+
+    def predict_records(self, records: list) -> np.ndarray:
+        """Preprocesses raw passenger records and predicts their survival."""
+        return self.predict(self.transform_records(records))
+
+    def _traverse(self, X: np.ndarray) -> np.ndarray:
+        """Walks every row down every tree at once and returns the leaf values, shape (rows, trees)."""
+        # sklearn trees compare float32 features against their thresholds
+        X = np.asarray(X, dtype=np.float32)
+        feature, threshold = self.arrays["feature"], self.arrays["threshold"]
+        left, right = self.arrays["left"], self.arrays["right"]
+        nodes = np.broadcast_to(self.arrays["roots"], (len(X), len(self.arrays["roots"])))
+        rows = np.arange(len(X))[:, None]
+        # Leaves point to themselves, so after max_depth steps every row sits on its leaf in every tree
+        for _ in range(int(self.metadata["max_depth"])):
+            nodes = np.where(X[rows, feature[nodes]] <= threshold[nodes], left[nodes], right[nodes])
+        return np.take(self.arrays["leaf_value"], nodes)
+
+
+def _compile_model(model_name: str, model: Any, metadata: dict) -> dict:
+    if model_name == "logistic_regression":
+        estimator = model.model
+        return {"coef": estimator.coef_[0].astype(np.float64), "intercept": estimator.intercept_.astype(np.float64)}
+    if model_name == "random_forest":
+        trees = [estimator.tree_ for estimator in model.model.estimators_]
+        leaf_values = [tree.value[:, 0, 1] / tree.value[:, 0, :].sum(axis=1) for tree in trees]
+        return _flatten_trees(trees, leaf_values, metadata)
+    if model_name == "gradient_boosting":
+        estimator = model.model
+        trees = [stage[0].tree_ for stage in estimator.estimators_]
+        if estimator.init_ == "zero":
+            metadata["init_raw"] = 0.0
+        else:
+            eps = np.finfo(np.float32).eps
+            prior = float(np.clip(estimator.init_.class_prior_[1], eps, 1 - eps))
+            metadata["init_raw"] = float(np.log(prior / (1 - prior)))
+        metadata["learning_rate"] = float(estimator.learning_rate)
+        return _flatten_trees(trees, [tree.value[:, 0, 0] for tree in trees], metadata)
+    if model_name == "gender_baseline":
+        metadata["column"] = FEMALE_COLUMN
+        return {}
+    raise ValueError(f"Model type {model_name} cannot be compiled to NumPy.")
+
+
+def _flatten_trees(trees: list, leaf_values: list, metadata: dict) -> dict:
+    """Concatenates the node arrays of several trees, shifting child indices to global node ids."""
+    offsets = np.cumsum([0] + [tree.node_count for tree in trees[:-1]])
+    left = np.concatenate([_shift_children(tree.children_left, offset) for tree, offset in zip(trees, offsets)])
+    right = np.concatenate([_shift_children(tree.children_right, offset) for tree, offset in zip(trees, offsets)])
+    metadata["max_depth"] = int(max(tree.max_depth for tree in trees))
+    return {
+        "roots": offsets.astype(np.intp),
+        "left": left.astype(np.intp),
+        "right": right.astype(np.intp),
+        # Leaves have feature -2 in sklearn; point them at column 0 so the vectorized gather stays valid
+        "feature": np.concatenate([np.maximum(tree.feature, 0) for tree in trees]).astype(np.intp),
+        "threshold": np.concatenate([tree.threshold for tree in trees]),
+        "leaf_value": np.concatenate(leaf_values).astype(np.float64),
+    }
+
+
+def _shift_children(children: np.ndarray, offset: int) -> np.ndarray:
+    """Returns global child ids; leaves (child -1 in sklearn) become self-loops."""
+    return np.where(children < 0, np.arange(len(children)), children) + offset
+
+
+def _extract_title(name: object) -> str:
+    match = re.search(TITLE_PATTERN, name) if isinstance(name, str) else None
+    return TITLE_BUCKETS.get(match.group(1), "Other") if match else "Other"
+
+
+def _number(value: Any) -> float:
+    return float("nan") if value is None else float(value)
+
+
+def _category_key(value: object) -> object:
+    """Normalizes a category so 3, 3.0 and "S" look up the same one-hot column as during training."""
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return MISSING_CATEGORY
+    if isinstance(value, (float, np.floating)) and float(value).is_integer():
+        return int(value)
+    return value
+
+
+def _to_builtin(value: object) -> object:
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _sigmoid(values: np.ndarray) -> np.ndarray:
+    probabilities: np.ndarray = 1.0 / (1.0 + np.exp(-values))
+    return probabilities
@@ -0,0 +1,33 @@
+import os
+import tempfile
+
+from contextlib import contextmanager
+from typing import Iterator
+
+import numpy as np
+
+# On Linux /dev/shm is RAM-backed, so memory-mapped files there are plain shared memory
+SHARED_MEMORY_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+
+@contextmanager
+def shared_arrays(*arrays: np.ndarray) -> Iterator[tuple]:
+    """Copies arrays once into read-only memory maps that worker processes can share.
+
+    joblib sends ``np.memmap`` arguments to its worker processes as a reference to the backing
+    file, so every worker reads the same pages instead of receiving a pickled copy of the data.
+    The backing files are removed when the context exits.
+
+    Args:
+        *arrays (np.ndarray): The arrays to share.
+
+    Yields:
+        tuple: Read-only memory-mapped views of the arrays, in the same order.
+    """
+    with tempfile.TemporaryDirectory(prefix="titanic-shared-", dir=SHARED_MEMORY_DIR) as folder:
+        shared = []
+        for position, array in enumerate(arrays):
+            path = os.path.join(folder, f"{position}.npy")
+            np.save(path, np.asarray(array))
+            shared.append(np.load(path, mmap_mode="r"))
+        yield tuple(shared)
@@ -0,0 +1,251 @@
+import functools
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+
+from collections import OrderedDict
+from contextlib import contextmanager, nullcontext
+from typing import Callable, Iterator, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# The profiler receiving the stages of the running process; None while profiling is off
+_active: Optional["Profiler"] = None
+
+
+class Profiler:
+    """Records wall time, CPU time, memory and row counts of the instrumented pipeline stages.
+
+    Stages are the methods decorated with profiled(): the DataManager loading and preprocessing
+    steps, the train and predict methods of every model and Evaluation.evaluate. While no profiler
+    is started, a decorated method costs one global lookup on top of the call itself.
+
+    Stages may nest (e.g. DataManager._impute_age inside DataManager.preprocess); every record holds
+    the name of its parent stage. Stages running in worker processes (model comparison, cross-validation
+    and tuning) are not recorded, only the time the parent process spends waiting for them.
+    """
+
+    def __init__(self, trace_memory: bool = False, cprofile_dir: Optional[str] = None) -> None:
+        """Initializes the Profiler.
+
+        Args:
+            trace_memory (bool): Whether to trace Python allocations with tracemalloc. This reports
+                the allocated and peak bytes of every stage but slows allocation-heavy code down.
+            cprofile_dir (str, optional): Directory receiving a cProfile dump (``.prof``) of every
+                outermost stage, readable with pstats or snakeviz.
+        """
+        self.trace_memory = trace_memory
+        self.cprofile_dir = cprofile_dir
+        self.records = []
+        self._local = threading.local()
+        self._started_at = None
+        self._stopped_at = None
+        self._started_tracemalloc = False
+
+    def start(self) -> None:
+        """Starts receiving the stages of this process.
+
+        Raises:
+            RuntimeError: If another profiler is already started.
+        """
+        global _active
+        if _active is not None:
+            raise RuntimeError("A profiler is already running.")
+        if self.cprofile_dir:
+            os.makedirs(self.cprofile_dir, exist_ok=True)
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        self._started_at = time.perf_counter()
+        _active = self
+
+    def stop(self) -> None:
+        """Stops receiving stages."""
+        global _active
+        if _active is self:
+            _active = None
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+        self._stopped_at = time.perf_counter()
+
+    def __enter__(self) -> "Profiler":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[dict]:
+        """Measures the enclosed block as one stage.
+
+        Args:
+            name (str): Name of the stage.
+
+        Yields:
+            dict: The stage record; set its "rows" key to report the number of rows processed.
+        """
+        stack = self._stack()
+        parent = stack[-1] if stack else None
+        record = {
+            "stage": name,
+            "parent": parent["record"]["stage"] if parent else None,
+            "depth": len(stack),
+            "rows": None,
+            "started_seconds": time.perf_counter() - self._started_at,
+        }
+        frame = {"record": record, "peak": 0}
+        if self.trace_memory and tracemalloc.is_tracing():
+            # The peak is reset per stage; fold the peak seen so far into the enclosing stage first
+            allocated, peak = tracemalloc.get_traced_memory()
+            if parent is not None:
+                parent["peak"] = max(parent["peak"], peak)
+            tracemalloc.reset_peak()
+            frame["allocated"] = allocated
+        profile = self._start_cprofile(stack)
+        if profile is not None:
+            frame["cprofile"] = True
+        rss_before = _peak_rss_bytes()
+        cpu_before = time.process_time()
+        wall_before = time.perf_counter()
+        stack.append(frame)
+        try:
+            yield record
+        except BaseException as e:
+            record["error"] = type(e).__name__
+            raise
+        finally:
+            record["wall_seconds"] = time.perf_counter() - wall_before
+            record["cpu_seconds"] = time.process_time() - cpu_before
+            stack.pop()
+            rss_after = _peak_rss_bytes()
+            record["peak_rss_bytes"] = rss_after
+            record["rss_growth_bytes"] = None if rss_after is None else rss_after - rss_before
+            if "allocated" in frame and tracemalloc.is_tracing():
+                allocated, peak = tracemalloc.get_traced_memory()
+                peak = max(frame["peak"], peak)
+                record["allocated_bytes"] = allocated - frame["allocated"]
+                record["peak_allocated_bytes"] = peak - frame["allocated"]
+                if parent is not None:
+                    parent["peak"] = max(parent["peak"], peak)
+            if profile is not None:
+                profile.disable()
+                record["cprofile"] = self._dump_cprofile(profile, name)
+            self.records.append(record)
+
+    def summary(self) -> dict:
+        """Returns the number of calls and the total wall and CPU seconds of every stage name."""
+        totals = OrderedDict()
+        for record in self.records:
+            total = totals.setdefault(record["stage"], {"calls": 0, "wall_seconds": 0.0, "cpu_seconds": 0.0})
+            total["calls"] += 1
+            total["wall_seconds"] += record["wall_seconds"]
+            total["cpu_seconds"] += record["cpu_seconds"]
+        return dict(totals)
+
+    def to_dict(self) -> dict:
+        """Returns the trace: the total wall time, the per-stage summary and every stage record in order."""
+        end = self._stopped_at if self._stopped_at is not None else time.perf_counter()
+        return {
+            "command": sys.argv,
+            "pid": os.getpid(),
+            "total_wall_seconds": end - self._started_at if self._started_at is not None else 0.0,
+            "trace_memory": self.trace_memory,
+            "summary": self.summary(),
+            "stages": sorted(self.records, key=lambda record: record["started_seconds"]),
+        }
+
+    def save(self, path: str) -> None:
+        """Writes the trace as JSON."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w") as file:
+            json.dump(self.to_dict(), file, indent=2)
+
+    def _stack(self) -> list:
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    def _start_cprofile(self, stack: list) -> Optional[object]:
+        # Only one cProfile profiler can be enabled at a time, so nested stages share their parent's
+        if not self.cprofile_dir or any("cprofile" in frame for frame in stack):
+            return None
+        import cProfile
+
+        profile = cProfile.Profile()
+        profile.enable()
+        return profile
+
+    def _dump_cprofile(self, profile: object, name: str) -> str:
+        path = os.path.join(self.cprofile_dir, f"{len(self.records):04d}-{name}.prof")
+        profile.dump_stats(path)
+        return path
+
+
+def active_profiler() -> Optional[Profiler]:
+    """Returns the running profiler, or None while profiling is off."""
+    return _active
+
+
+def stage(name: str) -> object:
+    """Measures the enclosed block as a stage of the running profiler; does nothing while profiling is off.
+
+    Yields:
+        dict: The stage record, or None while profiling is off.
+    """
+    if _active is None:
+        return nullcontext()
+    return _active.stage(name)
+
+
+def profiled(name: Optional[str] = None, rows: Optional[Callable[..., int]] = None) -> Callable:
+    """Decorates a method so each call is recorded as a stage by the running profiler.
+
+    Args:
+        name (str, optional): Stage name. Defaults to ``<class of the instance>.<method name>``.
+        rows (Callable, optional): Called with the method's arguments after a successful call and
+            returning the number of rows the call processed.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            profiler = _active
+            if profiler is None:
+                return func(*args, **kwargs)
+            stage_name = name if name is not None else f"{type(args[0]).__name__}.{func.__name__}"
+            with profiler.stage(stage_name) as record:
+                result = func(*args, **kwargs)
+                if rows is not None:
+                    record["rows"] = _count_rows(rows, args, kwargs)
+                return result
+
+        wrapper.__profiled__ = True
+        return wrapper
+
+    return decorator
+
+
+def _count_rows(rows: Callable[..., int], args: tuple, kwargs: dict) -> Optional[int]:
+    try:
+        return int(rows(*args, **kwargs))
+    except Exception:
+        return None
+
+
+def _peak_rss_bytes() -> Optional[int]:
+    """Returns the peak resident set size of the process so far, None where it is unavailable."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == "darwin" else peak * 1024
@@ -0,0 +1,127 @@
+import os
+
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from threadpoolctl import threadpool_limits
+
+# Environment variable holding the number of cores the project may use, read when no budget is configured
+N_JOBS_ENV = "TITANIC_N_JOBS"
+# Thread counts read by OpenMP and the BLAS libraries when they are loaded, and inherited by child processes
+THREAD_ENV_VARS = ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS")
+
+# Core budget set by configure() or worker_limits(); None falls back to N_JOBS_ENV, then to every available core
+_n_jobs: Optional[int] = None
+
+
+def available_cores() -> int:
+    """Returns the number of cores this process may run on."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def configure(n_jobs: Optional[int] = None) -> int:
+    """Sets the core budget of the process and caps the BLAS and OpenMP thread pools to it.
+
+    The thread pools of libraries already loaded are limited through threadpoolctl; those loaded
+    later, and the ones of child processes, read the THREAD_ENV_VARS, which are lowered to the budget.
+
+    Args:
+        n_jobs (int, optional): Number of cores, negative values counting back from the available cores
+            like joblib (-1 for all of them). None reads N_JOBS_ENV, then uses every available core.
+
+    Returns:
+        int: The core budget.
+
+    Raises:
+        ValueError: If n_jobs or N_JOBS_ENV is 0 or not an integer.
+    """
+    global _n_jobs
+    _n_jobs = _cores(n_jobs) if n_jobs is not None else _default_n_jobs()
+    for name in THREAD_ENV_VARS:
+        current = os.environ.get(name, "")
+        if not (current.isdigit() and 0 < int(current) <= _n_jobs):
+            os.environ[name] = str(_n_jobs)
+    # Called without a context manager, the limit holds for the rest of the process
+    threadpool_limits(limits=_n_jobs)
+    return _n_jobs
+
+
+def get_n_jobs() -> int:
+    """Returns the core budget: the configured one, else N_JOBS_ENV, else every available core.
+
+    Raises:
+        ValueError: If N_JOBS_ENV is 0 or not an integer.
+    """
+    return _n_jobs if _n_jobs is not None else _default_n_jobs()
+
+
+def resolve_n_jobs(n_jobs: Optional[int] = None) -> int:
+    """Returns the number of workers a pool may use within the core budget.
+
+    Args:
+        n_jobs (int, optional): Requested workers; None or -1 for the whole budget, other negative values
+            counting back from it. Larger requests are capped to the budget.
+    """
+    budget = get_n_jobs()
+    if n_jobs is None:
+        return budget
+    if n_jobs == 0:
+        raise ValueError("n_jobs must not be 0.")
+    return max(1, budget + 1 + n_jobs) if n_jobs < 0 else min(n_jobs, budget)
+
+
+def split_n_jobs(n_jobs: Optional[int], n_tasks: int) -> tuple:
+    """Splits the core budget between the worker processes of a pool and the threads inside each.
+
+    Args:
+        n_jobs (int, optional): Requested workers, see resolve_n_jobs().
+        n_tasks (int): Number of tasks; a pool never gets more workers than tasks.
+
+    Returns:
+        tuple: The number of workers and the threads each worker may use, whose product stays within the budget.
+    """
+    workers = max(1, min(resolve_n_jobs(n_jobs), n_tasks))
+    return workers, max(1, get_n_jobs() // workers)
+
+
+@contextmanager
+def worker_limits(n_threads: int) -> Iterator[None]:
+    """Runs the body of a pool task with a budget of n_threads cores.
+
+    Models created inside get n_jobs=n_threads from the ModelFactory and the BLAS and OpenMP thread
+    pools are capped to n_threads, so workers x threads never exceeds the budget of the parent.
+    """
+    global _n_jobs
+    previous = _n_jobs
+    _n_jobs = n_threads
+    try:
+        with threadpool_limits(limits=n_threads):
+            yield
+    finally:
+        _n_jobs = previous
+
+
+def set_estimator_n_jobs(model: object, n_jobs: int) -> None:
+    """Sets n_jobs on the estimator wrapped by a model, if the estimator has that parameter."""
+    estimator = getattr(model, "model", None)
+    if hasattr(estimator, "get_params") and "n_jobs" in estimator.get_params(deep=False):
+        estimator.set_params(n_jobs=n_jobs)
+
+
+def _cores(n_jobs: int) -> int:
+    if n_jobs == 0:
+        raise ValueError("n_jobs must not be 0.")
+    cores = available_cores()
+    return max(1, cores + 1 + n_jobs) if n_jobs < 0 else n_jobs
+
+
+def _default_n_jobs() -> int:
+    value = os.environ.get(N_JOBS_ENV)
+    if not value:
+        return available_cores()
+    try:
+        return _cores(int(value))
+    except ValueError:
+        raise ValueError(f"{N_JOBS_ENV} must be a non-zero integer, got {value!r}.") from None
@@ -0,0 +1,312 @@
+import copy
+import hashlib
+import logging
+import os
+
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+
+from sklearn.compose import ColumnTransformer
+
+from src.data_manager import (
+    CATEGORICAL_FEATURES,
+    DEFAULT_CSV_ENGINE,
+    NUMERIC_FEATURES,
+    DataManager,
+    FeaturePreprocessor,
+    extract_titles,
+    read_csv_tail,
+)
+from src.incremental import IncrementalPreprocessor
+from src.model_artifact import ModelArtifact
+
+# Bytes before the end of the previously read data that must be unchanged for the file to count as appended to
+TAIL_BYTES = 4096
+# Models whose saved state can be extended with appended rows; the others are always rebuilt
+UPDATABLE_MODELS = ("gender_baseline", "random_forest", "gradient_boosting", "logistic_regression", "sgd_logistic")
+# Models updated by adding trees fitted on the appended rows
+TREE_MODELS = ("random_forest", "gradient_boosting")
+# Hyperparameters set by training, by an update itself or by the core budget, ignored when comparing an artifact
+# with the requested model
+UPDATE_PARAMS = ("n_estimators", "warm_start", "categorical_features", "n_jobs")
+
+
+def data_state(filepath: str, rows: int) -> dict:
+    """Describes the content of a CSV file read by a training run, to recognize rows appended to it later.
+
+    Args:
+        filepath (str): The CSV file the model was trained on.
+        rows (int): Number of data rows read from it.
+
+    Returns:
+        dict: The file's size in bytes (the offset of the next appended row), its row count, its header
+            line and a digest of its last TAIL_BYTES bytes.
+    """
+    size = os.path.getsize(filepath)
+    with open(filepath, "rb") as file:
+        header = file.readline().decode("utf-8").rstrip("\r\n")
+    return {"bytes": size, "rows": int(rows), "header": header, "tail_sha256": _tail_digest(filepath, size)}
+
+
+def detect_appended_rows(filepath: str, state: Optional[dict]) -> tuple:
+    """Compares a CSV file with the state recorded by a previous training run.
+
+    Args:
+        filepath (str): The CSV file to train on.
+        state (dict, optional): The data_state() of the previous run, None if it was not recorded.
+
+    Returns:
+        tuple: A status, "unchanged", "appended" or "rebuild", and a human-readable reason.
+    """
+    if state is None:
+        return "rebuild", "the artifact does not record the state of its training file"
+    if not os.path.isfile(filepath):
+        return "rebuild", "only single CSV files are tracked for appended rows"
+    size = os.path.getsize(filepath)
+    if size < state["bytes"]:
+        return "rebuild", "the file is smaller than when the model was trained"
+    if data_state(filepath, state["rows"])["header"] != state["header"]:
+        return "rebuild", "the columns of the file have changed"
+    if _tail_digest(filepath, state["bytes"]) != state["tail_sha256"]:
+        return "rebuild", "the previously read rows have changed"
+    if size == state["bytes"]:
+        return "unchanged", "no rows were appended"
+    return "appended", f"{size - state['bytes']} bytes were appended"
+
+
+def update_artifact(
+    artifact: ModelArtifact,
+    filepath: str,
+    engine: Optional[str] = DEFAULT_CSV_ENGINE,
+    validation: Optional[str] = "report",
+) -> tuple:
+    """Updates an artifact with the rows appended to its training file since it was trained.
+
+    The appended rows are validated against the dataset schema like a full load (see
+    DataManager.validate()): with "quarantine", the invalid rows are left out of the update and
+    returned in the summary, and with "raise" an invalid row fails the update.
+
+    The preprocessing statistics are updated with the new rows: the age imputation means from the
+    stored group counts and the scaler from its running moments. The numeric medians and the one-hot
+    categories stay as they are; rows with a category never seen in training require a rebuild. The
+    model is then updated in the feature space of the updated preprocessor:
+
+    * random forest and gradient boosting: the split thresholds of the existing trees are mapped to
+      the new scaling, and new trees, in proportion to the share of new rows, are added with warm
+      start and fitted on the new rows;
+    * logistic regression: the coefficients are mapped to the new scaling and the solver restarts
+      from them on every row, which converges in a few iterations since the optimum barely moves;
+    * SGD logistic regression: the coefficients are mapped to the new scaling and updated with one
+      partial_train() pass over the new rows (for models trained out of core, the incremental
+      preprocessor learns from the new rows as well);
+    * gender baseline: nothing to learn.
+
+    Args:
+        artifact (ModelArtifact): The artifact to update, loaded without memory-mapping; it is not modified.
+        filepath (str): The training file, whose first rows are unchanged since the artifact was trained.
+        engine (str, optional): pandas CSV parser, e.g. "pyarrow". Defaults to the TITANIC_CSV_ENGINE
+            environment variable, like DataManager.
+        validation (str, optional): The DataManager validation mode of the training run.
+
+    Returns:
+        tuple: The updated artifact, or None when it cannot be updated and has to be rebuilt, and a
+            summary dict with the status, reason, appended_rows and rows (both counting every parsed
+            row) and the quarantined rows, None when no row was quarantined.
+
+    Raises:
+        ValueError: If the validation mode is "raise" and an appended row violates the schema.
+    """
+    state = artifact.metadata.get("training_data")
+    status, reason = detect_appended_rows(filepath, state)
+    summary = {
+        "status": status,
+        "reason": reason,
+        "appended_rows": 0,
+        "rows": state["rows"] if state else 0,
+        "quarantined": None,
+    }
+    if status == "unchanged":
+        return artifact, summary
+    if status == "appended":
+        reason = _update_blocker(artifact)
+    if status == "rebuild" or reason is not None:
+        summary.update(status="rebuild", reason=reason or summary["reason"])
+        return None, summary
+    assert state is not None, "an artifact without a recorded state is always rebuilt"
+
+    appended = DataManager(filepath=None, validation=validation)
+    appended.load_frame(read_csv_tail(filepath, state["bytes"], engine))
+    appended.validate()
+    new_rows, appended_rows = appended.data, len(appended.data) + _count(appended.quarantined)
+    summary["quarantined"] = appended.quarantined
+    if "Survived" not in new_rows.columns:
+        summary.update(status="rebuild", reason="the appended rows have no Survived labels")
+        return None, summary
+    if artifact.model_name in TREE_MODELS and not new_rows.empty and new_rows["Survived"].nunique() < 2:
+        # The added trees are fitted on the new rows alone, which needs both classes
+        summary.update(status="rebuild", reason="the appended rows hold a single class")
+        return None, summary
+
+    model: Any = copy.deepcopy(artifact.model)
+    preprocessor = artifact.preprocessor
+    # With every appended row quarantined there is nothing to learn
+    if isinstance(preprocessor, IncrementalPreprocessor) and not new_rows.empty:
+        preprocessor = copy.deepcopy(preprocessor)
+        model.partial_train(preprocessor.partial_fit_transform(new_rows), new_rows["Survived"].to_numpy())
+    elif isinstance(preprocessor, FeaturePreprocessor) and not new_rows.empty:
+        old_scaler = _scaler(preprocessor)
+        preprocessor, X_new, y_new, unseen = _update_preprocessor(preprocessor, new_rows)
+        if unseen:
+            summary.update(status="rebuild", reason=f"the appended rows have unseen categories of {', '.join(unseen)}")
+            return None, summary
+        new_scaler = _scaler(preprocessor)
+        shift = (old_scaler.mean_, old_scaler.scale_, new_scaler.mean_, new_scaler.scale_)
+        _update_model(
+            artifact.model_name, model, shift, X_new, y_new, state["rows"], filepath, preprocessor, engine, validation
+        )
+
+    rows = state["rows"] + appended_rows
+    metadata = dict(artifact.metadata)
+    metadata["training_data"] = data_state(filepath, rows)
+    metadata["updates"] = metadata.get("updates", 0) + 1
+    summary.update(appended_rows=appended_rows, rows=rows)
+    logging.info(f"Updated the {artifact.model_name} model with {len(new_rows)} of {appended_rows} appended rows.")
+    return ModelArtifact(artifact.model_name, model, preprocessor, metadata), summary
+
+
+def same_hyperparameters(artifact: ModelArtifact, model: Any) -> bool:
+    """Returns whether an artifact's model was created with the same hyperparameters as a new model.
+
+    The number of trees is ignored, since updates add trees, and so are the parameters set by training.
+    """
+    if type(artifact.model) is not type(model):
+        return False
+    if not hasattr(model, "model"):
+        return True
+    previous: Any = artifact.model
+    current, requested = previous.model.get_params(), model.model.get_params()
+    for name in UPDATE_PARAMS:
+        current.pop(name, None)
+        requested.pop(name, None)
+    return bool(current == requested)
+
+
+def _update_blocker(artifact: ModelArtifact) -> Optional[str]:
+    if artifact.model_name not in UPDATABLE_MODELS:
+        return f"the {artifact.model_name} model cannot be updated incrementally"
+    if isinstance(artifact.preprocessor, FeaturePreprocessor) and artifact.preprocessor.age_counts is None:
+        return "the preprocessor predates incremental updates"
+    return None
+
+
+def _update_preprocessor(preprocessor: FeaturePreprocessor, new_rows: pd.DataFrame) -> tuple:
+    """Returns an updated copy of the preprocessor, the transformed new rows, their target and unseen categories."""
+    preprocessor = copy.deepcopy(preprocessor)
+    ages = pd.DataFrame(
+        {"Title": extract_titles(new_rows["Name"]), "Pclass": new_rows["Pclass"], "Age": new_rows["Age"]}
+    )
+    preprocessor.update_age_means(ages)
+
+    data_manager = DataManager(filepath=None, preprocessor=preprocessor)
+    data_manager.load_frame(new_rows.copy())
+    data_manager.engineer_features()
+    features, target = data_manager.data, np.asarray(data_manager.get_target())
+
+    transformer = _fitted_transformer(preprocessor)
+    numeric = transformer.named_transformers_["num"]
+    numeric.named_steps["scaler"].partial_fit(numeric.named_steps["imputer"].transform(features[NUMERIC_FEATURES]))
+    X_new = preprocessor.to_feature_matrix(transformer.transform(features))
+    return preprocessor, X_new, target, _unseen_categories(preprocessor, X_new)
+
+
+def _unseen_categories(preprocessor: FeaturePreprocessor, X: Any) -> list:
+    # handle_unknown="ignore" encodes an unseen category as an all-zero block of its feature
+    encoder = _fitted_transformer(preprocessor).named_transformers_["cat"].steps[-1][1]
+    unseen, start = [], len(NUMERIC_FEATURES)
+    for feature, categories in zip(CATEGORICAL_FEATURES, encoder.categories_):
+        if (X[:, start : start + len(categories)].sum(axis=1) == 0).any():
+            unseen.append(feature)
+        start += len(categories)
+    return unseen
+
+
+def _update_model(
+    model_name: str,
+    model: Any,
+    shift: tuple,
+    X_new: np.ndarray,
+    y_new: np.ndarray,
+    rows: int,
+    filepath: str,
+    preprocessor: FeaturePreprocessor,
+    engine: Optional[str],
+    validation: Optional[str],
+) -> None:
+    if model_name in TREE_MODELS:
+        estimator = model.model
+        # Gradient boosting keeps a 2D array of trees, one column per class
+        trees = [tree.tree_ for tree in np.asarray(estimator.estimators_, dtype=object).ravel()]
+        _rescale_thresholds(trees, *shift)
+        added = max(1, round(estimator.n_estimators * len(X_new) / rows))
+        estimator.set_params(warm_start=True, n_estimators=estimator.n_estimators + added)
+        estimator.fit(X_new, y_new)
+        estimator.set_params(warm_start=False)
+    elif model_name == "logistic_regression":
+        _rescale_coefficients(model.model, *shift)
+        data_manager = DataManager(filepath, preprocessor=preprocessor, engine=engine, validation=validation)
+        data_manager.load_data()
+        data_manager.preprocess()
+        model.model.set_params(warm_start=True)
+        model.train(data_manager.get_processed_data(), data_manager.get_target())
+        model.model.set_params(warm_start=False)
+    elif model_name == "sgd_logistic":
+        _rescale_coefficients(model.model, *shift)
+        model.partial_train(X_new, y_new)
+
+
+def _rescale_thresholds(
+    trees: list, old_mean: np.ndarray, old_scale: np.ndarray, new_mean: np.ndarray, new_scale: np.ndarray
+) -> None:
+    """Maps the split thresholds on the standardized numeric columns to the updated scaler, in place.
+
+    A split z <= t on (x - old_mean) / old_scale selects the same rows as z' <= t' on the updated
+    scaling, with t' = (t * old_scale + old_mean - new_mean) / new_scale.
+    """
+    for tree in trees:
+        feature, threshold = tree.feature, tree.threshold
+        numeric = (feature >= 0) & (feature < len(old_mean))
+        columns = feature[numeric]
+        threshold[numeric] = (
+            threshold[numeric] * old_scale[columns] + old_mean[columns] - new_mean[columns]
+        ) / new_scale[columns]
+
+
+def _rescale_coefficients(
+    estimator: Any, old_mean: np.ndarray, old_scale: np.ndarray, new_mean: np.ndarray, new_scale: np.ndarray
+) -> None:
+    """Maps linear coefficients on the standardized numeric columns to the updated scaler, in place."""
+    n_numeric = len(old_mean)
+    coef = estimator.coef_[:, :n_numeric]
+    estimator.intercept_ = estimator.intercept_ + coef @ ((new_mean - old_mean) / old_scale)
+    estimator.coef_[:, :n_numeric] = coef * new_scale / old_scale
+
+
+def _count(rows: Optional[pd.DataFrame]) -> int:
+    return 0 if rows is None else len(rows)
+
+
+def _scaler(preprocessor: FeaturePreprocessor) -> Any:
+    return _fitted_transformer(preprocessor).named_transformers_["num"].named_steps["scaler"]
+
+
+def _fitted_transformer(preprocessor: FeaturePreprocessor) -> ColumnTransformer:
+    assert preprocessor.transformer is not None, "only fitted preprocessors are updated"
+    return preprocessor.transformer
+
+
+def _tail_digest(filepath: str, end: int) -> str:
+    with open(filepath, "rb") as file:
+        file.seek(max(0, end - TAIL_BYTES))
+        return hashlib.sha256(file.read(end - max(0, end - TAIL_BYTES))).hexdigest()
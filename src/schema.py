@@ -0,0 +1,255 @@
+import types
+
+from typing import Literal, Optional, Union, get_args, get_origin
+
+import numpy as np
+import pandas as pd
+
+from pydantic import BaseModel as PydanticModel
+from pydantic import Field
+
+from src.profiling import profiled
+
+# What DataManager does with rows violating the schema: log them, drop them, or fail the load
+VALIDATION_MODES = ("report", "quarantine", "raise")
+# Row labels kept per violated check in a ValidationReport
+MAX_EXAMPLES = 5
+
+
+class PassengerRecord(PydanticModel):
+    """The schema of one row of a Titanic CSV file.
+
+    The model is never instantiated per row: compile_schema() turns its fields into vectorized column
+    checks. An Optional annotation makes a column nullable, a Literal lists its allowed values, Field
+    bounds give its range and a default makes the column optional in the file (Survived is absent
+    from unlabeled data). The upper bounds of the integer columns are the ranges of their compact
+    CSV_DTYPES in src.data_manager, so every valid value is stored without wrapping around.
+    """
+
+    PassengerId: int = Field(ge=1, le=2**31 - 1)
+    Survived: Literal[0, 1] = Field(default=None)
+    Pclass: Literal[1, 2, 3]
+    Name: str
+    Sex: Literal["male", "female"]
+    Age: Optional[float] = Field(ge=0, le=120)
+    SibSp: int = Field(ge=0, le=127)
+    Parch: int = Field(ge=0, le=127)
+    Fare: Optional[float] = Field(ge=0)
+    Embarked: Optional[Literal["C", "Q", "S"]]
+
+
+class ColumnRule:
+    """The checks of one column, compiled from a field of a pydantic record model."""
+
+    def __init__(
+        self,
+        name: str,
+        kind: type,
+        required: bool,
+        nullable: bool,
+        allowed: Optional[tuple] = None,
+        bounds: Optional[dict] = None,
+    ) -> None:
+        """Initializes the ColumnRule.
+
+        Args:
+            name (str): Column name.
+            kind (type): Python type of the values: int, float or str.
+            required (bool): Whether the column must be present.
+            nullable (bool): Whether values may be missing.
+            allowed (tuple, optional): The only values allowed.
+            bounds (dict, optional): Bounds of numeric values, keyed by ge, gt, le and lt.
+        """
+        self.name = name
+        self.kind = kind
+        self.required = required
+        self.nullable = nullable
+        self.allowed = allowed
+        self.bounds = bounds or {}
+
+    def __repr__(self) -> str:
+        return (
+            f"ColumnRule({self.name!r}, {self.kind.__name__}, required={self.required}, nullable={self.nullable}, "
+            f"allowed={self.allowed}, bounds={self.bounds})"
+        )
+
+    def violations(self, column: pd.Series) -> dict:
+        """Returns a boolean mask of the violating rows for every failed check of the column."""
+        present = column.notna().to_numpy()
+        checks = {}
+        if not self.nullable:
+            checks["missing"] = ~present
+        values = column
+        if self.kind in (int, float):
+            if not pd.api.types.is_numeric_dtype(column.dtype):
+                values = pd.to_numeric(column.astype(object), errors="coerce")
+            # Values that are not numbers became NaN above
+            type_errors = present & values.isna().to_numpy()
+            if self.kind is int and pd.api.types.is_float_dtype(values.dtype):
+                type_errors |= present & (values.to_numpy() % 1 != 0)
+            checks["type"] = type_errors
+        if self.allowed is not None:
+            checks["not_allowed"] = self._not_allowed(values, present)
+        if self.bounds:
+            array = values.to_numpy(dtype=np.float64, na_value=np.nan)
+            with np.errstate(invalid="ignore"):
+                within = np.ones(len(array), dtype=bool)
+                for bound, limit in self.bounds.items():
+                    within &= _COMPARISONS[bound](array, limit)
+            checks["out_of_range"] = ~np.isnan(array) & ~within
+        return {check: mask for check, mask in checks.items() if mask.any()}
+
+    def _not_allowed(self, values: pd.Series, present: np.ndarray) -> np.ndarray:
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            # Check the few categories, then broadcast to the rows by their codes (-1, missing, picks the appended False)
+            bad_categories = ~values.cat.categories.isin(self.allowed)
+            return np.append(bad_categories, False)[values.cat.codes.to_numpy()]
+        if pd.api.types.is_numeric_dtype(values.dtype):
+            # np.isin compares against each of the few allowed values instead of hashing every row
+            return present & ~np.isin(values.to_numpy(), self.allowed)
+        return present & ~values.isin(self.allowed).to_numpy()
+
+
+class ValidationReport:
+    """The outcome of validating a DataFrame: violation counts per column and check, and the invalid rows."""
+
+    def __init__(self, rows: int, violations: dict, invalid: np.ndarray, missing_columns: list) -> None:
+        """Initializes the ValidationReport.
+
+        Args:
+            rows (int): Number of rows validated.
+            violations (dict): Column -> check -> {"count", "examples"}; examples are the first row labels.
+            invalid (np.ndarray): Boolean mask of the rows violating at least one check.
+            missing_columns (list): Required columns absent from the data.
+        """
+        self.rows = rows
+        self.violations = violations
+        self.invalid = invalid
+        self.missing_columns = missing_columns
+
+    @property
+    def invalid_rows(self) -> int:
+        return int(self.invalid.sum())
+
+    @property
+    def is_valid(self) -> bool:
+        return not self.violations and not self.missing_columns
+
+    def to_dict(self) -> dict:
+        """Returns the report as JSON-serializable data."""
+        return {
+            "rows": self.rows,
+            "invalid_rows": self.invalid_rows,
+            "missing_columns": list(self.missing_columns),
+            "violations": self.violations,
+        }
+
+    def format(self) -> str:
+        """Formats the report as a text table, one line per column and failed check."""
+        lines = [f"{self.invalid_rows} of {self.rows} rows violate the dataset schema"]
+        lines.extend(f"  {column:<12} missing column" for column in self.missing_columns)
+        for column, checks in self.violations.items():
+            for check, violation in checks.items():
+                examples = ", ".join(str(row) for row in violation["examples"])
+                lines.append(f"  {column:<12} {check:<14}{violation['count']:>9} rows (e.g. rows {examples})")
+        return "\n".join(lines)
+
+
+class SchemaValidator:
+    """Validates whole DataFrames against a pydantic record model with vectorized column checks.
+
+    The record model is compiled once into one ColumnRule per field; validating a DataFrame then costs
+    a few array operations per column instead of one pydantic validation per row.
+    """
+
+    def __init__(self, record_model: type = PassengerRecord) -> None:
+        """Initializes the SchemaValidator.
+
+        Args:
+            record_model (type): A pydantic model describing one row.
+        """
+        self.rules = compile_schema(record_model)
+
+    @profiled(rows=lambda self, data: len(data))
+    def validate(self, data: pd.DataFrame) -> ValidationReport:
+        """Checks every column of the schema present in the data.
+
+        Columns of the data that the schema does not describe are ignored.
+
+        Args:
+            data (pd.DataFrame): The rows to validate.
+
+        Returns:
+            ValidationReport: The violations per column and check, and the invalid rows.
+        """
+        invalid = np.zeros(len(data), dtype=bool)
+        violations, missing_columns = {}, []
+        for rule in self.rules:
+            if rule.name not in data.columns:
+                if rule.required:
+                    missing_columns.append(rule.name)
+                continue
+            checks = rule.violations(data[rule.name])
+            if not checks:
+                continue
+            violations[rule.name] = {}
+            for check, mask in checks.items():
+                invalid |= mask
+                examples = data.index[np.flatnonzero(mask)[:MAX_EXAMPLES]]
+                violations[rule.name][check] = {
+                    "count": int(mask.sum()),
+                    "examples": [_to_builtin(row) for row in examples],
+                }
+        return ValidationReport(len(data), violations, invalid, missing_columns)
+
+
+def compile_schema(record_model: type) -> list:
+    """Compiles the fields of a pydantic record model into column rules.
+
+    Args:
+        record_model (type): A pydantic model whose fields are annotated with int, float, str or a
+            Literal of those, optionally wrapped in Optional, and bounded with Field(ge=, gt=, le=, lt=).
+
+    Returns:
+        list: One ColumnRule per field, in field order.
+
+    Raises:
+        TypeError: If a field has an annotation that cannot be checked column-wise.
+    """
+    rules = []
+    for name, field in record_model.model_fields.items():
+        annotation, nullable = _strip_optional(field.annotation)
+        allowed = None
+        if get_origin(annotation) is Literal:
+            allowed = get_args(annotation)
+            annotation = type(allowed[0])
+        if annotation not in (int, float, str):
+            raise TypeError(f"Field {name} has an unsupported annotation {field.annotation}.")
+        bounds = {}
+        for constraint in field.metadata:
+            for bound in _COMPARISONS:
+                if getattr(constraint, bound, None) is not None:
+                    bounds[bound] = getattr(constraint, bound)
+        rules.append(ColumnRule(name, annotation, field.is_required(), nullable, allowed, bounds))
+    return rules
+
+
+def _strip_optional(annotation: object) -> tuple:
+    if get_origin(annotation) in (Union, types.UnionType):
+        args = get_args(annotation)
+        if type(None) in args:
+            remaining = tuple(arg for arg in args if arg is not type(None))
+            return (remaining[0] if len(remaining) == 1 else Union[remaining]), True
+    return annotation, False
+
+
+def _to_builtin(value: object) -> object:
+    return value.item() if isinstance(value, np.generic) else value
+
+
+_COMPARISONS = {
+    "ge": np.greater_equal,
+    "gt": np.greater,
+    "le": np.less_equal,
+    "lt": np.less,
+}
@@ -0,0 +1,298 @@
+import asyncio
+import json
+import logging
+import time
+
+from collections import deque
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from src.data_manager import INPUT_COLUMNS
+from src.model_artifact import ModelArtifact
+
+HTTP_STATUS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 500: "Internal Server Error"}
+MAX_BODY_BYTES = 1024 * 1024
+
+
+class LatencyStats:
+    """Keeps request counters and a window of recent request latencies."""
+
+    def __init__(self, window: int = 10_000) -> None:
+        """Initializes the LatencyStats.
+
+        Args:
+            window (int): Number of most recent request latencies used for the percentiles.
+        """
+        self.started_at = time.perf_counter()
+        self.latencies = deque(maxlen=window)
+        self.requests = 0
+        self.errors = 0
+        self.batches = 0
+        self.batched_rows = 0
+
+    def record_request(self, seconds: float, failed: bool = False) -> None:
+        self.requests += 1
+        self.errors += int(failed)
+        self.latencies.append(seconds)
+
+    def record_batch(self, size: int) -> None:
+        self.batches += 1
+        self.batched_rows += size
+
+    def snapshot(self) -> dict:
+        """Returns the counters, the throughput since startup and the p50/p99 latencies in milliseconds."""
+        uptime = time.perf_counter() - self.started_at
+        latencies = np.fromiter(self.latencies, dtype=float) * 1000
+        p50, p99 = np.percentile(latencies, [50, 99]) if len(latencies) else (0.0, 0.0)
+        return {
+            "uptime_seconds": uptime,
+            "requests": self.requests,
+            "errors": self.errors,
+            "throughput_rps": self.requests / uptime if uptime > 0 else 0.0,
+            "batches": self.batches,
+            "mean_batch_size": self.batched_rows / self.batches if self.batches else 0.0,
+            "latency_p50_ms": float(p50),
+            "latency_p99_ms": float(p99),
+        }
+
+
+class MicroBatcher:
+    """Collects concurrent prediction requests into batches scored with one vectorized predict call.
+
+    A batch is flushed as soon as it holds max_batch_size passengers or max_wait seconds after its
+    first passenger arrived, whichever comes first. Scoring runs in a worker thread so the event loop
+    keeps accepting requests meanwhile.
+    """
+
+    def __init__(
+        self, artifact: ModelArtifact, stats: LatencyStats, max_batch_size: int = 64, max_wait: float = 0.002
+    ) -> None:
+        """Initializes the MicroBatcher.
+
+        Args:
+            artifact (ModelArtifact): The loaded model artifact.
+            stats (LatencyStats): Where the batch counters are recorded.
+            max_batch_size (int): Maximum number of passengers per predict call.
+            max_wait (float): Maximum seconds the first passenger of a batch waits for more.
+        """
+        self.artifact = artifact
+        self.stats = stats
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Starts the batching loop on the running event loop."""
+        self._queue = asyncio.Queue()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stops the batching loop."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def predict(self, record: dict) -> int:
+        """Queues one passenger record and waits for its prediction."""
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((record, future))
+        return await future
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            await self._score(batch)
+
+    async def _score(self, batch: list) -> None:
+        records = [record for record, _ in batch]
+        futures = [future for _, future in batch]
+        self.stats.record_batch(len(batch))
+        try:
+            predictions = await asyncio.get_running_loop().run_in_executor(None, self._predict_batch, records)
+        except Exception as e:
+            logging.error(f"Error while scoring a batch of {len(batch)}: {e}")
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for future, prediction in zip(futures, predictions):
+            if future.done():
+                continue
+            if isinstance(prediction, Exception):
+                future.set_exception(prediction)
+            else:
+                future.set_result(prediction)
+
+    def _predict_batch(self, records: list) -> list:
+        try:
+            return [int(prediction) for prediction in self.artifact.predict(_records_to_frame(records))]
+        except Exception:
+            if len(records) == 1:
+                raise
+        # A malformed record fails the whole batch: score the records one by one to isolate it
+        results = []
+        for record in records:
+            try:
+                results.append(int(self.artifact.predict(_records_to_frame([record]))[0]))
+            except Exception as e:
+                results.append(e)
+        return results
+
+
+class PredictionServer:
+    """Minimal asyncio HTTP/1.1 server for online scoring with a trained model artifact.
+
+    Endpoints:
+        POST /predict   A JSON passenger record (or a list of records) with the raw Titanic columns.
+                        Returns {"Survived": 0 or 1} (or {"Survived": [...]}).
+        GET  /metrics   Request counters, throughput and p50/p99 latency.
+        GET  /health    Liveness probe.
+    """
+
+    def __init__(
+        self,
+        artifact: ModelArtifact,
+        host: str = "127.0.0.1",
+        port: int = 8000,
+        max_batch_size: int = 64,
+        max_wait: float = 0.002,
+    ) -> None:
+        """Initializes the PredictionServer.
+
+        Args:
+            artifact (ModelArtifact): The loaded model artifact, loaded once for the server's lifetime.
+            host (str): Interface to listen on.
+            port (int): Port to listen on, 0 for any free port.
+            max_batch_size (int): Maximum number of passengers per predict call.
+            max_wait (float): Maximum seconds a request waits for its batch to fill up.
+        """
+        self.host = host
+        self.port = port
+        self.stats = LatencyStats()
+        self.batcher = MicroBatcher(artifact, self.stats, max_batch_size, max_wait)
+        self._server: Optional[asyncio.base_events.Server] = None
+
+    async def start(self) -> None:
+        """Starts listening; the bound port is available in the port attribute afterwards."""
+        self.batcher.start()
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        logging.info(f"Prediction server listening on http://{self.host}:{self.port}")
+
+    async def stop(self) -> None:
+        """Stops accepting connections and stops the batching loop."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        await self.batcher.stop()
+
+    async def serve_forever(self) -> None:
+        """Starts the server and serves until cancelled."""
+        await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.stop()
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request = await _read_request(reader)
+                if request is None:
+                    break
+                method, path, headers, body = request
+                status, payload = await self._dispatch(method, path, body)
+                keep_alive = headers.get("connection", "").lower() != "close"
+                _write_response(writer, status, payload, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        except ValueError as e:
+            _write_response(writer, 400, {"error": str(e)}, keep_alive=False)
+        finally:
+            writer.close()
+
+    async def _dispatch(self, method: str, path: str, body: bytes) -> tuple:
+        if path == "/health":
+            return 200, {"status": "ok"}
+        if path == "/metrics":
+            return 200, self.stats.snapshot()
+        if path != "/predict":
+            return 404, {"error": f"Unknown path {path}"}
+        if method != "POST":
+            return 405, {"error": "Use POST /predict"}
+
+        start = time.perf_counter()
+        try:
+            payload = json.loads(body)
+            if isinstance(payload, list):
+                survived = list(await asyncio.gather(*(self.batcher.predict(record) for record in payload)))
+            else:
+                survived = await self.batcher.predict(payload)
+            status, response = 200, {"Survived": survived}
+        except Exception as e:
+            status, response = 400, {"error": str(e)}
+        self.stats.record_request(time.perf_counter() - start, failed=status != 200)
+        return status, response
+
+
+def _records_to_frame(records: list) -> pd.DataFrame:
+    for record in records:
+        if not isinstance(record, dict):
+            raise ValueError("Each passenger must be a JSON object.")
+    frame = pd.DataFrame.from_records(records, columns=INPUT_COLUMNS)
+    # JSON null arrives as None; the preprocessing expects NaN for missing values
+    return frame.fillna(value=np.nan)
+
+
+async def _read_request(reader: asyncio.StreamReader) -> Optional[tuple]:
+    request_line = await reader.readline()
+    if not request_line:
+        return None
+    try:
+        method, path, _ = request_line.decode("latin-1").split(" ", 2)
+    except ValueError:
+        raise ValueError("Malformed request line")
+
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    length = int(headers.get("content-length", 0))
+    if length > MAX_BODY_BYTES:
+        raise ValueError("Request body too large")
+    body = await reader.readexactly(length) if length else b""
+    return method.upper(), path.split("?", 1)[0], headers, body
+
+
+def _write_response(writer: asyncio.StreamWriter, status: int, payload: dict, keep_alive: bool) -> None:
+    body = json.dumps(payload).encode()
+    head = (
+        f"HTTP/1.1 {status} {HTTP_STATUS[status]}\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    writer.write(head.encode() + body)
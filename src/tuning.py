@@ -0,0 +1,142 @@
+import json
+import logging
+import os
+import time
+
+from typing import Optional
+
+import numpy as np
+
+from scipy.stats import loguniform, uniform
+from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+from sklearn.model_selection import HalvingRandomSearchCV
+
+from src.models.model_factory import ModelFactory
+from src.resources import set_estimator_n_jobs, split_n_jobs
+
+# Hyperparameter distributions sampled for each tunable model
+SEARCH_SPACES = {
+    "random_forest": {
+        "n_estimators": [100, 200, 400],
+        "max_depth": [None, 4, 6, 8, 12],
+        "min_samples_leaf": [1, 2, 4, 8],
+        "max_features": ["sqrt", "log2", None],
+    },
+    "gradient_boosting": {
+        "n_estimators": [100, 200, 400],
+        "learning_rate": loguniform(0.01, 0.3),
+        "max_depth": [2, 3, 4, 5],
+        "subsample": uniform(0.6, 0.4),
+    },
+    "logistic_regression": {
+        "C": loguniform(1e-3, 1e2),
+        "max_iter": [1000],
+    },
+}
+# Largest budget given to the surviving candidates when the budget is the number of trees
+MAX_ESTIMATORS = 400
+RESOURCES = ("n_samples", "n_estimators")
+
+
+def tune(
+    X: np.ndarray,
+    y: np.ndarray,
+    model_name: str,
+    resource: str = "n_samples",
+    n_candidates: int = 32,
+    factor: int = 3,
+    cv: int = 3,
+    scoring: str = "accuracy",
+    n_jobs: Optional[int] = None,
+    random_state: int = 42,
+) -> dict:
+    """Searches the hyperparameters of a model with successive halving.
+
+    Every candidate starts with a small budget (training rows or trees); after each round only
+    the best 1/factor of the candidates continue with factor times the budget, so poor
+    configurations are dropped early. The candidates of a round are cross-validated in parallel;
+    the core budget is split between the worker processes and the threads of each candidate's estimator.
+    The total cost is bounded by n_candidates and the maximum budget instead of growing with the
+    size of a grid.
+
+    Args:
+        X (np.ndarray): Processed feature data.
+        y (np.ndarray): Target data.
+        model_name (str): The ModelFactory name of the model, a key of SEARCH_SPACES.
+        resource (str): The budget, either "n_samples" or "n_estimators" (tree models only).
+        n_candidates (int): Number of configurations sampled in the first round.
+        factor (int): Halving factor between rounds, at least 2.
+        cv (int): Number of cross-validation folds used to score a candidate.
+        scoring (str): sklearn scoring name used to rank candidates.
+        n_jobs (int, optional): Number of worker processes within the core budget of src.resources,
+            None or -1 for the whole budget.
+        random_state (int): Seed of the candidate sampling and of the models.
+
+    Returns:
+        dict: The best configuration as {"model", "params", "score", "resource", "n_rounds", "seconds"}.
+
+    Raises:
+        ValueError: If the model has no search space, the resource does not apply to it or factor is below 2.
+    """
+    if model_name not in SEARCH_SPACES:
+        raise ValueError(f"Model {model_name} has no search space. Tunable models: {', '.join(SEARCH_SPACES)}")
+    if resource not in RESOURCES:
+        raise ValueError(f"Unknown resource {resource}. Choose one of: {', '.join(RESOURCES)}")
+    if factor < 2:
+        raise ValueError(f"The halving factor must be at least 2, got {factor}.")
+
+    search_space = dict(SEARCH_SPACES[model_name])
+    workers, n_threads = split_n_jobs(n_jobs, n_candidates * cv)
+    model = ModelFactory.create_model(model_name)
+    set_estimator_n_jobs(model, n_threads)
+    estimator = model.model
+    search_options = {}
+    if resource == "n_estimators":
+        if "n_estimators" not in estimator.get_params():
+            raise ValueError(f"Model {model_name} cannot use n_estimators as budget.")
+        search_space.pop("n_estimators")
+        # At least one tree, however large the factor
+        search_options = {"min_resources": max(1, MAX_ESTIMATORS // factor**3), "max_resources": MAX_ESTIMATORS}
+
+    search = HalvingRandomSearchCV(
+        estimator,
+        search_space,
+        n_candidates=n_candidates,
+        factor=factor,
+        resource=resource,
+        cv=cv,
+        scoring=scoring,
+        n_jobs=workers,
+        random_state=random_state,
+        refit=False,
+        **search_options,
+    )
+    start = time.perf_counter()
+    search.fit(X, y)
+    seconds = time.perf_counter() - start
+
+    best_params = _to_builtin(search.best_params_)
+    if resource == "n_estimators":
+        best_params["n_estimators"] = int(search.n_resources_[-1])
+    logging.info(f"Tuned {model_name} in {search.n_iterations_} rounds and {seconds:.1f}s.")
+    return {
+        "model": model_name,
+        "params": best_params,
+        "score": float(search.best_score_),
+        "resource": resource,
+        "n_rounds": int(search.n_iterations_),
+        "seconds": seconds,
+    }
+
+
+def save_config(config: dict, path: str) -> None:
+    """Writes a tuning result as JSON, readable by ModelFactory.create_model_from_config()."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w") as file:
+        json.dump(config, file, indent=2)
+
+
+def _to_builtin(params: dict) -> dict:
+    return {name: value.item() if isinstance(value, np.generic) else value for name, value in params.items()}
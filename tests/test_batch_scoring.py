@@ -0,0 +1,39 @@
+import numpy as np
+import pandas as pd
+import pytest
+from src.batch_scoring import score_csv
+from src.data_manager import DataManager
+from src.model_artifact import ModelArtifact
+from src.models.model_factory import ModelFactory
+
+
+@pytest.fixture(scope="module")
+def artifact_path(tmp_path_factory):
+    dm = DataManager("./data/train.csv")
+    dm.load_data()
+    dm.preprocess()
+    model = ModelFactory.create_model("logistic_regression")
+    model.train(dm.get_processed_data(), dm.get_target())
+    path = str(tmp_path_factory.mktemp("artifacts") / "model.joblib")
+    ModelArtifact("logistic_regression", model, dm.preprocessor).save(path)
+    return path
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_chunked_scoring_matches_whole_file_in_input_order(artifact_path, tmp_path, n_jobs):
+    output = tmp_path / "submission.csv"
+    rows = score_csv(artifact_path, "./data/test.csv", str(output), chunk_size=37, n_jobs=n_jobs)
+
+    submission = pd.read_csv(output)
+    test_data = pd.read_csv("./data/test.csv")
+    assert rows == len(test_data)
+    assert list(submission.columns) == ["PassengerId", "Survived"]
+    np.testing.assert_array_equal(submission["PassengerId"], test_data["PassengerId"])
+    np.testing.assert_array_equal(submission["Survived"], ModelArtifact.load(artifact_path).predict(test_data))
+
+
+def test_failed_scoring_leaves_no_output(artifact_path, tmp_path):
+    output = tmp_path / "submission.csv"
+    with pytest.raises(Exception):
+        score_csv(artifact_path, "./data/missing.csv", str(output), n_jobs=1)
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+from src.cache import DataCache
+from src.data_manager import DataManager, read_csv
+
+
+def test_data_manager_reuses_cached_frame_and_features(tmp_path):
+    cache = DataCache(str(tmp_path))
+    first = DataManager("./data/train.csv", cache=cache)
+    first.load_data()
+    first.preprocess()
+
+    second = DataManager("./data/train.csv", cache=cache)
+    second.load_data()
+    pd.testing.assert_frame_equal(second.data, read_csv("./data/train.csv"))
+    second.preprocess()
+
+    assert isinstance(second.get_processed_data(), np.memmap)
+    np.testing.assert_array_equal(second.get_processed_data(), first.get_processed_data())
+    np.testing.assert_array_equal(second.get_target(), first.get_target())
+    assert second.preprocessor.feature_names == first.preprocessor.feature_names
+
+
+def test_cache_evicts_least_recently_used_entries(tmp_path):
+    frame = pd.DataFrame({"a": np.arange(1000)})
+    cache = DataCache(str(tmp_path), max_bytes=20_000)
+    cache.store_frame("old", frame)
+    cache.store_frame("new", frame)
+    cache.store_frame("newest", frame)
+
+    assert cache.load_frame("old") is None
+    pd.testing.assert_frame_equal(cache.load_frame("newest"), frame)
+
+
+def test_files_digest_covers_every_shard(tmp_path):
+    first, second = tmp_path / "a.csv", tmp_path / "b.csv"
+    first.write_text("x\n1\n")
+    second.write_text("x\n2\n")
+
+    assert DataCache.files_digest([str(first)]) == DataCache.file_digest(str(first))
+    digest = DataCache.files_digest([str(first), str(second)])
+    assert digest != DataCache.files_digest([str(second), str(first)])
+    second.write_text("x\n3\n")
+    assert digest != DataCache.files_digest([str(first), str(second)])
@@ -1,3 +1,7 @@
+import json
+import subprocess
+import sys
+
 import pytest
 from click.testing import CliRunner
 from unittest.mock import patch, MagicMock
@@ -9,34 +13,203 @@
 mock_model_instance = MagicMock()
 mock_evaluation_metric = MagicMock()
 
+
 @pytest.fixture
 def runner():
     return CliRunner()
 
-@patch('src.cli.DataManager', return_value=mock_data_manager)
-@patch('src.cli.ModelFactory.create_model', return_value=mock_model_instance)
-@patch('src.cli.evaluation_metrics', {'accuracy': MagicMock(return_value=mock_evaluation_metric)})
+
+@patch("src.cli.DataManager", return_value=mock_data_manager)
+@patch("src.cli.ModelFactory.create_model", return_value=mock_model_instance)
+@patch("src.cli.evaluation_metrics", {"accuracy": MagicMock(return_value=mock_evaluation_metric)})
 def test_cli_valid_input(mock_data_manager, mock_model_factory, mock_evaluation_metric, runner):
-    mock_data_manager.get_processed_data.return_value = 'mock_data'
-    mock_data_manager.get_target.return_value = 'mock_target'
-    mock_model_instance.predict.return_value = 'mock_predictions'
+    mock_data_manager.get_processed_data.return_value = "mock_data"
+    mock_data_manager.get_target.return_value = "mock_target"
+    mock_model_instance.predict.return_value = "mock_predictions"
     mock_evaluation_metric.evaluate.return_value = 0.9
 
-    result = runner.invoke(main, ['data/train.csv', '--model', 'logistic_regression', '--metric', 'accuracy'])
+    result = runner.invoke(main, ["data/train.csv", "--model", "logistic_regression", "--metric", "accuracy"])
     assert result.exit_code == 0
     assert "Model trained with accuracy: 0.90" in result.output
 
+
 def test_cli_invalid_model(runner):
-    result = runner.invoke(main, ['data/train.csv', '--model', 'invalid_model', '--metric', 'accuracy'])
+    result = runner.invoke(main, ["data/train.csv", "--model", "invalid_model", "--metric", "accuracy"])
     assert result.exit_code != 0
     assert "Unknown model type: invalid_model" in result.output
 
+
 def test_cli_invalid_metric(runner):
-    result = runner.invoke(main, ['data/train.csv', '--model', 'logistic_regression', '--metric', 'invalid_metric'])
+    result = runner.invoke(main, ["data/train.csv", "--model", "logistic_regression", "--metric", "invalid_metric"])
     assert result.exit_code != 0
     assert "Invalid value for '--metric'" in result.output
 
+
 def test_cli_missing_data_file(runner):
-    result = runner.invoke(main, ['invalid_path/train.csv', '--model', 'logistic_regression', '--metric', 'accuracy'])
+    result = runner.invoke(main, ["invalid_path/train.csv", "--model", "logistic_regression", "--metric", "accuracy"])
     assert result.exit_code != 0
-    assert "Error loading data" in result.output
\ No newline at end of file
+    assert "Error loading data" in result.output
+
+
+def test_cli_train_then_predict(runner, tmp_path):
+    artifact = str(tmp_path / "model.joblib")
+    output = str(tmp_path / "predictions.csv")
+    result = runner.invoke(main, ["train", "data/train.csv", "--model", "gender_baseline", "--output", artifact])
+    assert result.exit_code == 0
+    result = runner.invoke(main, ["predict", "data/test.csv", "--artifact", artifact, "--output", output])
+    assert result.exit_code == 0
+    assert "Predictions for 418 passengers" in result.output
+
+
+def test_cli_help_does_not_import_heavy_dependencies():
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "src/cli.py", "--help"], capture_output=True, text=True
+    )
+    imported = {line.split("|")[-1].strip() for line in result.stderr.splitlines() if line.startswith("import time:")}
+    assert result.returncode == 0
+    assert not {"numpy", "pandas", "sklearn", "scipy", "joblib"} & imported
+
+
+def test_cli_mirrored_constants_match_their_modules():
+    from src import batch_scoring, cli, evaluation, experiments, resources, tuning
+
+    assert set(cli.TUNABLE_MODELS) == set(tuning.SEARCH_SPACES)
+    assert tuple(cli.TUNING_RESOURCES) == tuple(tuning.RESOURCES)
+    assert cli.REPORT_METRICS == evaluation.REPORT_METRICS
+    assert cli.N_JOBS_ENV == resources.N_JOBS_ENV
+    assert cli.DEFAULT_CHUNK_SIZE == batch_scoring.DEFAULT_CHUNK_SIZE
+    assert cli.DEFAULT_RESULTS_PATH == experiments.DEFAULT_RESULTS_PATH
+    assert cli.RESULT_GROUP_COLUMNS == experiments.GROUP_COLUMNS
+
+
+def test_cli_n_jobs_is_only_an_option_of_the_group(runner):
+    result = runner.invoke(main, ["tune", "data/train.csv", "--n-jobs", "2"])
+    assert result.exit_code == 2 and "No such option: --n-jobs" in result.output
+
+
+def test_cli_profile_writes_trace(runner, tmp_path):
+    trace = tmp_path / "trace.json"
+    result = runner.invoke(
+        main, ["--profile", str(trace), "data/train.csv", "--model", "gender_baseline", "--no-cache"]
+    )
+    assert result.exit_code == 0
+    stages = {record["stage"] for record in json.loads(trace.read_text())["stages"]}
+    assert {"DataManager.load_data", "GenderBaselineModel.train", "Accuracy.evaluate"} <= stages
+
+
+def test_cli_bootstrap_reports_intervals(runner):
+    result = runner.invoke(
+        main, ["data/train.csv", "--model", "gender_baseline", "--metric", "all", "--bootstrap", "200", "--no-cache"]
+    )
+    assert result.exit_code == 0
+    assert "Bootstrap over 200 resamples" in result.output and "95% interval" in result.output
+
+
+def test_cli_quarantines_invalid_rows(runner, tmp_path):
+    data = tmp_path / "train.csv"
+    quarantine = tmp_path / "quarantine.csv"
+    data.write_text(open("data/train.csv").read().replace(",male,", ",m,", 1))
+    result = runner.invoke(
+        main,
+        [
+            "train",
+            str(data),
+            "--model",
+            "gender_baseline",
+            "--output",
+            str(tmp_path / "model.joblib"),
+            "--quarantine",
+            str(quarantine),
+            "--no-cache",
+        ],
+    )
+    assert result.exit_code == 0
+    assert "Quarantined 1 invalid rows" in result.output
+    assert len(quarantine.read_text().splitlines()) == 2
+
+
+def test_cli_quarantines_missing_and_overflowing_integers(runner, tmp_path):
+    lines = open("data/train.csv").read().splitlines(keepends=True)
+    lines[1] = lines[1].replace(",3,", ",,", 1)  # Pclass of passenger 1
+    lines[2] = lines[2].replace(",1,0,PC", ",300,0,PC", 1)  # SibSp of passenger 2
+    data = tmp_path / "train.csv"
+    data.write_text("".join(lines))
+    quarantine = tmp_path / "quarantine.csv"
+    result = runner.invoke(
+        main,
+        [
+            "train",
+            str(data),
+            "--model",
+            "gender_baseline",
+            "--output",
+            str(tmp_path / "model.joblib"),
+            "--quarantine",
+            str(quarantine),
+            "--no-cache",
+        ],
+    )
+    assert result.exit_code == 0
+    assert "Quarantined 2 invalid rows" in result.output
+    assert [line.split(",")[0] for line in quarantine.read_text().splitlines()[1:]] == ["1", "2"]
+
+
+def test_cli_update_quarantines_invalid_appended_rows(runner, tmp_path):
+    lines = open("data/train.csv").read().splitlines(keepends=True)
+    lines[1] = lines[1].replace(",3,", ",,", 1)  # Pclass of passenger 1
+    data = tmp_path / "train.csv"
+    data.write_text("".join(lines[:701]))
+    quarantine = tmp_path / "quarantine.csv"
+    train = [
+        "train",
+        str(data),
+        "--model",
+        "gender_baseline",
+        "--output",
+        str(tmp_path / "model.joblib"),
+        "--quarantine",
+        str(quarantine),
+        "--no-cache",
+    ]
+    assert runner.invoke(main, train).exit_code == 0
+
+    lines[701] = lines[701].replace(",18,1,0,", ",18,300,0,", 1)  # SibSp of passenger 701
+    with open(data, "a") as file:
+        file.write("".join(lines[701:]))
+    result = runner.invoke(main, train)
+    assert result.exit_code == 0
+    assert "Quarantined 1 invalid appended rows" in result.output
+    assert "Updated the gender_baseline model with 191 appended rows (891 in total)" in result.output
+    assert [line.split(",")[0] for line in quarantine.read_text().splitlines()[1:]] == ["701"]
+
+
+def test_cli_tune_rejects_degenerate_factor_and_folds(runner):
+    for option in ("--factor", "--cv"):
+        result = runner.invoke(main, ["tune", "data/train.csv", option, "1"])
+        assert result.exit_code == 2
+        assert f"Invalid value for '{option}'" in result.output
+
+
+def test_cli_importance_ranks_features(runner, tmp_path):
+    artifact = str(tmp_path / "model.joblib")
+    result = runner.invoke(main, ["train", "data/train.csv", "--model", "gender_baseline", "--output", artifact])
+    assert result.exit_code == 0
+    result = runner.invoke(
+        main, ["--n-jobs", "1", "importance", "data/train.csv", "--artifact", artifact, "--n-repeats", "2"]
+    )
+    assert result.exit_code == 0
+    assert "Baseline accuracy" in result.output and "\nSex " in result.output
+
+
+def test_cli_experiment_resumes_and_reports(runner, tmp_path):
+    spec = tmp_path / "sweep.json"
+    spec.write_text(json.dumps({"data": "data/train.csv", "models": ["gender_baseline"], "seeds": [1, 2]}))
+    db = str(tmp_path / "results.db")
+    result = runner.invoke(main, ["--n-jobs", "1", "experiment", str(spec), "--db", db])
+    assert result.exit_code == 0
+    assert "2 runs completed, 0 failed and 0 skipped" in result.output
+    result = runner.invoke(main, ["experiment", str(spec), "--db", db])
+    assert "0 runs completed, 0 failed and 2 skipped" in result.output
+    result = runner.invoke(main, ["results", "--db", db, "--group-by", "seed", "--metric", "f1"])
+    assert result.exit_code == 0
+    assert "mean f1" in result.output and len(result.output.splitlines()) == 4
@@ -0,0 +1,37 @@
+import numpy as np
+from src.cross_validation import cross_validate, encode_features, summarize
+from src.data_manager import DataManager, FeaturePreprocessor
+
+
+def test_cross_validate_uses_every_row_once_for_testing():
+    dm = DataManager("./data/train.csv")
+    dm.load_data()
+    dm.engineer_features(impute_age=False)
+
+    results = cross_validate(dm.data, dm.get_target(), "logistic_regression", n_splits=4, n_jobs=2)
+
+    assert [result["fold"] for result in results] == [0, 1, 2, 3]
+    mean_accuracy, std_accuracy = summarize(results)["accuracy"]
+    assert 0.7 < mean_accuracy < 0.9
+    assert std_accuracy >= 0
+    assert np.isfinite([result["train_seconds"] for result in results]).all()
+
+
+def test_folds_learn_age_imputation_and_use_the_model_encoding(monkeypatch):
+    dm = DataManager("./data/train.csv")
+    dm.load_data()
+    dm.engineer_features(impute_age=False)
+    encoded = encode_features(dm.data)
+    assert np.isnan(encoded[:, 0]).sum() == dm.data["Age"].isna().sum() == 177
+
+    fitted = []
+    original = FeaturePreprocessor.fit_age_means
+
+    def fit_age_means(self, data):
+        fitted.append((self.encoding, len(data)))
+        original(self, data)
+
+    monkeypatch.setattr(FeaturePreprocessor, "fit_age_means", fit_age_means)
+    results = cross_validate(dm.data, dm.get_target(), "hist_gradient_boosting", n_splits=3, n_jobs=1)
+    assert fitted == [("ordinal", 594)] * 3
+    assert 0.7 < summarize(results)["accuracy"][0] < 0.9
@@ -1,14 +1,151 @@
+import numpy as np
+import pandas as pd
 import pytest
-from src.data_manager import DataManager
+from src.data_manager import DataManager, read_csv, read_csv_tail
+
 
 def test_load_data_success():
-    filepath = "./data/train.csv" 
+    filepath = "./data/train.csv"
     dm = DataManager(filepath)
     dm.load_data()
     assert dm.data is not None, "Data should be loaded"
 
+
 def test_load_data_fail_with_invalid_path():
     with pytest.raises(Exception):
         filepath = "no_exist_folder/data.csv"
         dm = DataManager(filepath)
-        dm.load_data()
\ No newline at end of file
+        dm.load_data()
+
+
+def _legacy_feature_frame(data):
+    """Reference copy of the original per-row feature engineering, kept to pin the output."""
+    import re
+
+    data = data.drop(columns=["Ticket", "Cabin", "PassengerId"], errors="ignore")
+    data["Title"] = data["Name"].apply(
+        lambda x: re.findall(r"\b\w+\.", x)[0] if re.findall(r"\b\w+\.", x) else "Unknown"
+    )
+    title_mappings = {"Mlle.": "Miss.", "Ms.": "Miss.", "Mme.": "Mrs.", "Lady.": "Mrs."}
+    data["Title"] = data["Title"].replace(title_mappings)
+    data["Title"] = data["Title"].apply(lambda x: x if x in (["Mr.", "Miss.", "Mrs.", "Master."]) else "Other")
+    data.drop(columns=["Name"], inplace=True)
+    data["FamilySize"] = data["SibSp"] + data["Parch"] + 1
+    data["IsAlone"] = 1
+    data.loc[data["FamilySize"] > 1, "IsAlone"] = 0
+    mean_ages = data.groupby(["Title", "Pclass"])["Age"].transform("mean")
+    data["Age"] = data["Age"].fillna(mean_ages)
+    return data.drop(columns=["Survived"])
+
+
+def _legacy_transformer():
+    """Reference copy of the original column transformer, fitted afresh on the legacy features."""
+    from sklearn.compose import ColumnTransformer
+    from sklearn.impute import SimpleImputer
+    from sklearn.pipeline import Pipeline
+    from sklearn.preprocessing import OneHotEncoder, StandardScaler
+
+    categorical = Pipeline(
+        steps=[
+            ("imputer", SimpleImputer(strategy="constant", fill_value="missing")),
+            ("onehot", OneHotEncoder(handle_unknown="ignore")),
+        ]
+    )
+    return ColumnTransformer(
+        transformers=[
+            ("num", Pipeline(steps=[("scaler", StandardScaler())]), ["Age", "Fare", "SibSp", "Parch", "FamilySize"]),
+            ("cat", categorical, ["Pclass", "Sex", "Embarked", "Title", "IsAlone"]),
+        ]
+    )
+
+
+def test_preprocess_matches_legacy_feature_engineering():
+    dm = DataManager("./data/train.csv")
+    dm.load_data()
+    raw = dm.data.copy()
+    raw.loc[0, "Name"] = "No title here"
+    dm._data = raw.copy()
+    dm.preprocess()
+
+    expected = _legacy_feature_frame(raw)
+    pd.testing.assert_frame_equal(dm.data, expected)
+    legacy = _legacy_transformer()
+    expected_matrix = legacy.fit_transform(expected)
+    assert dm.preprocessor.feature_names == list(legacy.get_feature_names_out())
+    # The processed matrix is float32
+    np.testing.assert_allclose(dm.get_processed_data(), expected_matrix, rtol=1e-6, atol=1e-6)
+
+
+def test_load_data_uses_compact_schema():
+    dm = DataManager("./data/train.csv")
+    dm.load_data()
+
+    assert "Ticket" not in dm.data.columns and "Cabin" not in dm.data.columns
+    assert isinstance(dm.data["Sex"].dtype, pd.CategoricalDtype)
+    assert dm.data["Pclass"].dtype == np.int8 and dm.data["Fare"].dtype == np.float32
+    assert dm.data.memory_usage(deep=True).sum() < pd.read_csv("./data/train.csv").memory_usage(deep=True).sum() / 2
+
+
+def test_load_data_with_pyarrow_engine():
+    pytest.importorskip("pyarrow")
+    default, arrow = DataManager("./data/test.csv"), DataManager("./data/test.csv", engine="pyarrow")
+    default.load_data()
+    arrow.load_data()
+    pd.testing.assert_frame_equal(arrow.data, default.data)
+
+
+def _write_shards(directory):
+    raw = pd.read_csv("./data/train.csv")
+    # Small first shards see only some ports, so the categories have to be unified when concatenating
+    for index, (start, stop) in enumerate([(0, 2), (2, 400), (400, len(raw))]):
+        raw.iloc[start:stop].to_csv(directory / f"part-{index}.csv", index=False)
+
+
+def test_load_data_from_directory_and_glob(tmp_path):
+    _write_shards(tmp_path)
+    expected = DataManager("./data/train.csv")
+    expected.load_data()
+
+    for filepath in (str(tmp_path), str(tmp_path / "part-*.csv")):
+        dm = DataManager(filepath)
+        dm.load_data()
+        pd.testing.assert_frame_equal(dm.data, expected.data)
+        assert dm.load_errors == []
+
+
+def test_load_data_skips_malformed_shards(tmp_path):
+    _write_shards(tmp_path)
+    (tmp_path / "part-3.csv").write_text("PassengerId,Survived\n1,not a number\n")
+    (tmp_path / "part-4.csv").write_text("Name,Sex\nBraund,male\n")
+
+    dm = DataManager(str(tmp_path))
+    dm.load_data()
+
+    assert len(dm.data) == 891
+    assert [path.rsplit("/", 1)[-1] for path, _ in dm.load_errors] == ["part-3.csv", "part-4.csv"]
+
+
+def test_load_data_fails_when_glob_matches_nothing(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        DataManager(str(tmp_path / "*.csv")).load_data()
+
+
+def test_integer_columns_never_wrap_around(tmp_path):
+    raw = pd.read_csv("./data/train.csv")
+    raw.loc[3, "SibSp"] = 300
+    raw.loc[4, "Parch"] = 130
+    raw.loc[5, "Pclass"] = np.nan
+    path = tmp_path / "train.csv"
+    raw.to_csv(path, index=False)
+
+    dm = DataManager(str(path), validation=None)
+    dm.load_data()
+    assert dm.data["SibSp"].dtype == np.float64 and dm.data.loc[3, "SibSp"] == 300
+    assert dm.data.loc[4, "Parch"] == 130 and np.isnan(dm.data.loc[5, "Pclass"])
+    assert dm.data["Survived"].dtype == np.int8 and dm.data["PassengerId"].dtype == np.int32
+
+    chunks = list(read_csv(str(path), chunksize=4))
+    assert chunks[0]["SibSp"].dtype == np.float64 and chunks[0].loc[3, "SibSp"] == 300
+    assert chunks[2]["SibSp"].dtype == np.int8
+    tail = read_csv_tail(str(path), len(path.read_text().splitlines(keepends=True)[0]))
+    assert tail.loc[5, "Pclass"] != tail.loc[5, "Pclass"] and tail.loc[4, "Parch"] == 130
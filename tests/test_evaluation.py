@@ -1,5 +1,18 @@
 import numpy as np
-from src.evaluation import Accuracy
+import pytest
+from sklearn.metrics import average_precision_score, f1_score, roc_auc_score
+from src.evaluation import (
+    REPORT_METRICS,
+    Accuracy,
+    BootstrapEvaluation,
+    ConfusionMatrix,
+    F1Score,
+    FullReport,
+    StreamingEvaluation,
+    ThresholdSweep,
+    metrics_from_counts,
+)
+
 
 def test_accuracy_evaluation():
     y_true = np.array([1, 0, 1, 1, 0])
@@ -7,4 +20,89 @@ def test_accuracy_evaluation():
     accuracy_evaluator = Accuracy()
     accuracy = accuracy_evaluator.evaluate(y_true, y_pred)
     expected_accuracy = 0.8  # 4 out of 5 predictions are correct
-    assert accuracy == expected_accuracy, f"Expected accuracy is {expected_accuracy}, but got {accuracy}"
\ No newline at end of file
+    assert accuracy == expected_accuracy, f"Expected accuracy is {expected_accuracy}, but got {accuracy}"
+
+
+def test_full_report_matches_individual_metrics():
+    rng = np.random.default_rng(0)
+    y_true = rng.integers(0, 2, 1000)
+    y_pred = rng.integers(0, 2, 1000)
+    accuracy, precision, recall, f1 = FullReport().evaluate(y_true, y_pred)
+
+    true_positives = np.sum((y_true == 1) & (y_pred == 1))
+    assert accuracy == np.mean(y_true == y_pred)
+    assert precision == true_positives / np.sum(y_pred == 1)
+    assert recall == true_positives / np.sum(y_true == 1)
+    assert f1 == F1Score().evaluate(y_true, y_pred)
+    assert ConfusionMatrix.from_predictions(y_true, y_pred).as_array().sum() == 1000
+
+
+def test_streaming_evaluation_matches_single_pass():
+    rng = np.random.default_rng(1)
+    y_true = rng.integers(0, 2, 10_000)
+    y_pred = rng.integers(0, 2, 10_000)
+    streaming = StreamingEvaluation(F1Score())
+    for start in range(0, len(y_true), 999):
+        streaming.update(y_true[start : start + 999], y_pred[start : start + 999])
+    assert streaming.result() == F1Score().evaluate(y_true, y_pred)
+
+
+def test_metrics_from_counts_matches_confusion_matrix():
+    counts = np.array([[5, 3, 2, 7], [4, 0, 6, 0], [0, 0, 0, 9]])
+    metrics = metrics_from_counts(counts)
+    for row, (tn, fp, fn, tp) in enumerate(counts):
+        matrix = ConfusionMatrix(tn, fp, fn, tp)
+        assert metrics["accuracy"][row] == matrix.accuracy()
+        assert metrics["precision"][row] == matrix.precision()
+        assert metrics["recall"][row] == matrix.recall()
+        assert metrics["f1"][row] == pytest.approx(matrix.f1())
+
+
+def test_confusion_matrix_rejects_non_binary_labels():
+    assert ConfusionMatrix.from_predictions([0, 1, 1], [1, 1, 0]) == ConfusionMatrix(0, 1, 1, 1)
+    for y_true, y_pred in (([0, 1, 1], [2, 1, 0]), ([2, 1, 0], [0, 1, 1]), ([0, 1], [0.5, 1]), ([0, 1], [-1, 1])):
+        with pytest.raises(ValueError, match="binary 0/1"):
+            ConfusionMatrix.from_predictions(y_true, y_pred)
+
+
+def test_bootstrap_matches_resampling_predictions():
+    rng = np.random.default_rng(2)
+    y_true = rng.integers(0, 2, 300)
+    y_pred = np.where(rng.random(300) < 0.8, y_true, 1 - y_true)
+    results = BootstrapEvaluation(5000, random_state=0).evaluate(y_true, y_pred)
+
+    # Reference: resample the predictions themselves with an index matrix
+    indices = rng.integers(0, len(y_true), (5000, len(y_true)))
+    accuracies = (y_true[indices] == y_pred[indices]).mean(axis=1)
+    assert results["accuracy"]["estimate"] == Accuracy().evaluate(y_true, y_pred)
+    assert results["accuracy"]["std"] == pytest.approx(accuracies.std(), rel=0.1)
+    for metric in REPORT_METRICS:
+        assert results[metric]["lower"] <= results[metric]["estimate"] <= results[metric]["upper"]
+
+
+def test_bootstrap_is_reproducible_and_independent_of_chunk_size():
+    confusion_matrix = ConfusionMatrix(tn=50, fp=10, fn=15, tp=25)
+    whole = BootstrapEvaluation(1000, random_state=3).resample(confusion_matrix)
+    chunked = BootstrapEvaluation(1000, chunk_size=7, random_state=3).resample(confusion_matrix)
+    for metric in REPORT_METRICS:
+        np.testing.assert_array_equal(whole[metric], chunked[metric])
+
+
+def test_threshold_sweep_matches_evaluating_every_threshold():
+    rng = np.random.default_rng(4)
+    y_true = rng.integers(0, 2, 2000)
+    # Rounded scores have many ties, which must switch to positive together
+    scores = np.round(np.clip(0.3 * y_true + 0.8 * rng.random(2000), 0, 1), 2)
+    results = ThresholdSweep().evaluate(y_true, scores)
+
+    assert results["roc_auc"] == pytest.approx(roc_auc_score(y_true, scores))
+    assert results["pr_auc"] == pytest.approx(average_precision_score(y_true, scores))
+    best = results["operating_points"]["f1"]
+    assert best["f1"] == pytest.approx(max(f1_score(y_true, scores >= t) for t in np.unique(scores)))
+    assert best["f1"] == pytest.approx(f1_score(y_true, scores >= best["threshold"]))
+    assert results["operating_points"]["recall"]["recall"] == 1.0
+
+
+def test_threshold_sweep_needs_both_classes():
+    with pytest.raises(ValueError):
+        ThresholdSweep().evaluate(np.ones(10), np.linspace(0, 1, 10))
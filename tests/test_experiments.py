@@ -0,0 +1,79 @@
+import json
+
+import pytest
+from src.experiments import ResultStore, format_summary, load_sweep, run_sweep
+
+
+def _write_spec(tmp_path, **spec):
+    path = tmp_path / "sweep.json"
+    path.write_text(json.dumps({"data": "./data/train.csv", **spec}))
+    return str(path)
+
+
+def test_sweep_resumes_by_skipping_completed_runs(tmp_path):
+    db = str(tmp_path / "results.db")
+    spec = load_sweep(_write_spec(tmp_path, models=["gender_baseline", "logistic_regression"], seeds=[1]))
+    assert spec["name"] == "sweep" and spec["test_sizes"] == [0.2]
+
+    summary = run_sweep(spec, db, n_jobs=2)
+    assert (summary["runs"], summary["completed"], summary["skipped"]) == (2, 2, 0)
+
+    spec["seeds"] = [1, 2]
+    summary = run_sweep(spec, db, n_jobs=2)
+    assert (summary["runs"], summary["completed"], summary["skipped"]) == (4, 2, 2)
+    assert len(ResultStore(db).completed_keys()) == 4
+
+
+def test_failed_runs_are_stored_and_retried(tmp_path):
+    db = str(tmp_path / "results.db")
+    params = {"random_forest": {"max_depth": -1, "n_estimators": 10}}
+    spec = load_sweep(_write_spec(tmp_path, models=["random_forest", "gender_baseline"], test_sizes=[0.2, 0.3]))
+    spec["params"] = params
+
+    summary = run_sweep(spec, db, n_jobs=1)
+    assert (summary["completed"], summary["failed"]) == (2, 2)
+    store = ResultStore(db)
+    assert [failure[:3] for failure in store.failures()] == [("random_forest", 42, 0.2), ("random_forest", 42, 0.3)]
+
+    summary = run_sweep(spec, db, n_jobs=1)
+    assert (summary["skipped"], summary["failed"]) == (2, 2)
+    assert len(store.failures("sweep")) == 2 and store.failures("other") == []
+
+
+def test_runs_of_unloadable_data_fail_and_the_sweep_continues(tmp_path):
+    db = str(tmp_path / "results.db")
+    broken = tmp_path / "broken.csv"
+    broken.write_text(open("./data/train.csv").read().replace(",3,", ",third,", 1))
+    spec = load_sweep(_write_spec(tmp_path, models=["gender_baseline"], seeds=[1, 2]))
+    spec["data"] = [str(broken), "./data/train.csv"]
+
+    summary = run_sweep(spec, db, n_jobs=1)
+    assert (summary["runs"], summary["completed"], summary["failed"]) == (4, 2, 2)
+    failures = ResultStore(db).failures()
+    assert [failure[:2] for failure in failures] == [("gender_baseline", 1), ("gender_baseline", 2)]
+    assert all("could not convert string to float" in failure[3] for failure in failures)
+
+
+def test_summary_groups_completed_runs(tmp_path):
+    db = str(tmp_path / "results.db")
+    spec = load_sweep(_write_spec(tmp_path, name="grid", models=["gender_baseline"], seeds=[1, 2, 3]))
+    run_sweep(spec, db, n_jobs=1)
+    store = ResultStore(db)
+
+    (group,) = store.summarize("f1", group_by=("sweep", "model"))
+    assert group["sweep"] == "grid" and group["model"] == "gender_baseline" and group["runs"] == 3
+    assert group["min"] <= group["mean"] <= group["max"] and group["std"] >= 0
+    assert len(store.summarize(group_by=("seed",))) == 3 and store.summarize(sweep="other") == []
+    assert "gender_baseline" in format_summary(store.summarize("f1"), "f1")
+
+    with pytest.raises(ValueError, match="Cannot group by"):
+        store.summarize(group_by=("run_key",))
+    with pytest.raises(ValueError, match="Unknown metric"):
+        store.summarize("auc")
+
+
+def test_invalid_sweeps_are_rejected(tmp_path):
+    with pytest.raises(ValueError, match="Unknown sweep keys: metric"):
+        load_sweep(_write_spec(tmp_path, models=["gender_baseline"], metric="accuracy"))
+    with pytest.raises(ValueError, match="Unknown model type"):
+        load_sweep(_write_spec(tmp_path, models=["svm"]))
@@ -0,0 +1,96 @@
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import sparse
+from src.data_manager import DataManager, encoded_feature_names
+from src.models.gender_baseline_model import GenderBaselineModel
+from src.models.model_factory import ModelFactory
+
+MODELS = [
+    "gender_baseline",
+    "logistic_regression",
+    "random_forest",
+    "gradient_boosting",
+    "hist_gradient_boosting",
+    "sgd_logistic",
+]
+# Models allocating about a matrix worth of buffers of their own while fitting (tree nodes, sample indices,
+# histogram bins and the early-stopping split)
+BUFFERING_MODELS = ("random_forest", "gradient_boosting", "hist_gradient_boosting")
+FAST_PARAMS = {
+    "random_forest": {"n_estimators": 10},
+    "gradient_boosting": {"n_estimators": 10},
+    "hist_gradient_boosting": {"max_iter": 10},
+}
+
+
+def _processed(model_name=None, copies=1, **options):
+    if model_name is not None:
+        options.update(encoding=ModelFactory.feature_encoding(model_name), dtype=ModelFactory.feature_dtype(model_name))
+    dm = DataManager(None, **options)
+    dm.load_frame(pd.concat([pd.read_csv("./data/train.csv")] * copies, ignore_index=True))
+    dm.preprocess()
+    return dm
+
+
+def _peak_bytes(function, *args):
+    tracemalloc.start()
+    try:
+        function(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+@pytest.mark.parametrize("encoding", ["onehot", "ordinal"])
+def test_feature_matrix_is_c_contiguous_float32_with_fixed_column_names(encoding):
+    dm = _processed(encoding=encoding)
+    X = dm.get_processed_data()
+
+    assert X.dtype == np.float32 and X.flags.c_contiguous
+    assert dm.preprocessor.feature_names == encoded_feature_names(encoding)
+    assert dm.get_processed_data() is X
+
+    scoring = DataManager(None, preprocessor=dm.preprocessor)
+    scoring.load_frame(pd.read_csv("./data/test.csv"))
+    scoring.preprocess()
+    assert scoring.get_processed_data().dtype == np.float32 and scoring.get_processed_data().shape[1] == X.shape[1]
+
+
+def test_float64_and_sparse_feature_matrices():
+    dense = _processed(dtype="float64").get_processed_data()
+    assert dense.dtype == np.float64 and dense.flags.c_contiguous
+
+    X = _processed(sparse=True).get_processed_data()
+    assert sparse.isspmatrix_csr(X) and X.dtype == np.float32
+    np.testing.assert_allclose(X.toarray(), dense, rtol=1e-6, atol=1e-6)
+    np.testing.assert_array_equal(GenderBaselineModel().predict(X), GenderBaselineModel().predict(dense))
+
+    with pytest.raises(ValueError, match="Unknown feature dtype"):
+        DataManager(None, dtype="float16")
+
+
+@pytest.mark.parametrize("model_name", MODELS)
+def test_models_do_not_copy_the_feature_matrix(model_name):
+    dm = _processed(model_name, copies=10)
+    X, y = dm.get_processed_data(), dm.get_target()
+    params = FAST_PARAMS.get(model_name, {})
+    model = ModelFactory.create_model(model_name, **params)
+
+    train_peak = _peak_bytes(model.train, X, y)
+    if model_name in BUFFERING_MODELS:
+        # Their own buffers hide a copy from the absolute bound, so compare with the other dtype, which is copied
+        other = X.astype(np.float64 if X.dtype == np.float32 else np.float32)
+        other_peak = _peak_bytes(ModelFactory.create_model(model_name, **params).train, other, y)
+        assert other_peak - train_peak > X.nbytes / 2
+    else:
+        assert train_peak < X.nbytes
+    # A hidden conversion would copy at least the whole matrix
+    assert _peak_bytes(model.predict, X) < X.nbytes
+    assert _peak_bytes(model.predict_proba, X) < X.nbytes
+    if model_name == "logistic_regression":
+        # The measurement does see the copy made when the lbfgs solver gets float32 features
+        X32 = _processed(copies=10).get_processed_data()
+        assert _peak_bytes(ModelFactory.create_model(model_name).train, X32, y) > 2 * X32.nbytes
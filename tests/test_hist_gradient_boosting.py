@@ -0,0 +1,32 @@
+import numpy as np
+import pandas as pd
+from sklearn.model_selection import train_test_split
+from src.data_manager import DataManager
+from src.evaluation import Accuracy
+from src.model_artifact import ModelArtifact
+from src.models.model_factory import ModelFactory
+
+
+def test_hist_gradient_boosting_uses_native_categorical_codes(tmp_path):
+    assert ModelFactory.feature_encoding("hist_gradient_boosting") == "ordinal"
+    dm = DataManager("./data/train.csv", encoding="ordinal")
+    dm.load_data()
+    dm.preprocess()
+    X_train, X_test, y_train, y_test = train_test_split(
+        dm.get_processed_data(), dm.get_target(), test_size=0.2, random_state=42
+    )
+
+    model = ModelFactory.create_model("hist_gradient_boosting")
+    model.train(X_train, y_train)
+
+    assert X_train.shape[1] == 10
+    assert model.model.is_categorical_.tolist() == [False] * 5 + [True] * 5
+    assert model.model.n_iter_ < model.model.max_iter
+    assert Accuracy().evaluate(y_test, model.predict(X_test)) > 0.78
+
+    path = str(tmp_path / "model.joblib")
+    ModelArtifact("hist_gradient_boosting", model, dm.preprocessor).save(path)
+    artifact = ModelArtifact.load(path)
+    assert artifact.feature_schema["encoding"] == "ordinal"
+    predictions = artifact.predict(pd.read_csv("./data/train.csv"))
+    np.testing.assert_array_equal(predictions, model.predict(dm.get_processed_data()))
@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+from src.data_manager import DataManager
+from src.importance import feature_groups, permutation_importance, score_predictions
+from src.models.model_factory import ModelFactory
+
+
+def _trained(model_name, encoding="onehot"):
+    dm = DataManager("./data/train.csv", encoding=encoding)
+    dm.load_data()
+    dm.preprocess()
+    model = ModelFactory.create_model(model_name)
+    model.train(dm.get_processed_data(), dm.get_target())
+    return model, dm
+
+
+def test_feature_groups_cover_every_column():
+    groups = feature_groups(["num__Age", "num__Fare", "cat__Sex_female", "cat__Sex_male", "cat__Title_Mr."])
+    assert groups == {"Age": slice(0, 1), "Fare": slice(1, 2), "Sex": slice(2, 4), "Title": slice(4, 5)}
+    with pytest.raises(ValueError, match="not adjacent"):
+        feature_groups(["cat__Sex_female", "num__Age", "cat__Sex_male"])
+
+
+def test_score_predictions_matches_the_metrics():
+    y_true, y_pred = np.array([0, 1, 1, 0, 1]), np.array([0, 1, 0, 1, 1])
+    assert score_predictions(y_true, y_pred, "accuracy") == pytest.approx(0.6)
+    assert score_predictions(y_true, y_pred, "recall") == pytest.approx(2 / 3)
+
+
+@pytest.mark.parametrize("model_name, encoding", [("random_forest", "onehot"), ("hist_gradient_boosting", "ordinal")])
+def test_importance_is_reproducible_across_workers(model_name, encoding):
+    model, dm = _trained(model_name, encoding)
+    X, y, names = dm.get_processed_data(), dm.get_target(), dm.preprocessor.feature_names
+
+    serial = permutation_importance(model, X, y, names, n_repeats=3, n_jobs=1)
+    parallel = permutation_importance(model, X, y, names, n_repeats=3, n_jobs=2)
+
+    assert serial["importances"] == parallel["importances"]
+    features = {"Age", "Fare", "SibSp", "Parch", "FamilySize", "Pclass", "Sex", "Embarked", "Title", "IsAlone"}
+    assert set(serial["importances"]) == features
+    assert serial["baseline"] == score_predictions(y, model.predict(X), "accuracy")
+
+
+def test_shuffling_the_only_used_feature_drops_the_score():
+    model, dm = _trained("gender_baseline")
+    X, y, names = dm.get_processed_data(), dm.get_target(), dm.preprocessor.feature_names
+    importances = permutation_importance(model, X, y, names, n_repeats=4, n_jobs=1)["importances"]
+
+    assert importances["Sex"]["mean"] > 0.1
+    assert all(importances[feature]["mean"] == 0 for feature in importances if feature != "Sex")
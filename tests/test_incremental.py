@@ -0,0 +1,49 @@
+import numpy as np
+import pandas as pd
+import pytest
+from src.evaluation import Accuracy
+from src.incremental import IncrementalPreprocessor, RunningMoments, train_incremental
+from src.model_artifact import ModelArtifact
+
+
+def test_running_moments_match_full_statistics():
+    X = np.random.default_rng(0).normal(5, 3, size=(1000, 3))
+    X[::7, 1] = np.nan
+    moments = RunningMoments(3)
+    for batch in np.array_split(X, 9):
+        moments.update(batch)
+
+    np.testing.assert_allclose(moments.mean, np.nanmean(X, axis=0))
+    np.testing.assert_allclose(moments.variance, np.nanvar(X, axis=0))
+
+
+def test_incremental_preprocessor_has_fixed_width_and_overflow():
+    data = pd.read_csv("./data/train.csv")
+    preprocessor = IncrementalPreprocessor(capacity=4)
+    first = preprocessor.partial_fit_transform(data.iloc[:400])
+    second = preprocessor.partial_fit_transform(data.iloc[400:])
+
+    assert first.shape[1] == second.shape[1] == preprocessor.n_features == len(preprocessor.feature_names)
+    # Title has five buckets, more than the three regular slots: the rest share the overflow column
+    title_columns = [name for name in preprocessor.feature_names if name.startswith("cat__Title_")]
+    assert title_columns[-1] == "cat__Title_overflow"
+    unseen = data.iloc[:1].assign(Embarked="X")
+    embarked = preprocessor.transform(unseen)[0, [preprocessor.feature_names.index("cat__Embarked_overflow")]]
+    assert embarked == 1.0
+
+
+def test_train_incremental_streams_batches(tmp_path):
+    model, preprocessor, stats = train_incremental("./data/train.csv", batch_size=100, epochs=3)
+
+    assert stats["rows"] == 3 * 891 and stats["rows_per_second"] > 0
+    path = str(tmp_path / "model.joblib")
+    ModelArtifact("sgd_logistic", model, preprocessor).save(path)
+    artifact = ModelArtifact.load(path)
+    assert artifact.is_incremental
+    data = pd.read_csv("./data/train.csv")
+    assert Accuracy().evaluate(data["Survived"].to_numpy(), artifact.predict(data)) > 0.75
+
+
+def test_train_incremental_requires_partial_train():
+    with pytest.raises(ValueError, match="cannot be trained incrementally"):
+        train_incremental("./data/train.csv", model_name="random_forest")
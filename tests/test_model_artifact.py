@@ -0,0 +1,27 @@
+import numpy as np
+import pandas as pd
+from src.data_manager import DataManager
+from src.model_artifact import ModelArtifact
+from src.models.model_factory import ModelFactory
+
+
+def test_artifact_round_trip_scores_unseen_data(tmp_path):
+    dm = DataManager("./data/train.csv")
+    dm.load_data()
+    dm.preprocess()
+    model = ModelFactory.create_model("logistic_regression")
+    model.train(dm.get_processed_data(), dm.get_target())
+
+    path = tmp_path / "model.joblib"
+    ModelArtifact("logistic_regression", model, dm.preprocessor).save(str(path))
+    artifact = ModelArtifact.load(str(path))
+
+    assert artifact.feature_schema["feature_names"] == dm.preprocessor.feature_names
+    test_data = pd.read_csv("./data/test.csv")
+    predictions = artifact.predict(test_data.copy())
+    assert len(predictions) == len(test_data)
+    np.testing.assert_array_equal(
+        artifact.predict(pd.read_csv("./data/train.csv")), model.predict(dm.get_processed_data())
+    )
+    probabilities = artifact.predict_proba(test_data.copy())
+    np.testing.assert_array_equal((probabilities > 0.5).astype(int), predictions)
@@ -0,0 +1,29 @@
+import pandas as pd
+import pytest
+from src.model_comparison import compare_models, format_comparison, preprocess_for_models
+from src.models.model_factory import ModelFactory
+
+
+def test_compare_models_reports_every_model():
+    features, y = preprocess_for_models(pd.read_csv("./data/train.csv"))
+    assert {key: X.shape[1] for key, X in features.items()} == {
+        ("onehot", "float32"): 21,
+        ("onehot", "float64"): 21,
+        ("ordinal", "float64"): 10,
+    }
+    splits = {key: (X[:700], X[700:]) for key, X in features.items()}
+
+    results = compare_models(splits, y[:700], y[700:], n_jobs=2)
+
+    assert [result["model"] for result in results] == ModelFactory.available_models()
+    assert all(0 <= result["accuracy"] <= 1 and result["train_seconds"] >= 0 for result in results)
+    assert "gender_baseline" in format_comparison(results)
+
+
+def test_hist_gradient_boosting_needs_ordinal_features():
+    features, y = preprocess_for_models(pd.read_csv("./data/train.csv"), ["random_forest"])
+    X = features["onehot", "float32"]
+    with pytest.raises(ValueError, match="No ordinal float64 features"):
+        compare_models({"onehot": (X[:700], X[700:])}, y[:700], y[700:], ["hist_gradient_boosting"])
+    with pytest.raises(ValueError, match="ordinal-encoded"):
+        ModelFactory.create_model("hist_gradient_boosting").train(X, y)
@@ -1,6 +1,29 @@
+import numpy as np
+import pandas as pd
+from src.model_comparison import feature_key, preprocess_for_models
 from src.models.model_factory import ModelFactory
 from src.models.random_forest_model import RandomForestModel
 
+
 def test_create_random_forest_model():
     model = ModelFactory.create_model("random_forest")
-    assert isinstance(model, RandomForestModel), "The created model should be an instance of RandomForestModel"
\ No newline at end of file
+    assert isinstance(model, RandomForestModel), "The created model should be an instance of RandomForestModel"
+
+
+def test_create_model_passes_hyperparameters():
+    model = ModelFactory.create_model("random_forest", n_estimators=10, max_depth=3)
+    assert model.model.n_estimators == 10
+    assert model.model.max_depth == 3
+    assert model.model.random_state == 42
+
+
+def test_every_model_predicts_probabilities_consistent_with_predict():
+    features, y = preprocess_for_models(pd.read_csv("./data/train.csv"))
+    for model_name in ModelFactory.available_models():
+        X = features[feature_key(model_name)]
+        model = ModelFactory.create_model(model_name)
+        model.train(X, y)
+        probabilities = model.predict_proba(X)
+        assert probabilities.shape == (len(X),)
+        assert ((probabilities >= 0) & (probabilities <= 1)).all()
+        np.testing.assert_array_equal((probabilities > 0.5).astype(int), model.predict(X), err_msg=model_name)
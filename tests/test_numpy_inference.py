@@ -0,0 +1,37 @@
+import numpy as np
+import pandas as pd
+import pytest
+from src.data_manager import DataManager
+from src.model_artifact import ModelArtifact
+from src.models.model_factory import ModelFactory
+from src.numpy_inference import NumpyPredictor
+
+
+@pytest.fixture(scope="module")
+def training():
+    dm = DataManager("./data/train.csv")
+    dm.load_data()
+    dm.preprocess()
+    return dm
+
+
+@pytest.mark.parametrize("model_name", ["gender_baseline", "logistic_regression", "random_forest", "gradient_boosting"])
+def test_numpy_predictor_matches_sklearn_path(training, model_name, tmp_path):
+    model = ModelFactory.create_model(model_name)
+    model.train(training.get_processed_data(), training.get_target())
+    artifact = ModelArtifact(model_name, model, training.preprocessor)
+    path = str(tmp_path / "model.npz")
+    NumpyPredictor.from_artifact(artifact).save(path)
+    predictor = NumpyPredictor.load(path)
+
+    test_data = pd.read_csv("./data/test.csv")
+    records = test_data.astype(object).where(test_data.notna(), None).to_dict("records")
+    scoring = DataManager(None, preprocessor=training.preprocessor)
+    scoring.load_frame(test_data.copy())
+    scoring.preprocess()
+    X = scoring.get_processed_data()
+
+    np.testing.assert_allclose(predictor.transform_records(records), X, rtol=0, atol=1e-12)
+    np.testing.assert_array_equal(predictor.predict_records(records), artifact.predict(test_data.copy()))
+    if model_name != "gender_baseline":
+        np.testing.assert_allclose(predictor.predict_proba(X), model.model.predict_proba(X)[:, 1], atol=1e-10)
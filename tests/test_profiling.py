@@ -0,0 +1,48 @@
+import json
+
+from src.data_manager import DataManager
+from src.evaluation import Accuracy
+from src.models.model_factory import ModelFactory
+from src.profiling import Profiler, active_profiler, profiled
+
+
+def test_profiler_records_pipeline_stages(tmp_path):
+    with Profiler(trace_memory=True, cprofile_dir=str(tmp_path / "cprofile")) as profiler:
+        data_manager = DataManager("./data/train.csv")
+        data_manager.load_data()
+        data_manager.preprocess()
+        model = ModelFactory.create_model("logistic_regression")
+        model.train(data_manager.get_processed_data(), data_manager.get_target())
+        y_pred = model.predict(data_manager.get_processed_data())
+        Accuracy().evaluate(data_manager.get_target(), y_pred)
+    assert active_profiler() is None
+
+    stages = {record["stage"]: record for record in profiler.records}
+    assert stages["DataManager._impute_age"]["parent"] == "DataManager.preprocess"
+    assert stages["DataManager.preprocess"]["rows"] == 891
+    assert stages["LogisticRegressionModel.train"]["rows"] == 891
+    assert stages["Accuracy.evaluate"]["rows"] == 891
+    assert stages["DataManager.preprocess"]["peak_allocated_bytes"] > 0
+    assert (tmp_path / "cprofile").is_dir() and "cprofile" in stages["LogisticRegressionModel.train"]
+    assert "cprofile" not in stages["DataManager._impute_age"]
+
+    profiler.save(str(tmp_path / "trace.json"))
+    trace = json.loads((tmp_path / "trace.json").read_text())
+    assert trace["summary"]["DataManager.load_data"]["calls"] == 1
+
+
+def test_profiled_records_nothing_when_off_and_marks_errors():
+    class Job:
+        @profiled()
+        def run(self, fail: bool) -> str:
+            if fail:
+                raise ValueError("failed")
+            return "done"
+
+    assert Job().run(False) == "done"
+    with Profiler() as profiler:
+        try:
+            Job().run(True)
+        except ValueError:
+            pass
+    assert [(record["stage"], record["error"]) for record in profiler.records] == [("Job.run", "ValueError")]
@@ -0,0 +1,59 @@
+import os
+
+import pytest
+from src import resources
+from src.models.model_factory import ModelFactory
+from src.resources import (
+    N_JOBS_ENV,
+    available_cores,
+    configure,
+    get_n_jobs,
+    resolve_n_jobs,
+    split_n_jobs,
+    worker_limits,
+)
+from threadpoolctl import threadpool_info, threadpool_limits
+
+
+@pytest.fixture(autouse=True)
+def unconfigured(monkeypatch):
+    monkeypatch.setattr(resources, "_n_jobs", None)
+    monkeypatch.delenv(N_JOBS_ENV, raising=False)
+    for name in resources.THREAD_ENV_VARS:
+        monkeypatch.delenv(name, raising=False)
+
+
+def test_budget_comes_from_the_environment(monkeypatch):
+    assert get_n_jobs() == available_cores()
+    monkeypatch.setenv(N_JOBS_ENV, "3")
+    assert get_n_jobs() == 3
+    monkeypatch.setenv(N_JOBS_ENV, "all")
+    with pytest.raises(ValueError, match=N_JOBS_ENV):
+        get_n_jobs()
+
+
+def test_pools_split_the_budget(monkeypatch):
+    monkeypatch.setattr(resources, "_n_jobs", 8)
+    assert resolve_n_jobs() == resolve_n_jobs(-1) == 8
+    assert resolve_n_jobs(-2) == 7 and resolve_n_jobs(32) == 8
+    assert split_n_jobs(None, 5) == (5, 1)
+    assert split_n_jobs(2, 10) == (2, 4)
+    assert split_n_jobs(None, 1) == (1, 8)
+
+
+def test_factory_passes_the_budget_to_estimators(monkeypatch):
+    monkeypatch.setattr(resources, "_n_jobs", 3)
+    assert ModelFactory.create_model("random_forest").model.n_jobs == 3
+    assert ModelFactory.create_model("random_forest", n_jobs=1).model.n_jobs == 1
+    with worker_limits(1):
+        assert ModelFactory.create_model("random_forest").model.n_jobs == 1
+    assert get_n_jobs() == 3
+
+
+def test_configure_caps_native_thread_pools(monkeypatch):
+    monkeypatch.setenv("OMP_NUM_THREADS", "64")
+    # Entering with no limit records the current limits, which are restored on exit
+    with threadpool_limits(limits=None):
+        assert configure(1) == 1
+        assert all(pool["num_threads"] == 1 for pool in threadpool_info())
+        assert all(os.environ[name] == "1" for name in resources.THREAD_ENV_VARS)
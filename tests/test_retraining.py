@@ -0,0 +1,116 @@
+import copy
+
+import numpy as np
+import pandas as pd
+import pytest
+from src.data_manager import DataManager
+from src.model_artifact import ModelArtifact
+from src.models.model_factory import ModelFactory
+from src.retraining import (
+    _rescale_thresholds,
+    _scaler,
+    _update_preprocessor,
+    data_state,
+    detect_appended_rows,
+    update_artifact,
+)
+
+
+def _train_on_first_rows(path, model_name, rows=700):
+    raw = pd.read_csv("./data/train.csv")
+    raw.iloc[:rows].to_csv(path, index=False)
+    dm = DataManager(str(path))
+    dm.load_data()
+    dm.preprocess()
+    model = ModelFactory.create_model(model_name)
+    model.train(dm.get_processed_data(), dm.get_target())
+    metadata = {"training_file": str(path), "training_data": data_state(str(path), rows)}
+    return raw, ModelArtifact(model_name, model, dm.preprocessor, metadata)
+
+
+def _append(path, rows):
+    with open(path, "a") as file:
+        rows.to_csv(file, header=False, index=False)
+
+
+def test_update_adds_trees_for_appended_rows(tmp_path):
+    path = tmp_path / "train.csv"
+    raw, artifact = _train_on_first_rows(path, "random_forest")
+    assert update_artifact(artifact, str(path))[1]["status"] == "unchanged"
+
+    _append(path, raw.iloc[700:])
+    updated, summary = update_artifact(artifact, str(path))
+
+    assert summary == {
+        "status": "appended",
+        "reason": summary["reason"],
+        "appended_rows": 191,
+        "rows": 891,
+        "quarantined": None,
+    }
+    assert len(updated.model.model.estimators_) > len(artifact.model.model.estimators_) == 100
+    assert updated.metadata["training_data"] == data_state(str(path), 891)
+    assert updated.preprocessor.age_counts.sum() == raw["Age"].notna().sum()
+    assert update_artifact(updated, str(path))[1]["status"] == "unchanged"
+    assert (updated.predict(raw.copy()) == raw["Survived"]).mean() > 0.85
+
+
+def test_logistic_regression_update_matches_full_refit(tmp_path):
+    path = tmp_path / "train.csv"
+    raw, artifact = _train_on_first_rows(path, "logistic_regression")
+    _append(path, raw.iloc[700:])
+    updated, _ = update_artifact(artifact, str(path))
+
+    full = DataManager(str(path))
+    full.load_data()
+    full.preprocess()
+    model = ModelFactory.create_model("logistic_regression")
+    model.train(full.get_processed_data(), full.get_target())
+    assert (updated.predict(raw.copy()) == model.predict(full.get_processed_data())).mean() > 0.99
+
+
+def test_rescaled_trees_split_the_same_rows(tmp_path):
+    path = tmp_path / "train.csv"
+    raw, artifact = _train_on_first_rows(path, "gradient_boosting")
+    preprocessor, X_new, _, _ = _update_preprocessor(artifact.preprocessor, raw.iloc[700:])
+    model = copy.deepcopy(artifact.model)
+    old, new = _scaler(artifact.preprocessor), _scaler(preprocessor)
+    _rescale_thresholds(
+        [tree.tree_ for tree in model.model.estimators_.ravel()], old.mean_, old.scale_, new.mean_, new.scale_
+    )
+
+    # Rows with a known age are imputed identically before and after the update
+    known = raw[raw["Age"].notna()]
+    updated = ModelArtifact("gradient_boosting", model, preprocessor)
+    np.testing.assert_array_equal(updated.predict(known.copy()), artifact.predict(known.copy()))
+
+
+def test_changed_rows_or_columns_require_a_rebuild(tmp_path):
+    path = tmp_path / "train.csv"
+    raw, artifact = _train_on_first_rows(path, "random_forest")
+    state = artifact.metadata["training_data"]
+
+    raw.iloc[:700].assign(Fare=raw["Fare"] + 1).to_csv(path, index=False)
+    assert detect_appended_rows(str(path), state)[0] == "rebuild"
+    raw.iloc[:700].rename(columns={"Fare": "Price"}).to_csv(path, index=False)
+    assert detect_appended_rows(str(path), state)[0] == "rebuild"
+    raw.iloc[:600].to_csv(path, index=False)
+    updated, summary = update_artifact(artifact, str(path))
+    assert updated is None and summary["status"] == "rebuild"
+
+
+def test_appended_rows_are_validated_like_a_full_load(tmp_path):
+    path = tmp_path / "train.csv"
+    raw, artifact = _train_on_first_rows(path, "gender_baseline")
+    appended = raw.iloc[700:].astype(object)
+    appended.iloc[0, appended.columns.get_loc("Pclass")] = None
+    appended.iloc[1, appended.columns.get_loc("SibSp")] = 300
+    _append(path, appended)
+
+    with pytest.raises(ValueError, match="SibSp"):
+        update_artifact(artifact, str(path), validation="raise")
+
+    updated, summary = update_artifact(artifact, str(path), validation="quarantine")
+    assert summary["status"] == "appended" and summary["rows"] == 891 and summary["appended_rows"] == 191
+    assert summary["quarantined"]["SibSp"].tolist() == [raw["SibSp"][700], 300]
+    assert updated.metadata["training_data"] == data_state(str(path), 891)
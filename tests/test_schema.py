@@ -0,0 +1,95 @@
+import numpy as np
+import pandas as pd
+import pytest
+from src.data_manager import DataManager
+from src.schema import PassengerRecord, SchemaValidator, compile_schema
+
+
+def _corrupt(raw):
+    raw = raw.copy()
+    raw.loc[1, "Sex"] = "m"
+    raw.loc[2, "Age"] = -1
+    raw.loc[3, "Pclass"] = 4
+    raw.loc[4, "Name"] = np.nan
+    raw.loc[5, "Embarked"] = "X"
+    return raw
+
+
+def test_compiled_rules_follow_the_record_model():
+    rules = {rule.name: rule for rule in compile_schema(PassengerRecord)}
+
+    assert list(rules) == list(PassengerRecord.model_fields)
+    assert rules["Pclass"].allowed == (1, 2, 3) and not rules["Pclass"].nullable
+    assert rules["Age"].kind is float and rules["Age"].nullable and rules["Age"].bounds == {"ge": 0, "le": 120}
+    assert rules["Embarked"].allowed == ("C", "Q", "S") and rules["Embarked"].nullable
+    assert not rules["Survived"].required and rules["Name"].required
+
+
+@pytest.mark.parametrize("filepath", ["./data/train.csv", "./data/test.csv"])
+def test_bundled_data_is_valid(filepath):
+    dm = DataManager(filepath)
+    dm.load_data()
+    assert dm.validation_report.is_valid
+    assert dm.validation_report.rows == len(dm.data)
+
+
+def test_violations_are_reported_per_column_and_check():
+    report = SchemaValidator().validate(_corrupt(pd.read_csv("./data/train.csv")).drop(columns=["Parch"]))
+
+    assert report.missing_columns == ["Parch"]
+    assert report.violations == {
+        "Pclass": {"not_allowed": {"count": 1, "examples": [3]}},
+        "Name": {"missing": {"count": 1, "examples": [4]}},
+        "Sex": {"not_allowed": {"count": 1, "examples": [1]}},
+        "Age": {"out_of_range": {"count": 1, "examples": [2]}},
+        "Embarked": {"not_allowed": {"count": 1, "examples": [5]}},
+    }
+    assert report.invalid_rows == 5
+    assert "Sex          not_allowed" in report.format()
+
+
+def test_text_in_a_numeric_column_is_a_type_violation():
+    raw = pd.read_csv("./data/train.csv").astype({"Fare": object, "SibSp": float})
+    raw.loc[7, "Fare"] = "abc"
+    raw.loc[8, "SibSp"] = 1.5
+
+    report = SchemaValidator().validate(raw)
+    assert report.violations == {
+        "SibSp": {"type": {"count": 1, "examples": [8]}},
+        "Fare": {"type": {"count": 1, "examples": [7]}},
+    }
+
+
+def test_quarantine_and_raise_modes(tmp_path):
+    path = tmp_path / "train.csv"
+    _corrupt(pd.read_csv("./data/train.csv")).to_csv(path, index=False)
+
+    dm = DataManager(str(path), validation="quarantine")
+    dm.load_data()
+    assert len(dm.data) == 886 and dm.quarantined["PassengerId"].tolist() == [2, 3, 4, 5, 6]
+    dm.preprocess()
+    assert dm.get_processed_data().shape[0] == 886
+
+    with pytest.raises(ValueError, match="5 of 891 rows violate"):
+        DataManager(str(path), validation="raise").load_data()
+    with pytest.raises(ValueError, match="Unknown validation mode"):
+        DataManager(str(path), validation="drop")
+
+
+def test_missing_and_overflowing_integers_are_quarantined(tmp_path):
+    raw = pd.read_csv("./data/train.csv")
+    raw.loc[1, "Pclass"] = np.nan
+    raw.loc[2, "SibSp"] = 300
+    raw.loc[3, "Survived"] = 258
+    path = tmp_path / "train.csv"
+    raw.to_csv(path, index=False)
+
+    dm = DataManager(str(path), validation="quarantine")
+    dm.load_data()
+    assert dm.validation_report.violations == {
+        "Survived": {"not_allowed": {"count": 1, "examples": [3]}},
+        "Pclass": {"missing": {"count": 1, "examples": [1]}},
+        "SibSp": {"out_of_range": {"count": 1, "examples": [2]}},
+    }
+    assert dm.quarantined["SibSp"].tolist() == [1, 300, 1] and dm.quarantined["Survived"].tolist() == [1, 1, 258]
+    assert dm.data["Pclass"].dtype == np.int8 and dm.data["SibSp"].dtype == np.int8 and len(dm.data) == 888
@@ -0,0 +1,55 @@
+import asyncio
+import json
+
+import pandas as pd
+import pytest
+from src.data_manager import DataManager
+from src.model_artifact import ModelArtifact
+from src.models.model_factory import ModelFactory
+from src.server import PredictionServer
+
+
+@pytest.fixture(scope="module")
+def artifact():
+    dm = DataManager("./data/train.csv")
+    dm.load_data()
+    dm.preprocess()
+    model = ModelFactory.create_model("logistic_regression")
+    model.train(dm.get_processed_data(), dm.get_target())
+    return ModelArtifact("logistic_regression", model, dm.preprocessor)
+
+
+async def _post(port, payload):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    body = json.dumps(payload).encode()
+    writer.write(f"POST /predict HTTP/1.1\r\nContent-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode() + body)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, body = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), json.loads(body)
+
+
+def test_server_batches_concurrent_requests(artifact):
+    test_data = pd.read_csv("./data/test.csv").head(40)
+    records = test_data.astype(object).where(test_data.notna(), None).to_dict("records")
+
+    async def scenario():
+        server = PredictionServer(artifact, port=0, max_batch_size=16, max_wait=0.05)
+        await server.start()
+        try:
+            responses = await asyncio.gather(*(_post(server.port, record) for record in records))
+            bad_request = await _post(server.port, "not a passenger")
+        finally:
+            await server.stop()
+        return responses, bad_request, server.stats.snapshot()
+
+    responses, bad_request, metrics = asyncio.run(scenario())
+
+    expected = artifact.predict(test_data.copy())
+    assert [status for status, _ in responses] == [200] * len(records)
+    assert [body["Survived"] for _, body in responses] == expected.tolist()
+    assert bad_request[0] == 400
+    assert metrics["requests"] == len(records) + 1
+    assert metrics["batches"] < len(records)
+    assert metrics["latency_p99_ms"] >= metrics["latency_p50_ms"] > 0
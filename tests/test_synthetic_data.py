@@ -0,0 +1,37 @@
+import pandas as pd
+from benchmarks.run_benchmarks import find_regressions
+from benchmarks.synthetic_data import SyntheticTitanicGenerator
+from src.data_manager import TITLE_PATTERN
+
+
+def test_generator_preserves_schema_and_distributions():
+    source = pd.read_csv("./data/train.csv")
+    data = SyntheticTitanicGenerator(seed=1).generate(20_000)
+
+    assert list(data.columns) == list(source.columns)
+    assert (data.dtypes == source.dtypes).all()
+    assert data["PassengerId"].tolist() == list(range(1, 20_001))
+    assert abs(data["Survived"].mean() - source["Survived"].mean()) < 0.02
+    assert abs(data["Age"].isna().mean() - source["Age"].isna().mean()) < 0.02
+    titles = data["Name"].str.extract(TITLE_PATTERN)[0].value_counts(normalize=True)
+    source_titles = source["Name"].str.extract(TITLE_PATTERN)[0].value_counts(normalize=True)
+    assert abs(titles["Mr."] - source_titles["Mr."]) < 0.02
+
+
+def test_write_csv_streams_chunks(tmp_path):
+    path = tmp_path / "synthetic.csv"
+    SyntheticTitanicGenerator(seed=1).write_csv(str(path), rows=1_000, chunk_size=300, with_target=False)
+    data = pd.read_csv(path)
+
+    assert len(data) == 1_000
+    assert "Survived" not in data.columns
+    assert data["PassengerId"].is_unique
+
+
+def test_find_regressions_respects_tolerance():
+    baseline = [{"scale": 1, "stage": "preprocess", "seconds": 1.0}, {"scale": 1, "stage": "load_data", "seconds": 1.0}]
+    results = [{"scale": 1, "stage": "preprocess", "seconds": 1.1}, {"scale": 1, "stage": "load_data", "seconds": 1.5}]
+
+    regressions = find_regressions(results, baseline, tolerance=0.2)
+
+    assert [(result["stage"], previous) for result, previous in regressions] == [("load_data", 1.0)]
@@ -0,0 +1,38 @@
+import pytest
+from src.data_manager import DataManager
+from src.models.logistic_regression_model import LogisticRegressionModel
+from src.models.model_factory import ModelFactory
+from src.tuning import save_config, tune
+
+
+@pytest.fixture(scope="module")
+def processed():
+    dm = DataManager("./data/train.csv")
+    dm.load_data()
+    dm.preprocess()
+    return dm.get_processed_data(), dm.get_target()
+
+
+def test_tune_writes_config_usable_by_model_factory(processed, tmp_path):
+    X, y = processed
+    config = tune(X, y, "logistic_regression", n_candidates=6, n_jobs=2)
+    path = str(tmp_path / "best.json")
+    save_config(config, path)
+
+    model = ModelFactory.create_model_from_config(path)
+    assert isinstance(model, LogisticRegressionModel)
+    assert model.model.C == config["params"]["C"]
+
+
+def test_tune_rejects_tree_budget_for_linear_model(processed):
+    X, y = processed
+    with pytest.raises(ValueError):
+        tune(X, y, "logistic_regression", resource="n_estimators")
+
+
+def test_tune_starts_with_one_tree_for_large_factors(processed):
+    X, y = processed
+    config = tune(X, y, "random_forest", resource="n_estimators", n_candidates=4, factor=10, cv=2, n_jobs=1)
+    assert config["resource"] == "n_estimators" and config["params"]["n_estimators"] >= 1
+    with pytest.raises(ValueError, match="at least 2"):
+        tune(X, y, "random_forest", factor=1)